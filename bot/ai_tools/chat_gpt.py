@@ -1,11 +1,34 @@
 import os
-from openai import OpenAI
+import asyncio
+import random
+import time
+from typing import AsyncIterator
+from openai import OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+from ai_tools.llm_usage import track_llm_call
+from ai_tools.json_stream_parser import JsonArrayStreamParser
 from utils.logger import logger
 from utils.read_write import read_text_file, write_json_file
+from utils.concurrency_groups import get_concurrency_group
 import re
 import json
 from config import Config
 
+# Errors worth retrying - anything else (auth, bad request, context length) fails the same way again
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt - the server's Retry-After, or exponential backoff with jitter"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("Retry-After", 1.0)):
+        try:
+            return min(float(headers[header]) * scale, Config.LLM_USAGE.RETRY_MAX_SECONDS)
+        except (KeyError, TypeError, ValueError):
+            continue
+    backoff = min(Config.LLM_USAGE.RETRY_BASE_SECONDS * 2 ** attempt, Config.LLM_USAGE.RETRY_MAX_SECONDS)
+    return backoff * random.uniform(0.5, 1.0)
+
 class AIInterpreter:
     def __init__(self):
         self.openai_api_key = Config.TOKENS.OPENAI_API_KEY
@@ -13,6 +36,12 @@ class AIInterpreter:
             logger.error("OpenAI API key not found in environment variables")
         
     def _clean_json_response(self, raw_response: str) -> str:
+        # Fast path: the model followed the instructions and returned bare JSON
+        try:
+            return json.loads(raw_response)
+        except json.JSONDecodeError:
+            pass
+
         # Try to find JSON inside ```json ... ``` or ``` ... ```
         code_fence_match = re.search(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", raw_response, re.DOTALL)
         if code_fence_match:
@@ -36,27 +65,130 @@ class AIInterpreter:
 
         return parsed
                 
-    def get_interpretation(self, prompt: str) -> str:
-        """Get interpretation from ChatGPT for a batch of messages"""
+    def get_interpretation(self, prompt: str, caller: str = "unknown") -> str:
+        """Get interpretation from ChatGPT for a batch of messages
+
+        Args:
+            prompt: Prompt to send
+            caller: Call site name used for usage accounting
+        """
 
+        # Retries are done here (not inside the client) so they can be counted
         client = OpenAI(
             api_key=self.openai_api_key,
+            max_retries=0,
         )
 
-        response = client.responses.create(
-            model="gpt-4o",
-            instructions="You are a helpful assistant.",
-            max_output_tokens=10000,
-            input=prompt,
-            temperature=0.1,  # Low temperature for consistent, factual output
-        )
+        model = "gpt-4o"
+        with track_llm_call(caller, model) as record:
+            for attempt in range(Config.LLM_USAGE.MAX_RETRIES + 1):
+                try:
+                    response = client.responses.create(
+                        model=model,
+                        instructions="You are a helpful assistant.",
+                        max_output_tokens=10000,
+                        input=prompt,
+                        temperature=0.1,  # Low temperature for consistent, factual output
+                    )
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if attempt == Config.LLM_USAGE.MAX_RETRIES:
+                        raise
+                    record.retries += 1
+                    delay = _retry_delay(e, attempt)
+                    logger.warning(f"⚠️ OpenAI call for {caller} failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {e}")
+                    time.sleep(delay)
+
+            if response.usage:
+                record.set_usage(response.usage.input_tokens, response.usage.output_tokens, response.model)
         return response.output_text
     
 
-    def get_json_response(self, prompt: str) -> str:
+    def get_json_response(self, prompt: str, caller: str = "unknown") -> str:
         """Get JSON response from ChatGPT"""
-        response = self.get_interpretation(prompt)
+        response = self.get_interpretation(prompt, caller=caller)
         return self._clean_json_response(response)
+
+    async def aget_interpretation(self, prompt: str, caller: str = "unknown") -> str:
+        """get_interpretation in a worker thread, holding a slot of the openai concurrency group"""
+        async with get_concurrency_group("openai").slot():
+            return await asyncio.to_thread(self.get_interpretation, prompt, caller)
+
+    async def aget_json_response(self, prompt: str, caller: str = "unknown") -> str:
+        """get_json_response in a worker thread, holding a slot of the openai concurrency group"""
+        async with get_concurrency_group("openai").slot():
+            return await asyncio.to_thread(self.get_json_response, prompt, caller)
+
+    async def stream_json_items(self, prompt: str, caller: str = "unknown") -> AsyncIterator:
+        """
+        Stream a JSON array response from ChatGPT, yielding each element as soon as it is complete
+
+        Args:
+            prompt: Prompt that asks for a JSON array
+            caller: Call site name used for usage accounting
+
+        Yields:
+            Each parsed element of the array
+
+        Raises:
+            RuntimeError: The response failed or was cut off (e.g. by max_output_tokens)
+            ValueError: The response has no complete JSON array
+        """
+        client = AsyncOpenAI(
+            api_key=self.openai_api_key,
+            max_retries=0,
+        )
+
+        model = "gpt-4o"
+        parser = JsonArrayStreamParser()
+        # The slot is held until the stream ends, so concurrent reports queue instead of all hitting OpenAI
+        async with get_concurrency_group("openai").slot():
+            with track_llm_call(caller, model) as record:
+                # Retry only while opening the stream - once items were yielded a retry would duplicate them
+                for attempt in range(Config.LLM_USAGE.MAX_RETRIES + 1):
+                    try:
+                        stream = await client.responses.create(
+                            model=model,
+                            instructions="You are a helpful assistant.",
+                            max_output_tokens=10000,
+                            input=prompt,
+                            temperature=0.1,  # Low temperature for consistent, factual output
+                            stream=True,
+                        )
+                        break
+                    except RETRYABLE_ERRORS as e:
+                        if attempt == Config.LLM_USAGE.MAX_RETRIES:
+                            raise
+                        record.retries += 1
+                        delay = _retry_delay(e, attempt)
+                        logger.warning(f"⚠️ OpenAI stream for {caller} failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {e}")
+                        await asyncio.sleep(delay)
+
+                status = None  # Set by the terminal event
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        for item in parser.feed(event.delta):
+                            yield item
+                    elif event.type in ("response.completed", "response.incomplete", "response.failed"):
+                        status = event.response.status
+                        usage = event.response.usage
+                        if usage:
+                            record.set_usage(usage.input_tokens, usage.output_tokens, event.response.model)
+                        if status == "incomplete":
+                            details = event.response.incomplete_details
+                            status += f" ({details.reason})" if details else ""
+                        elif status == "failed" and event.response.error:
+                            status += f" ({event.response.error.message})"
+                    elif event.type == "error":
+                        raise RuntimeError(f"OpenAI stream for {caller} failed: {event.message}")
+
+                # Callers take a normally ended stream as the full array, so a cut-off one must raise
+                if status != "completed":
+                    raise RuntimeError(f"OpenAI stream for {caller} ended as {status or 'unknown'}")
+                if not parser.started:
+                    raise ValueError(f"No JSON array found in streamed response for {caller}")
+                if not parser.finished:
+                    raise ValueError(f"Unterminated JSON array in streamed response for {caller}")
     
 
 
@@ -0,0 +1,91 @@
+"""
+JSON Stream Parser - Incrementally parse a JSON array from a token stream
+"""
+
+import json
+from utils.logger import logger
+
+
+class JsonArrayStreamParser:
+    """
+    Parse the elements of a top-level JSON array while it is still being generated.
+
+    Text before the opening `[` (e.g. a ```json code fence) is ignored, and every
+    element is yielded as soon as its closing `,` or `]` arrives. Each character is
+    scanned once, so the total cost is linear in the response length.
+
+    Usage:
+        parser = JsonArrayStreamParser()
+        for chunk in stream:
+            for item in parser.feed(chunk):
+                ...
+    """
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.current = []  # Characters of the element being built
+        self.items_count = 0
+
+    def feed(self, chunk: str) -> list:
+        """
+        Feed the next chunk of text
+
+        Args:
+            chunk: Text delta from the stream
+
+        Returns:
+            list: Elements completed by this chunk (may be empty)
+        """
+        items = []
+        for char in chunk:
+            if self.finished:
+                break
+
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                self.current.append(char)
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                continue
+
+            if char == '"':
+                self.in_string = True
+            elif char in "[{":
+                self.depth += 1
+            elif char in "]}":
+                self.depth -= 1
+                if self.depth == 0:
+                    # End of the top-level array
+                    self._flush(items)
+                    self.finished = True
+                    continue
+            elif char == "," and self.depth == 1:
+                self._flush(items)
+                continue
+
+            self.current.append(char)
+        return items
+
+    def _flush(self, items: list):
+        text = "".join(self.current).strip()
+        self.current = []
+        if not text:
+            return
+        try:
+            items.append(json.loads(text))
+            self.items_count += 1
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Skipping invalid JSON item #{self.items_count + 1}: {e}")
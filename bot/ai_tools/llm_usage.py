@@ -0,0 +1,232 @@
+"""
+LLM Usage - Token, latency and cost accounting for every LLM and embedding call
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import pytz
+from config import Config
+from utils.logger import logger
+from utils.stats import percentile
+from utils.concurrency_groups import get_concurrency_group
+
+_tables_ready = False
+
+
+class LlmCallRecord:
+    """Mutable record filled in by the call site while the call is being tracked"""
+    def __init__(self, caller: str, model: str, kind: str):
+        self.caller = caller
+        self.model = model
+        self.kind = kind  # 'chat' or 'embedding'
+        self.prompt_tokens = None
+        self.completion_tokens = None
+        self.retries = 0
+        self.success = True
+        self.error_message = None
+
+    def set_usage(self, prompt_tokens: int = None, completion_tokens: int = None, model: str = None):
+        """Set token usage (and the resolved model name) from the API response"""
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        if model:
+            self.model = model
+
+
+def estimate_cost(model: str, prompt_tokens: int = None, completion_tokens: int = None):
+    """Estimate the USD cost of a call, matching dated model names (e.g. gpt-4o-2024-08-06) by prefix"""
+    prices = Config.LLM_USAGE.MODEL_PRICES
+    matches = [name for name in prices if model and model.startswith(name)]
+    if not matches or prompt_tokens is None:
+        return None
+    prompt_price, completion_price = prices[max(matches, key=len)]
+    return (prompt_tokens * prompt_price + (completion_tokens or 0) * completion_price) / 1_000_000
+
+
+def estimate_tokens(texts: list, model: str):
+    """Count tokens for embedding inputs (the embeddings API doesn't report usage through LangChain)"""
+    try:
+        import tiktoken
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return sum(len(encoding.encode(text)) for text in texts)
+    except ImportError:
+        # Rough fallback of ~4 characters per token
+        return sum(len(text) for text in texts) // 4
+
+
+def _ensure_tables():
+    global _tables_ready
+    if not _tables_ready:
+        from db.init_db import init_db
+        _tables_ready = init_db()
+
+
+def record_llm_call(record: LlmCallRecord, latency_ms: float):
+    """Store a finished call in the llm_call_logs table"""
+    try:
+        from db.engine import get_db_sync
+        from db.models.llm_usage import LlmCallLog
+
+        _ensure_tables()
+        db = get_db_sync()
+        try:
+            db.add(LlmCallLog(
+                caller=record.caller,
+                model=record.model,
+                kind=record.kind,
+                prompt_tokens=record.prompt_tokens,
+                completion_tokens=record.completion_tokens,
+                latency_ms=latency_ms,
+                retries=record.retries,
+                success=record.success,
+                error_message=record.error_message,
+                cost_usd=estimate_cost(record.model, record.prompt_tokens, record.completion_tokens),
+            ))
+            db.commit()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"❌ Error recording LLM call for {record.caller}: {e}")
+
+
+@contextmanager
+def track_llm_call(caller: str, model: str, kind: str = "chat"):
+    """
+    Measure and record an LLM or embedding call
+
+    Usage:
+        with track_llm_call("news_report", "gpt-4o") as record:
+            response = client.responses.create(...)
+            record.set_usage(response.usage.input_tokens, response.usage.output_tokens, response.model)
+
+    Args:
+        caller: Call site name used for per-caller roll-ups
+        model: Requested model name
+        kind: 'chat' or 'embedding'
+    """
+    record = LlmCallRecord(caller, model, kind)
+    start_time = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record.success = False
+        record.error_message = str(e)
+        raise
+    finally:
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"🤖 {kind} call {caller} ({record.model}) took {latency_ms:.0f}ms")
+        record_llm_call(record, latency_ms)
+
+
+def get_daily_rollup(day: str = None, timezone: str = Config.TIMEZONES.APP_TIMEZONE) -> list[dict]:
+    """
+    Roll up the calls of one day per caller
+
+    Args:
+        day: Date in format yyyy-mm-dd (default: today in the given timezone)
+        timezone: Timezone that defines the day boundaries
+
+    Returns:
+        list: One dict per caller, sorted by total latency (the callers that dominate first)
+    """
+    tz = pytz.timezone(timezone)
+    if day is None:
+        day = datetime.now(tz).strftime("%Y-%m-%d")
+    day_start = tz.localize(datetime.strptime(day, "%Y-%m-%d"))
+    # Stored timestamps are naive UTC (SQLite CURRENT_TIMESTAMP)
+    start_utc = day_start.astimezone(pytz.utc).replace(tzinfo=None)
+    end_utc = (day_start + timedelta(days=1)).astimezone(pytz.utc).replace(tzinfo=None)
+
+    try:
+        from db.engine import get_db_sync
+        from db.models.llm_usage import LlmCallLog
+
+        _ensure_tables()
+        db = get_db_sync()
+        try:
+            rows = db.query(LlmCallLog).filter(
+                LlmCallLog.created_at >= start_utc,
+                LlmCallLog.created_at < end_utc
+            ).all()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"❌ Error loading LLM usage for {day}: {e}")
+        return []
+
+    by_caller = {}
+    for row in rows:
+        by_caller.setdefault(row.caller, []).append(row)
+
+    rollup = []
+    for caller, calls in by_caller.items():
+        latencies = [call.latency_ms for call in calls]
+        rollup.append({
+            "caller": caller,
+            "models": sorted({call.model for call in calls}),
+            "calls": len(calls),
+            "failures": sum(1 for call in calls if not call.success),
+            "retries": sum(call.retries or 0 for call in calls),
+            "prompt_tokens": sum(call.prompt_tokens or 0 for call in calls),
+            "completion_tokens": sum(call.completion_tokens or 0 for call in calls),
+            "cost_usd": sum(call.cost_usd or 0 for call in calls),
+            "total_latency_ms": sum(latencies),
+            "p50_latency_ms": percentile(latencies, 50),
+            "p95_latency_ms": percentile(latencies, 95),
+        })
+    return sorted(rollup, key=lambda item: item["total_latency_ms"], reverse=True)
+
+
+def format_daily_digest(day: str = None) -> str:
+    """Format the daily roll-up as a Discord message"""
+    rollup = get_daily_rollup(day)
+    if not rollup:
+        return "🤖 **LLM usage:** no calls recorded"
+
+    total_cost = sum(item["cost_usd"] for item in rollup)
+    total_calls = sum(item["calls"] for item in rollup)
+    text = f"🤖 **LLM usage:** {total_calls} calls, ${total_cost:.4f}\n"
+    for item in rollup:
+        text += (
+            f"  • `{item['caller']}` ({', '.join(item['models'])}) - {item['calls']} calls, "
+            f"{item['prompt_tokens']}/{item['completion_tokens']} tokens, ${item['cost_usd']:.4f}, "
+            f"p50 {item['p50_latency_ms'] / 1000:.1f}s, p95 {item['p95_latency_ms'] / 1000:.1f}s, "
+            f"total {item['total_latency_ms'] / 1000:.1f}s"
+        )
+        if item["failures"] or item["retries"]:
+            text += f" ({item['failures']} failed, {item['retries']} retries)"
+        text += "\n"
+    return text
+
+
+def tracked_embed_documents(embeddings, texts: list, caller: str) -> list:
+    """
+    Call embed_documents on a LangChain embeddings client and record the call
+
+    Args:
+        embeddings: OpenAIEmbeddings instance
+        texts: Texts to embed
+        caller: Call site name used for per-caller roll-ups
+
+    Returns:
+        list: One embedding per text
+    """
+    model = getattr(embeddings, "model", "unknown")
+    with track_llm_call(caller, model, kind="embedding") as record:
+        record.retries = None  # LangChain retries inside the client
+        record.set_usage(estimate_tokens(texts, model), 0)
+        return embeddings.embed_documents(texts)
+
+
+async def atracked_embed_documents(embeddings, texts: list, caller: str) -> list:
+    """Async version of tracked_embed_documents (aembed_documents), holding a slot of the openai concurrency group"""
+    model = getattr(embeddings, "model", "unknown")
+    async with get_concurrency_group("openai").slot():
+        with track_llm_call(caller, model, kind="embedding") as record:
+            record.retries = None  # LangChain retries inside the client
+            record.set_usage(estimate_tokens(texts, model), 0)
+            return await embeddings.aembed_documents(texts)
@@ -1,7 +1,7 @@
 from ai_tools.chat_gpt import AIInterpreter
 
 
-def get_hebrew_description(symbol: str, raw_description: str):
+async def get_hebrew_description(symbol: str, raw_description: str):
     ai_interpreter = AIInterpreter()
     prompt = f"""
     You are a financial analyst and journalist.
@@ -13,5 +13,5 @@ def get_hebrew_description(symbol: str, raw_description: str):
     *use real new line to break the text into paragraphs*
     """ + f"\nsybmol name {symbol}" + f"\nraw description: {raw_description}"
 
-    response = ai_interpreter.get_interpretation(prompt)
+    response = await ai_interpreter.aget_interpretation(prompt, caller="company_description")
     return response
@@ -20,11 +20,11 @@ async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24
         }
     """
     
-    def _ai_news_processing(messages: str) -> list[dict]:
+    async def _ai_news_processing(messages: str) -> list[dict]:
         try:
             ai_interpreter = AIInterpreter()
-            news_summary_prompt = read_text_file("ai_tools/prompts/news_summary_hebrew.txt") + "\n".join(messages) + read_text_file("ai_tools/prompts/correct_meanings.txt")
-            response = ai_interpreter.get_json_response(news_summary_prompt)
+            news_summary_prompt = _build_news_summary_prompt(messages)
+            response = await ai_interpreter.aget_json_response(news_summary_prompt, caller="news_report")
             # response = [
             #     {
             #         "time": "morning",
@@ -38,28 +38,50 @@ async def process_news_to_list(discord_bot: discord.Client, hours_back: int = 24
             return []
         
     try:
-        message_handler = get_message_handler(discord_bot)
-        messages_list, _ = await message_handler.read_channel_messages(news_channel_id, hours_back, list_of_users)
-        
-        if not messages_list:
-            logger.warning("No messages found to process")
+        messages_text = await _read_news_messages(discord_bot, hours_back, news_channel_id, list_of_users)
+        if not messages_text:
             return []
         
-        # Convert messages to text format for AI processing
-        messages_text = []
-        for msg in messages_list:
-            messages_text.append(f"[{msg['timestamp']}] {msg['author']}: {msg['content']}")
-        
-        news_list = _ai_news_processing(messages_text)
+        news_list = await _ai_news_processing(messages_text)
         return news_list
     except Exception as e:
         logger.error(f"❌ Error processing messages with AI: {e}")
         return []
-    
 
-       
 
+async def stream_news_items(discord_bot: discord.Client, hours_back: int = 24, news_channel_id: int = Config.CHANNEL_IDS.TWEETER_NEWS, list_of_users: list = [Config.USER_IDS.IFITT_BOT]):
+    """
+    Same as process_news_to_list, but yields each news item as soon as the model finishes writing it.
+    Errors are raised rather than ending the stream early, so callers never take a cut-off stream for the full list.
+    """
+    try:
+        messages_text = await _read_news_messages(discord_bot, hours_back, news_channel_id, list_of_users)
+        if not messages_text:
+            return
+
+        ai_interpreter = AIInterpreter()
+        news_summary_prompt = _build_news_summary_prompt(messages_text)
+        async for news_item in ai_interpreter.stream_json_items(news_summary_prompt, caller="news_report"):
+            yield news_item
+    except Exception as e:
+        logger.error(f"❌ Error streaming messages with AI: {e}")
+        raise
 
 
+def _build_news_summary_prompt(messages: list) -> str:
+    return read_text_file("ai_tools/prompts/news_summary_hebrew.txt") + "\n".join(messages) + read_text_file("ai_tools/prompts/correct_meanings.txt")
 
 
+async def _read_news_messages(discord_bot: discord.Client, hours_back: int, news_channel_id: int, list_of_users: list) -> list:
+    """Read the news channel and convert messages to text format for AI processing"""
+    message_handler = get_message_handler(discord_bot)
+    messages_list, _ = await message_handler.read_channel_messages(news_channel_id, hours_back, list_of_users)
+    
+    if not messages_list:
+        logger.warning("No messages found to process")
+        return []
+    
+    messages_text = []
+    for msg in messages_list:
+        messages_text.append(f"[{msg['timestamp']}] {msg['author']}: {msg['content']}")
+    return messages_text
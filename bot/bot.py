@@ -6,7 +6,11 @@ from config import Config, ENABLE_PROXY, REMOTE_SERVER
 import asyncio
 from scheduler_v2 import TasksScheduler
 from scheduler_v2.scheduler_manager import is_scheduler_running, clear_scheduler
-from discord_utils import send_embed_message
+from discord_utils import send_embed_message, get_role_index
+from discord_utils.message_store import get_message_store
+from news_processor.live_news_ingestor import get_live_news_ingestor
+from scrapers.http_client import get_http_client
+from scrapers.symbol_index import get_symbol_index
 from bot_manager import set_bot
 
 
@@ -20,7 +24,16 @@ intents.message_content = True
 intents.members = True
 intents.messages = True
 intents.guilds = True  # Required for slash commands
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+
+class MarketBot(commands.Bot):
+    async def close(self):
+        # Release the pooled scraper connections while the loop is still running
+        await get_http_client().close()
+        await super().close()
+
+
+bot = MarketBot(command_prefix="!", intents=intents)
 
 # Set global bot instance
 set_bot(bot)
@@ -35,10 +48,33 @@ async def on_application_command_error(ctx, error):
 @bot.event
 async def on_disconnect():
     logger.warning("🔌 Bot disconnected")
+    get_message_store().mark_disconnected()
 
 @bot.event
 async def on_resumed():
     logger.warning("🔄 Bot resumed")
+    get_message_store().mark_resumed()
+
+# Local message mirror - listeners so command processing in the default on_message keeps working
+@bot.listen("on_message")
+async def store_message(message):
+    get_message_store().add_message(message)
+
+@bot.listen("on_message")
+async def ingest_live_news(message):
+    get_live_news_ingestor(bot).submit(message)
+
+@bot.listen("on_raw_message_edit")
+async def store_message_edit(payload):
+    get_message_store().edit_message(payload)
+
+@bot.listen("on_raw_message_delete")
+async def store_message_delete(payload):
+    get_message_store().delete_messages(payload.channel_id, [payload.message_id])
+
+@bot.listen("on_raw_bulk_message_delete")
+async def store_bulk_message_delete(payload):
+    get_message_store().delete_messages(payload.channel_id, payload.message_ids)
 
 # Add comprehensive monitoring
 @bot.event
@@ -65,6 +101,23 @@ async def on_guild_update(before, after):
     logger.info(f"📊 Bot role position: {after.me.top_role.position}")
     logger.info(f"📊 Commands still available: {[cmd.name for cmd in bot.application_commands]}")
 
+# Keep the role index in sync with the guilds
+@bot.listen("on_guild_role_create")
+async def index_role_create(role):
+    get_role_index().add_role(role)
+
+@bot.listen("on_guild_role_update")
+async def index_role_update(before, after):
+    get_role_index().update_role(before, after)
+
+@bot.listen("on_guild_role_delete")
+async def index_role_delete(role):
+    get_role_index().remove_role(role)
+
+@bot.listen("on_guild_remove")
+async def index_guild_remove(guild):
+    get_role_index().remove_guild(guild)
+
 @bot.event
 async def on_member_update(before, after):
     if after.id == bot.user.id:  # Bot itself was updated
@@ -87,6 +140,18 @@ async def on_ready():
     # Load command cogs
     await load_cogs()
     
+    # Open the shared scraper HTTP session (connections are pooled for the whole run)
+    await get_http_client().start()
+    
+    # Load the local symbol index (downloads the FMP list in the background when it is a day old)
+    get_symbol_index().refresh_if_stale()
+    
+    # Catch up the local message mirror (runs in the background, reads fall back to the API until done)
+    asyncio.create_task(get_message_store().backfill(bot))
+    
+    # Start real-time news scoring (no-op if already running)
+    asyncio.create_task(get_live_news_ingestor(bot).start())
+    
     # Sync slash commands to specific guilds for faster updates
     try:
         logger.info(f"📦 Loaded cogs: {[cog for cog in bot.cogs.keys()]}")
@@ -154,6 +219,7 @@ async def load_cogs():
         "cogs.slash.test_slash",
         "cogs.slash.stock_info",
         "cogs.slash.notification",
+        "cogs.slash.scheduler_stats",
         "cogs.text.delete_messages",
         "cogs.text.export",
     ]
@@ -1,7 +1,9 @@
+import asyncio
 import discord
 from discord.ext import commands
 from config import Config
 from discord_ui import NotificationView, RESPONSE_EMOJIS
+from discord_utils import get_role_index
 
 
 
@@ -50,10 +52,11 @@ class RoleManager(commands.Cog):
         # Get user's current notification roles
         member = ctx.guild.get_member(ctx.author.id)
         current_roles = []
+        role_index = get_role_index()
         
         if member:
             for role_obj in Config.NOTIFICATION_ROLES.ALL_ROLES:
-                discord_role = discord.utils.get(ctx.guild.roles, name=role_obj.full_name)
+                discord_role = role_index.get_notification_role(ctx.guild, role_obj)
                 if discord_role and discord_role in member.roles:
                     current_roles.append(role_obj)
         
@@ -108,52 +111,54 @@ class RoleManager(commands.Cog):
                 "Failed": ("error", [])
             }
             
-            # Get all notification roles that should exist
-            all_notification_roles = []
-            for role_obj in Config.NOTIFICATION_ROLES.ALL_ROLES:
-                discord_role = discord.utils.get(interaction.guild.roles, name=role_obj.full_name)
-                if not discord_role:
-                    try:
-                        discord_role = await interaction.guild.create_role(
-                            name=role_obj.full_name,
-                            color=role_obj.color,
-                            reason=f"Notification role for {role_obj.name}"
-                        )
-                    except Exception as e:
-                        results["Failed"][1].append(f"{role_obj.full_name}: {e}")
-                        continue
-                all_notification_roles.append((role_obj, discord_role))
+            # Get all notification roles that should exist, creating the missing ones concurrently
+            role_index = get_role_index()
+            existing_roles = {role_obj: role_index.get_notification_role(interaction.guild, role_obj) for role_obj in Config.NOTIFICATION_ROLES.ALL_ROLES}
+            missing_roles = [role_obj for role_obj, discord_role in existing_roles.items() if not discord_role]
+            created_roles = await asyncio.gather(*[
+                interaction.guild.create_role(
+                    name=role_obj.full_name,
+                    color=role_obj.color,
+                    reason=f"Notification role for {role_obj.name}"
+                )
+                for role_obj in missing_roles
+            ], return_exceptions=True)
+            for role_obj, created in zip(missing_roles, created_roles):
+                if isinstance(created, Exception):
+                    results["Failed"][1].append(f"{role_obj.full_name}: {created}")
+                    existing_roles.pop(role_obj)
+                else:
+                    role_index.add_role(created)
+                    existing_roles[role_obj] = created
             
-            # Process each notification role
-            for role_obj, discord_role in all_notification_roles:
+            # Compute the target role set
+            target_roles = {role for role in member.roles if not role.is_default()}
+            added, removed = [], []
+            for role_obj, discord_role in existing_roles.items():
                 role_name = role_obj.full_name
                 user_has_role = discord_role in member.roles
                 user_wants_role = role_obj.name in selected_role_name_list
                 
                 if user_wants_role and not user_has_role:
-                    # User wants the role but doesn't have it - add it
-                    try:
-                        await member.add_roles(discord_role, reason=f"User subscribed to {role_obj.name} notifications")
-                        results["Added"][1].append(role_name)
-                    except Exception as e:
-                        results["Failed"][1].append(f"{role_name}: {e}")
-                
+                    target_roles.add(discord_role)
+                    added.append(role_name)
                 elif user_wants_role and user_has_role:
-                    # User wants the role and already has it
                     results["Already had"][1].append(role_name)
-                
                 elif not user_wants_role and user_has_role:
-                    # User doesn't want the role but has it - remove it
-                    try:
-                        await member.remove_roles(discord_role, reason=f"User unsubscribed from {role_obj.name} notifications")
-                        results["Removed"][1].append(role_name)
-                    except Exception as e:
-                        results["Failed"][1].append(f"{role_name}: {e}")
-                
-                elif not user_wants_role and not user_has_role:
-                    # User doesn't want the role and doesn't have it
+                    target_roles.discard(discord_role)
+                    removed.append(role_name)
+                else:
                     results["Didn't have"][1].append(role_name)
             
+            # Apply all changes with a single request
+            if added or removed:
+                try:
+                    await member.edit(roles=list(target_roles), reason="User updated notification subscriptions")
+                    results["Added"][1].extend(added)
+                    results["Removed"][1].extend(removed)
+                except Exception as e:
+                    results["Failed"][1].extend(f"{role_name}: {e}" for role_name in added + removed)
+            
             response = self._edit_subscriptions_response_message(results)
             await interaction.followup.send(response, ephemeral=False)
             
@@ -189,8 +194,9 @@ class RoleManager(commands.Cog):
             color=0x00ff00
         )
         
+        role_index = get_role_index()
         for role_obj in Config.NOTIFICATION_ROLES.ALL_ROLES:
-            role = discord.utils.get(ctx.guild.roles, name=role_obj.full_name)
+            role = role_index.get_notification_role(ctx.guild, role_obj)
             status = f"{RESPONSE_EMOJIS['success']} {role_obj.full_name}" if role and role in member.roles else f"{RESPONSE_EMOJIS['error']} {role_obj.full_name}"
             embed.add_field(name="", value=status, inline=False)
         
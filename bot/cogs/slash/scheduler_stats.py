@@ -0,0 +1,30 @@
+import discord
+from discord.ext import commands
+from scheduler_v2.job_metrics import get_job_metrics
+from scheduler_v2.scheduler_manager import get_scheduler
+from utils.concurrency_groups import format_concurrency_stats
+
+
+class SchedulerCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    scheduler = discord.SlashCommandGroup("scheduler", "Scheduler status and job metrics")
+
+    @scheduler.command(name="stats", description="Show p50/p95 run time per scheduled job and concurrency group queues")
+    async def stats(self, ctx):
+        """Show the job metrics since startup"""
+        scheduler = get_scheduler()
+        status = "🟢 running" if scheduler is not None and scheduler.is_running() else "🔴 not running"
+        embed = discord.Embed(
+            title="🔧 Scheduler Stats (since startup)",
+            description=get_job_metrics().format_stats()[:4000],
+            color=0x0099ff
+        )
+        embed.add_field(name="🚦 Concurrency groups", value=format_concurrency_stats()[:1024], inline=False)
+        embed.set_footer(text=f"Scheduler {status}")
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot):
+    bot.add_cog(SchedulerCommands(bot))
@@ -1,7 +1,10 @@
+import asyncio
+import time
 import discord
 from discord.ext import commands
 from scrapers.yf.yf_scraper import YfScraper
-from discord_utils.interaction_utils import split_text_at_sentences
+from scrapers.symbol_index import get_symbol_index
+from discord_utils.text_layout import add_text_fields
 from utils.logger import logger
 import yfinance as yf
 from db.init_db import init_db
@@ -11,15 +14,41 @@ from config import Config
 from db.models import SymbolsList
 from ai_tools.process_company_description import get_hebrew_description
 
+SEARCH_MISS_TTL = 3600  # Seconds a ticker yfinance search didn't find is answered as missing without searching again
+
+async def symbol_autocomplete(ctx: discord.AutocompleteContext):
+    """Suggest symbols from the local symbol index"""
+    index = get_symbol_index()
+    index.refresh_if_stale()
+    return [
+        discord.OptionChoice(name=f"{symbol} - {name}"[:100] if name else symbol, value=symbol)
+        for symbol, name, _, _ in index.search(ctx.value or "")
+    ]
+
+
 class StockInfoCommandsV2(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.search_misses = {}  # ticker -> monotonic time yfinance search didn't find it
     
-    def is_ticker_exists(self, ticker_name):
-        """Check if a ticker exists using yfinance search"""
+    async def is_ticker_exists(self, ticker_name):
+        """
+        Check if a ticker exists in the local symbol index, falling back to yfinance search
+        for what the FMP stock list doesn't hold (indices, crypto, futures, FX) or when there is no index yet
+        """
+        if get_symbol_index().contains(ticker_name):
+            return True
+        missed_at = self.search_misses.get(ticker_name)
+        if missed_at is not None and time.monotonic() - missed_at < SEARCH_MISS_TTL:
+            return False
         try:
-            ticker = yf.Search(ticker_name, max_results=3, enable_fuzzy_query=True)
-            return any(quote["symbol"] == ticker_name for quote in ticker.all["quotes"])
+            ticker = await asyncio.to_thread(yf.Search, ticker_name, max_results=3, enable_fuzzy_query=True)
+            if any(quote["symbol"] == ticker_name for quote in ticker.all["quotes"]):
+                return True
+            now = time.monotonic()
+            self.search_misses = {name: at for name, at in self.search_misses.items() if now - at < SEARCH_MISS_TTL}
+            self.search_misses[ticker_name] = now
+            return False
         except Exception as e:
             logger.error(f"Error checking ticker existence: {e}")
             return False
@@ -44,16 +73,15 @@ class StockInfoCommandsV2(commands.Cog):
             if value and value not in ["N/A", "None"]:
                 embed.add_field(name=name, value=str(value)[:1024], inline=True)
         
-        # Add Hebrew description if available
+        # Add Hebrew description if available, overflowing into continuation embeds
+        continuation_embeds = []
         if hebrew_desc:
-            chunks = split_text_at_sentences(hebrew_desc, 1024)
-            if chunks:
-                embed.add_field(name="📝 תיאור החברה", value=chunks[0], inline=False)
+            continuation_embeds = add_text_fields(embed, "📝 תיאור החברה", hebrew_desc)
         
-        return embed, chunks[1:] if hebrew_desc and len(chunks) > 1 else []
+        return embed, continuation_embeds
     
     @discord.slash_command(name="stock_info", description="Get stock information using Yahoo Finance API")
-    async def stock_info(self, ctx, symbol: str = discord.Option(str, "Stock symbol to check", required=True)):
+    async def stock_info(self, ctx, symbol: str = discord.Option(str, "Stock symbol to check", required=True, autocomplete=symbol_autocomplete)):
         """Get stock information using Yahoo Finance API"""
         db = None
         try:
@@ -73,7 +101,7 @@ class StockInfoCommandsV2(commands.Cog):
             
             # Check yfinance only if not in database
             if not hebrew_desc:
-                if not self.is_ticker_exists(symbol.upper()):
+                if not await self.is_ticker_exists(symbol.upper()):
                     await progress_msg.edit(content=f"❌ Symbol **{symbol.upper()}** not found")
                     return
             
@@ -97,7 +125,7 @@ class StockInfoCommandsV2(commands.Cog):
                     await progress_msg.edit(content="🔄 Processing Hebrew description...")
                     
                     try:
-                        hebrew_desc = get_hebrew_description(symbol.upper(), business_summary)
+                        hebrew_desc = await get_hebrew_description(symbol.upper(), business_summary)
                         
                         # Save to database
                         if symbol_data:
@@ -110,21 +138,16 @@ class StockInfoCommandsV2(commands.Cog):
                         hebrew_desc = None
             
             # Replace progress message with final embed
-            main_embed, remaining_chunks = self.create_embed(symbol, parsed_data, hebrew_desc)
+            main_embed, continuation_embeds = self.create_embed(symbol, parsed_data, hebrew_desc)
             await progress_msg.edit(content=None, embed=main_embed)
             
-            # Send remaining chunks
-            for i, chunk in enumerate(remaining_chunks, 2):
+            # Send the rest of the description
+            for i, desc_embed in enumerate(continuation_embeds, 2):
                 try:
-                    desc_embed = discord.Embed(
-                        color=0x0099ff
-                    )
-                    desc_embed.add_field(name="📝 תיאור החברה", value=chunk, inline=False)
                     desc_embed.set_footer(text=f"תיאור החברה (חלק {i})")
                     await ctx.channel.send(embed=desc_embed)
                 except Exception as e:
                     logger.error(f"Error sending additional embed {i}: {e}")
-                    await ctx.channel.send(f"📊 {symbol.upper()} תיאור החברה (חלק {i}):\n{chunk}")
             
         except Exception as e:
             logger.error(f"Error getting stock info: {e}")
@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 from utils.logger import logger
 from discord_utils.message_handler import get_message_handler
+from discord_utils.channel_exporter import ChannelExporter, EXPORT_FORMATS, COMPRESSIONS
 
 class ExportCommands(commands.Cog):
     def __init__(self, bot):
@@ -16,6 +17,10 @@ class ExportCommands(commands.Cog):
                !export <#channel_id> @user1 24
                !export @user1 24
                !export 24
+               !export #channel-name 2160 --format=jsonl --compress=zstd --upload
+               !export #channel-name --resume
+        Options (streaming export, any of them switches from the text file export):
+               --format=jsonl|csv, --compress=gzip|zstd|none, --upload, --resume
         Args:
             args: Space-separated arguments (channel, users, hours in any order)
         """
@@ -27,6 +32,7 @@ class ExportCommands(commands.Cog):
         channel = None
         user_list = []
         hours = 24
+        options = {}
         
         if args:
             parts = args.split()
@@ -55,6 +61,19 @@ class ExportCommands(commands.Cog):
                         await ctx.send(f"❌ Could not find user: {part}")
                         return
                 
+                # Check if it's a streaming export option
+                elif part.startswith('--'):
+                    name, _, value = part[2:].partition('=')
+                    if name == "format" and value in EXPORT_FORMATS:
+                        options["format"] = value
+                    elif name == "compress" and value in COMPRESSIONS:
+                        options["compress"] = value
+                    elif name in ("upload", "resume") and not value:
+                        options[name] = True
+                    else:
+                        await ctx.send(f"❌ Invalid option: {part}. Use --format={'|'.join(EXPORT_FORMATS)}, --compress={'|'.join(COMPRESSIONS)}, --upload or --resume.")
+                        return
+                
                 # Check if it's a number (hours)
                 elif part.isdigit():
                     hours = int(part)
@@ -68,6 +87,10 @@ class ExportCommands(commands.Cog):
         if channel is None:
             channel = ctx.channel
         
+        if options:
+            await self._stream_export(ctx, channel, user_list, hours, options)
+            return
+        
         user_names = [user.name for user in user_list] if user_list else ["all users"]
         await ctx.send(f"Exporting messages from #{channel.name} for the last {hours} hours (filtering by: {', '.join(user_names)})...")
         
@@ -89,5 +112,54 @@ class ExportCommands(commands.Cog):
             logger.error(f"Error in export command: {e}")
             await ctx.send(f"❌ Error exporting messages: {str(e)}")
 
+    async def _stream_export(self, ctx, channel, user_list: list, hours: int, options: dict):
+        """Stream the export to a compressed file, report progress and optionally upload it"""
+        exporter = ChannelExporter()
+        resume_state = None
+        if options.get("resume"):
+            resume_state = exporter.find_checkpoint(channel.id)
+            if not resume_state:
+                await ctx.send(f"❌ No unfinished export found for #{channel.name}")
+                return
+        
+        if resume_state:
+            status = await ctx.send(f"Resuming export of #{channel.name} after {resume_state['message_count']} messages...")
+        else:
+            user_names = [user.name for user in user_list] if user_list else ["all users"]
+            status = await ctx.send(f"Exporting messages from #{channel.name} for the last {hours} hours (filtering by: {', '.join(user_names)})...")
+        
+        async def report_progress(message_count, last_timestamp):
+            try:
+                await status.edit(content=f"⏳ Exporting #{channel.name}: {message_count} messages so far (up to {last_timestamp} UTC)")
+            except Exception as e:
+                logger.warning(f"Could not update export progress: {e}")
+        
+        try:
+            result = await exporter.export(
+                channel,
+                hours_back=hours,
+                user_ids=[user.id for user in user_list] if user_list else None,
+                export_format=options.get("format", "jsonl"),
+                compression=options.get("compress", "gzip"),
+                resume_state=resume_state,
+                progress_callback=report_progress
+            )
+        except Exception as e:
+            logger.error(f"Error in export command: {e}")
+            await ctx.send(f"❌ Error exporting messages: {str(e)}")
+            return
+        
+        size_mb = result.size_bytes / (1024 * 1024)
+        if not result.completed:
+            await ctx.send(f"⚠️ Export of #{channel.name} stopped after {result.message_count} messages ({size_mb:.1f} MB). Run `!export #{channel.name} --resume` to continue.")
+            return
+        
+        await status.edit(content=f"✅ Exported {result.message_count} messages from #{channel.name} ({size_mb:.1f} MB) to: `{result.filepath}`")
+        if options.get("upload"):
+            if ctx.guild and result.size_bytes > ctx.guild.filesize_limit:
+                await ctx.send(f"❌ File is too large to upload ({size_mb:.1f} MB, limit {ctx.guild.filesize_limit / (1024 * 1024):.0f} MB)")
+            else:
+                await ctx.send(file=discord.File(result.filepath))
+
 def setup(bot):
     bot.add_cog(ExportCommands(bot)) 
\ No newline at end of file
@@ -18,6 +18,149 @@ class NewsProcessorConfig:
     TOP_N_CLUSTERS = 10
 
 
+class LlmUsageConfig:
+    """Configuration for LLM and embedding call accounting."""
+    MAX_RETRIES = 2  # Retries for AIInterpreter calls (the OpenAI client itself doesn't retry)
+    RETRY_BASE_SECONDS = 1.0  # Backoff before the first retry, doubled for each next one (plus jitter)
+    RETRY_MAX_SECONDS = 30.0  # Cap of the backoff and of a server Retry-After
+    # USD price per 1M tokens: (prompt, completion)
+    MODEL_PRICES = {
+        "gpt-4o": (2.50, 10.00),
+        "gpt-4o-mini": (0.15, 0.60),
+        "text-embedding-3-small": (0.02, 0.0),
+        "text-embedding-3-large": (0.13, 0.0),
+    }
+
+
+class MessageStoreConfig:
+    """Configuration for the local mirror of Discord channel history."""
+    MIRRORED_CHANNELS = [ChannelIds.TWEETER_NEWS]
+    INITIAL_BACKFILL_HOURS = 48  # How far back to backfill a channel that has nothing stored yet
+    BACKFILL_COMMIT_EVERY = 200  # Messages per commit while backfilling
+
+
+class LiveNewsConfig:
+    """Configuration for real-time ingestion of news messages."""
+    ENABLED = os.getenv("LIVE_NEWS_ENABLED", "false") == "true"  # Opt in, like HTTP_FALLBACK_DIRECT
+    SOURCE_CHANNEL = ChannelIds.TWEETER_NEWS
+    SOURCE_USERS = [UserIds.IFITT_BOT]
+    ALERT_CHANNEL = ChannelIds.MARKET_NEWS
+    MAX_QUEUE_SIZE = 500  # Oldest items are dropped when the queue is full
+    BATCH_SIZE = 16  # Flush embeddings once this many items are waiting
+    FLUSH_INTERVAL_MS = 300  # ...or once the first waiting item is this old
+    LATENCY_BUDGET_MS = 3000  # From message received to alert sent
+    IMPACT_THRESHOLD = 0.45  # ImpactClassifier score (0-1) needed for a live alert
+
+
+class HttpClientConfig:
+    """Configuration for the shared scraper HTTP session."""
+    LIMIT = 100  # Open connections in total
+    LIMIT_PER_HOST = 10  # Open connections per target host
+    DNS_CACHE_TTL = 300  # Seconds to cache DNS lookups
+    KEEPALIVE_TIMEOUT = 60  # Seconds to keep an idle connection open
+    TOTAL_TIMEOUT = 30  # Default seconds per request
+    CONNECT_TIMEOUT = 10
+    LATENCY_SAMPLES = 500  # Recent latencies kept per host for p50/p95
+    # Circuit breakers (per host, separately for proxied and direct requests)
+    BREAKER_FAILURES = 5  # Consecutive failures (errors or 5xx) that open the circuit
+    BREAKER_OPEN_SECONDS = 30  # Time before a probe request is let through
+    FALLBACK_DIRECT = os.getenv("HTTP_FALLBACK_DIRECT", "false") == "true"  # Go direct while the proxied circuit is open
+    # Hedging: a duplicate request is sent when the first is slower than the endpoint p95
+    HEDGE_ENABLED = True
+    HEDGE_METHODS = ["GET"]  # Callers can pass hedge=True for other idempotent requests
+    HEDGE_MIN_SAMPLES = 20  # Latencies needed before an endpoint is hedged
+    HEDGE_MIN_DELAY_MS = 50
+    HEDGE_MAX_DELAY_MS = 5000
+    HEDGE_MAX_RATIO = 0.1  # Share of an endpoint's requests that may be hedged
+    MAX_ENDPOINTS = 200  # Endpoints tracked for tail latency, the rest count as host/*
+    # Record/replay: "live", "record" (save responses as fixtures) or "replay" (serve fixtures, no network)
+    MODE = os.getenv("HTTP_MODE", "live")
+    FIXTURES_DIR = os.getenv("HTTP_FIXTURES_DIR", "data/http_fixtures")
+    REDACTED_PARAMS = ["apikey", "api_key", "token", "crumb"]  # Query params left out of fixtures
+    REPLAY_LATENCY_MS = float(os.getenv("HTTP_REPLAY_LATENCY_MS")) if os.getenv("HTTP_REPLAY_LATENCY_MS") else None  # None replays the recorded latency
+    REPLAY_LATENCY_SCALE = 1.0  # Multiplier of the recorded latency
+    REPLAY_JITTER_MS = 0  # Random extra latency per replayed response
+
+class QuoteCacheConfig:
+    """Configuration for the Yahoo quote cache."""
+    QUOTE_TTL = 15  # Seconds a quote is served from cache
+    SUMMARY_DEFAULT_TTL = 60  # Seconds for quoteSummary modules not listed below
+    SUMMARY_MODULE_TTLS = {
+        "assetProfile": 6 * 3600,
+        "secFilings": 6 * 3600,
+        "financialsTemplate": 6 * 3600,
+        "calendarEvents": 3600,
+        "pageViews": 3600,
+    }
+    BATCH_WINDOW_MS = 20  # Concurrent get_quote calls within this window share one request
+    MAX_BATCH_SYMBOLS = 50  # Symbols per quote request
+    MAX_ENTRIES = 5000
+
+class CalendarCacheConfig:
+    """Configuration for the Investing calendar table cache."""
+    MAX_ENTRIES = 500  # Least recently used requests are dropped beyond this
+
+class ChartStoreConfig:
+    """Configuration for the local store of Yahoo chart bars."""
+    DATA_DIR = os.path.join("data", "yf", "charts")
+
+class EconomicReleasesConfig:
+    """Configuration for the shared economic release watcher."""
+    MIN_POLL_INTERVAL = 0.5  # Seconds between polls right after a release or a new actual
+    MAX_POLL_INTERVAL = 5.0  # Poll interval cap while nothing changes
+    POLL_BACKOFF = 1.5  # Interval multiplier per tick without changes
+    MAX_WAIT_SECONDS = 30  # After the release time, post whatever is there and stop waiting
+    PRE_ARM_SECONDS = 5  # Start the update job this early to warm the connection (0 = start after post_event_delay)
+    FAST_POLL_SECONDS = 10  # Keep the minimum poll interval for this long after the release time
+
+class CnbcCrawlerConfig:
+    """Configuration for the incremental CNBC article crawler."""
+    REGION = "world"
+    NEWS_MODULES = ["latestNews", "riverPlus", "featuredNewsHero"]
+    WORKERS = 4  # Articles fetched concurrently
+    HOST_REQUESTS = 2  # Requests per host...
+    HOST_PERIOD = 1.0  # ...per this many seconds
+    MAX_ARTICLES_PER_RUN = 100  # New assets beyond this wait for the next run
+    COMPRESSION_LEVEL = 6  # zlib level of stored article bodies
+
+class CompanyProfilesConfig:
+    """Configuration for the CNN company profile fetcher."""
+    REQUESTS = 20  # Requests per PERIOD
+    PERIOD = 1.0
+    CONCURRENCY = 10  # Profiles fetched at once
+    MAX_AGE_HOURS = 7 * 24  # Stored profiles newer than this are not fetched again
+    MAX_ATTEMPTS = 3  # Per symbol, 429 responses pause the bucket and retry
+
+class SymbolIndexConfig:
+    """Configuration for the local symbol index (autocomplete and ticker validation)."""
+    DATA_PATH = os.path.join("data", "symbols", "fmp_symbols.json.gz")
+    REFRESH_HOURS = 24  # Download the FMP list again after this long
+    REFRESH_RETRY_MINUTES = 30  # Wait after a failed download before trying again
+    MAX_RESULTS = 25  # Discord shows at most 25 autocomplete choices
+    PREFIX_SCAN = 200  # Prefix matches ranked per query
+    FUZZY_MAX_LENGTH = 6  # One-edit fuzzy matching only for ticker-length queries
+
+class JobMetricsConfig:
+    """Configuration for the scheduler job metrics and alerts."""
+    SAMPLES = 200  # Recent durations and lateness values kept per job
+    SLO_DURATION_SECONDS = 300  # Default run time budget, add_*_job(slo_seconds=...) overrides it per job
+    SLO_LATENESS_SECONDS = 30  # Start delay that counts as an SLO breach
+    ALERT_COOLDOWN_SECONDS = 600  # Per job, repeated alerts within this window only go to the summary
+    SUMMARY_INTERVAL_MINUTES = 360  # Aggregated summary to the dev channel (skipped when nothing ran)
+
+class JobStoreConfig:
+    """Configuration for the persistent scheduler job store."""
+    PERSISTENT = os.getenv("SCHEDULER_PERSISTENT_JOBS", "true") == "true"  # Keep jobs in the bot DB across restarts
+    TABLE_NAME = "scheduler_jobs"
+
+class ConcurrencyGroupsConfig:
+    """Configuration for the named concurrency groups of shared resources."""
+    LIMITS = {
+        "investing": 2,  # Calendar fetches (daily task, release watcher, market schedule)
+        "openai": 2,  # Model calls of reports and news processing
+        "discord-send": 5,  # Channel sends across all channels
+    }
+    DEFAULT_LIMIT = 4
 
 
 class Proxy():
@@ -54,4 +197,18 @@ class Config:
     NOTIFICATION_ROLES = NotificationRoles
     SCHEDULE = Schedule
     COLORS = Colors
-    NEWS_PROCESSOR = NewsProcessorConfig
\ No newline at end of file
+    NEWS_PROCESSOR = NewsProcessorConfig
+    LLM_USAGE = LlmUsageConfig
+    MESSAGE_STORE = MessageStoreConfig
+    LIVE_NEWS = LiveNewsConfig
+    HTTP_CLIENT = HttpClientConfig
+    QUOTE_CACHE = QuoteCacheConfig
+    CALENDAR_CACHE = CalendarCacheConfig
+    CHART_STORE = ChartStoreConfig
+    ECONOMIC_RELEASES = EconomicReleasesConfig
+    CNBC_CRAWLER = CnbcCrawlerConfig
+    COMPANY_PROFILES = CompanyProfilesConfig
+    SYMBOL_INDEX = SymbolIndexConfig
+    JOB_METRICS = JobMetricsConfig
+    JOB_STORE = JobStoreConfig
+    CONCURRENCY_GROUPS = ConcurrencyGroupsConfig
@@ -16,4 +16,5 @@ class ScheduleItem():
 class Schedule():
     """Represents a schedule with all its properties"""
     DAILY_SETUP = ScheduleItem("daily_setup", 7, 58)
-    DAILY_ECONOMIC_CALENDAR = ScheduleItem("daily_economic_calendar", 8, 0)
\ No newline at end of file
+    DAILY_ECONOMIC_CALENDAR = ScheduleItem("daily_economic_calendar", 8, 0)
+    DAILY_DEV_DIGEST = ScheduleItem("daily_dev_digest", 23, 55)
\ No newline at end of file
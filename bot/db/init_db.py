@@ -17,9 +17,15 @@ def init_db() -> bool:
         from .models import SymbolsList  # noqa: F401
         from .models.news_models import NewsArticle, NewsCluster  # noqa: F401
         from .models.news_test import NewsTest, NewsProcessingLog  # noqa: F401
+        from .models.llm_usage import LlmCallLog  # noqa: F401
+        from .models.channel_messages import ChannelMessage, ChannelSyncState  # noqa: F401
+        from .models.economic_releases import EconomicReleaseLatency  # noqa: F401
+        from .models.cnbc_articles import CnbcArticle  # noqa: F401
+        from .models.scheduler_state import SchedulerState  # noqa: F401
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        add_missing_columns()
         
         logger.info("Database initialization completed successfully")
         return True
@@ -29,6 +35,24 @@ def init_db() -> bool:
         return False
 
 
+def add_missing_columns():
+    """Add nullable model columns that existing tables don't have yet (create_all only creates tables)."""
+    from sqlalchemy import inspect, text
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                logger.info(f"Added column {table.name}.{column.name}")
+
+
 def drop_db() -> bool:
     """Drop all tables from the database."""
     try:
@@ -37,6 +61,11 @@ def drop_db() -> bool:
         from .models import SymbolsList  # noqa: F401
         from .models.news_models import NewsArticle, NewsCluster  # noqa: F401
         from .models.news_test import NewsTest, NewsProcessingLog  # noqa: F401
+        from .models.llm_usage import LlmCallLog  # noqa: F401
+        from .models.channel_messages import ChannelMessage, ChannelSyncState  # noqa: F401
+        from .models.economic_releases import EconomicReleaseLatency  # noqa: F401
+        from .models.cnbc_articles import CnbcArticle  # noqa: F401
+        from .models.scheduler_state import SchedulerState  # noqa: F401
         Base.metadata.drop_all(bind=engine)
         
         logger.info("All database tables dropped successfully")
@@ -0,0 +1,34 @@
+"""
+Channel message models for the local mirror of Discord channel history.
+"""
+
+from sqlalchemy import Column, BigInteger, String, DateTime, Text, Index
+from sqlalchemy.sql import func
+
+from ..engine import Base
+
+
+class ChannelMessage(Base):
+    """Model for storing a single Discord message of a mirrored channel."""
+    __tablename__ = "channel_messages"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=False)  # Discord snowflake
+    channel_id = Column(BigInteger, nullable=False)
+    author_id = Column(BigInteger, nullable=False)
+    author_name = Column(String(100), nullable=False)  # Display name at the time of the message
+    content = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)  # Naive UTC
+    edited_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_channel_messages_channel_id_id", "channel_id", "id"),
+    )
+
+
+class ChannelSyncState(Base):
+    """Model for storing how far back a mirrored channel is complete."""
+    __tablename__ = "channel_sync_state"
+
+    channel_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    coverage_start = Column(DateTime, nullable=False)  # Naive UTC, messages after this are all stored
+    last_synced_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
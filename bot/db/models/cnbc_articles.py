@@ -0,0 +1,21 @@
+"""
+CNBC article model - the crawler's seen-set and compressed article store.
+"""
+
+from sqlalchemy import Column, BigInteger, String, DateTime, LargeBinary
+
+from ..engine import Base
+
+
+class CnbcArticle(Base):
+    """Model for storing one crawled CNBC asset (a row means the asset was seen)."""
+    __tablename__ = "cnbc_articles"
+
+    asset_id = Column(BigInteger, primary_key=True, autoincrement=False)  # CNBC asset id
+    module = Column(String(50), nullable=False)  # Page module the asset was found in
+    title = Column(String(500), nullable=False)
+    url = Column(String(500), nullable=False)
+    description = Column(String(1000), nullable=True)
+    date_published = Column(String(19), nullable=True)  # 'YYYY-MM-DD HH:MM:SS' in the app timezone
+    body = Column(LargeBinary, nullable=True)  # zlib-compressed article text, None for live blogs / videos
+    fetched_at = Column(DateTime, nullable=False, index=True)  # Naive UTC
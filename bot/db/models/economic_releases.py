@@ -0,0 +1,22 @@
+"""
+Economic release model for tracking release-to-Discord latency.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean
+from sqlalchemy.sql import func
+
+from ..engine import Base
+
+
+class EconomicReleaseLatency(Base):
+    """Model for storing how fast one economic event's actual reached Discord."""
+    __tablename__ = "economic_release_latencies"
+
+    id = Column(Integer, primary_key=True, index=True)
+    release_time = Column(String(5), nullable=False)  # Calendar time, e.g. '15:30'
+    description = Column(String(255), nullable=False)
+    actual = Column(String(50), nullable=True)  # None when posted without an actual (timeout or no previous)
+    detect_latency_ms = Column(Float, nullable=True)  # Release time to the poll that saw the actual
+    post_latency_ms = Column(Float, nullable=False)  # Release time to the Discord message sent
+    success = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
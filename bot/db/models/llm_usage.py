@@ -0,0 +1,26 @@
+"""
+LLM usage model for tracking every LLM and embedding call.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean
+from sqlalchemy.sql import func
+
+from ..engine import Base
+
+
+class LlmCallLog(Base):
+    """Model for storing a single LLM or embedding call."""
+    __tablename__ = "llm_call_logs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    caller = Column(String(100), nullable=False, index=True)  # Call site, e.g. 'news_report'
+    model = Column(String(100), nullable=False)
+    kind = Column(String(20), nullable=False)  # 'chat' or 'embedding'
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+    latency_ms = Column(Float, nullable=False)
+    retries = Column(Integer, nullable=True)  # None when the client retries internally
+    success = Column(Boolean, default=True)
+    error_message = Column(Text, nullable=True)
+    cost_usd = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -0,0 +1,16 @@
+"""
+Scheduler state model for daily steps that survive restarts.
+"""
+
+from sqlalchemy import Column, String, DateTime
+
+from ..engine import Base
+
+
+class SchedulerState(Base):
+    """Model for a scheduler marker, e.g. the date the daily gatekeeper last ran."""
+    __tablename__ = "scheduler_state"
+
+    key = Column(String(100), primary_key=True)
+    value = Column(String(255), nullable=True)
+    updated_at = Column(DateTime, nullable=True)  # Naive UTC
@@ -16,6 +16,10 @@ class SymbolsList(Base):
     symbol = Column(String(20), unique=True, index=True, nullable=False)
     english_description = Column(Text, nullable=True)
     hebrew_description = Column(Text, nullable=True)
+    market_cap = Column(Float, nullable=True)
+    pe_ratio = Column(Float, nullable=True)
+    website_url = Column(String(255), nullable=True)
+    profile_updated_at = Column(DateTime, nullable=True)  # Naive UTC, last company profile refresh
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
 
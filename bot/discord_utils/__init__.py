@@ -4,12 +4,15 @@ Discord Utilities Package
 
 from .message_utils import send_embed_message, send_mention_message, split_long_message
 from .send_file import send_file
-from .role_utils import get_role_mention
+from .role_utils import get_role_mention, get_role_index
+from .message_dispatcher import get_message_dispatcher
 
 __all__ = [
     'send_embed_message',
     'send_mention_message',
     'split_long_message',
     'send_file',
-    'get_role_mention'
+    'get_role_mention',
+    'get_role_index',
+    'get_message_dispatcher'
 ] 
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+Channel Exporter - Stream channel history to compressed JSONL/CSV files
+
+Messages are written to disk as the history pages arrive, so memory stays bounded
+no matter how long the export is. A checkpoint sidecar records the last written
+message id and the file offset at that point, which lets an interrupted export resume
+where it stopped without duplicating rows or breaking the archive.
+"""
+
+import csv
+import glob
+import gzip
+import io
+import json
+import os
+from datetime import datetime, timezone, timedelta
+import discord
+import pytz
+from utils.logger import logger
+from config import Config
+
+EXPORT_FORMATS = ["jsonl", "csv"]
+COMPRESSIONS = ["gzip", "zstd", "none"]
+CSV_COLUMNS = ["id", "timestamp", "author_id", "author", "content"]
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+
+class ExportResult:
+    """Summary of a finished (or interrupted) export"""
+    def __init__(self, filepath: str, message_count: int, completed: bool):
+        self.filepath = filepath
+        self.message_count = message_count
+        self.completed = completed
+
+    @property
+    def size_bytes(self) -> int:
+        return os.path.getsize(self.filepath) if os.path.exists(self.filepath) else 0
+
+
+class ExportOutput:
+    """
+    Text stream over an export file, written as a series of gzip members / zstd frames
+
+    Each checkpoint ends the current member (or frame) and records the file size, so the
+    file up to a checkpoint offset is always a complete archive. Resuming truncates the
+    file to that offset, dropping rows written after the checkpoint and any unterminated
+    member left by a crash, before writing on.
+    """
+    def __init__(self, filepath: str, compression: str, offset: int = None):
+        """
+        Args:
+            filepath: Export file
+            compression: 'gzip', 'zstd' or 'none'
+            offset: Checkpoint offset to resume from (default: None - start a new file)
+        """
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                raise ValueError("zstd compression requires the 'zstandard' package")
+            self._zstd = zstandard.ZstdCompressor()
+        self.compression = compression
+        if offset is None:
+            self.raw = open(filepath, "wb")
+        else:
+            self.raw = open(filepath, "r+b")
+            self.raw.truncate(offset)
+            self.raw.seek(offset)
+        self._start_segment()
+
+    def _start_segment(self):
+        if self.compression == "gzip":
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode="wb")
+        elif self.compression == "zstd":
+            self.stream = self._zstd.stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+        self.text = io.TextIOWrapper(self.stream, encoding="utf-8", newline="")
+
+    def _end_segment(self):
+        self.text.flush()
+        self.text.detach()
+        if self.stream is not self.raw:
+            self.stream.close()  # Writes the gzip trailer / ends the zstd frame, the file stays open
+        self.raw.flush()
+
+    def write(self, text: str) -> int:
+        return self.text.write(text)
+
+    def checkpoint(self) -> int:
+        """
+        End the current member/frame and start a new one
+
+        Returns:
+            int: File offset that a resume can truncate to
+        """
+        self._end_segment()
+        offset = self.raw.tell()
+        self._start_segment()
+        return offset
+
+    def close(self) -> int:
+        """
+        Finish the file
+
+        Returns:
+            int: Final file size
+        """
+        self._end_segment()
+        offset = self.raw.tell()
+        self.raw.close()
+        return offset
+
+
+class ChannelExporter:
+    def __init__(self, data_dir: str = os.path.join("data", "messages export"), checkpoint_every: int = 500):
+        """
+        Initialize ChannelExporter
+
+        Args:
+            data_dir: Directory for export files and checkpoints
+            checkpoint_every: Write the checkpoint (and flush) every N messages
+        """
+        self.data_dir = data_dir
+        self.checkpoint_every = checkpoint_every
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def _build_filepath(self, channel: discord.abc.GuildChannel, hours_back: int, user_ids: list, export_format: str, compression: str) -> str:
+        timestamp = int(datetime.now(pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)).timestamp() * 1000)
+        filename = f"{channel.name}_last_{hours_back}_hours"
+        if user_ids:
+            filename += f"_filtered_{len(user_ids)}users"
+        filename += f"_{timestamp}.{export_format}"
+        if compression == "gzip":
+            filename += ".gz"
+        elif compression == "zstd":
+            filename += ".zst"
+        return os.path.join(self.data_dir, filename)
+
+    def _write_checkpoint(self, filepath: str, state: dict):
+        tmp_path = filepath + CHECKPOINT_SUFFIX + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, filepath + CHECKPOINT_SUFFIX)
+
+    def find_checkpoint(self, channel_id: int):
+        """
+        Find the latest unfinished export of a channel
+
+        Returns:
+            dict: Checkpoint state, or None if there is nothing to resume
+        """
+        checkpoints = []
+        for path in glob.glob(os.path.join(glob.escape(self.data_dir), "*" + CHECKPOINT_SUFFIX)):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    state = json.load(f)
+                # Checkpoints without an offset can't be resumed without duplicating rows
+                if state.get("channel_id") == channel_id and state.get("offset") is not None:
+                    checkpoints.append((os.path.getmtime(path), state))
+            except Exception as e:
+                logger.warning(f"⚠️ Skipping unreadable checkpoint {path}: {e}")
+        return max(checkpoints, key=lambda item: item[0])[1] if checkpoints else None
+
+    async def export(self, channel: discord.abc.Messageable, hours_back: int = 24, user_ids: list = None,
+                     export_format: str = "jsonl", compression: str = "gzip", resume_state: dict = None,
+                     progress_callback=None, progress_every: int = 1000) -> ExportResult:
+        """
+        Stream a channel's history to a file
+
+        Args:
+            channel: Channel to export
+            hours_back: Number of hours to look back
+            user_ids: List of user IDs to filter by (default: None - all users)
+            export_format: 'jsonl' or 'csv'
+            compression: 'gzip', 'zstd' or 'none'
+            resume_state: Checkpoint from find_checkpoint - continue that export instead of starting a new one
+            progress_callback: async callable(message_count, last_timestamp) called every progress_every messages
+            progress_every: Messages between progress callbacks
+
+        Returns:
+            ExportResult: Path, count and whether the export finished
+        """
+        if resume_state:
+            filepath = resume_state["filepath"]
+            export_format = resume_state["export_format"]
+            compression = resume_state["compression"]
+            user_ids = resume_state["user_ids"]
+            hours_back = resume_state["hours_back"]
+            count = resume_state["message_count"]
+            after = discord.Object(id=resume_state["last_message_id"])
+            offset = resume_state["offset"]
+        else:
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError(f"Unknown export format: {export_format}")
+            if compression not in COMPRESSIONS:
+                raise ValueError(f"Unknown compression: {compression}")
+            filepath = self._build_filepath(channel, hours_back, user_ids, export_format, compression)
+            count = 0
+            after = datetime.now(timezone.utc) - timedelta(hours=hours_back)
+            offset = None
+
+        state = {
+            "channel_id": channel.id,
+            "filepath": filepath,
+            "export_format": export_format,
+            "compression": compression,
+            "user_ids": user_ids,
+            "hours_back": hours_back,
+            "message_count": count,
+            "last_message_id": resume_state["last_message_id"] if resume_state else None,
+            "offset": offset,  # File size at the checkpoint, everything before it is complete
+        }
+        user_filter = set(user_ids) if user_ids else None
+        completed = False
+
+        output = ExportOutput(filepath, compression, offset)
+        try:
+            writer = csv.writer(output) if export_format == "csv" else None
+            if writer and offset is None:
+                writer.writerow(CSV_COLUMNS)
+
+            # history() fetches pages of 100, each message is written and released right away
+            async for message in channel.history(limit=None, after=after, oldest_first=True):
+                if user_filter and message.author.id not in user_filter:
+                    state["last_message_id"] = message.id
+                    continue
+
+                row = {
+                    "id": message.id,
+                    "timestamp": message.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    "author_id": message.author.id,
+                    "author": message.author.display_name,
+                    "content": message.content,
+                }
+                if writer:
+                    writer.writerow([row[column] for column in CSV_COLUMNS])
+                else:
+                    output.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+                state["message_count"] = count
+                state["last_message_id"] = message.id
+
+                if count % self.checkpoint_every == 0:
+                    state["offset"] = output.checkpoint()
+                    self._write_checkpoint(filepath, state)
+                if progress_callback and count % progress_every == 0:
+                    await progress_callback(count, row["timestamp"])
+            completed = True
+        except Exception as e:
+            logger.error(f"❌ Export of {channel.id} interrupted after {count} messages: {e}")
+        finally:
+            state["offset"] = output.close()
+            if completed:
+                checkpoint_path = filepath + CHECKPOINT_SUFFIX
+                if os.path.exists(checkpoint_path):
+                    os.remove(checkpoint_path)
+            elif state["last_message_id"] is not None:
+                self._write_checkpoint(filepath, state)
+
+        logger.info(f"Exported {count} messages to {filepath}")
+        return ExportResult(filepath, count, completed)
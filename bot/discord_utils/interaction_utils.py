@@ -5,6 +5,7 @@ Interaction Utilities for Discord Slash Commands
 import discord
 import asyncio
 from utils.logger import logger
+from .text_layout import pack_text
 
 
 async def respond_with_progress(ctx, initial_message: str, ephemeral: bool = False):
@@ -42,46 +43,7 @@ def split_text_at_sentences(text: str, max_length: int = 1024) -> list:
     """
     if not text or len(text) <= max_length:
         return [text]
-    
-    chunks = []
-    remaining_text = text
-    
-    while len(remaining_text) > max_length:
-        # Find the last sentence ending (dot, exclamation, question mark) before max_length
-        last_sentence_end = -1
-        
-        # Look for sentence endings within the limit
-        for i in range(max_length - 1, -1, -1):
-            if remaining_text[i] in '.!?':
-                # Check if it's followed by whitespace or end of string
-                if i + 1 >= len(remaining_text) or remaining_text[i + 1].isspace():
-                    last_sentence_end = i + 1
-                    break
-        
-        # If no sentence ending found, look for newlines
-        if last_sentence_end == -1:
-            for i in range(max_length - 1, -1, -1):
-                if remaining_text[i] == '\n':
-                    last_sentence_end = i + 1
-                    break
-        
-        # If still no break point found, split at max_length
-        if last_sentence_end == -1:
-            last_sentence_end = max_length
-        
-        # Add the chunk
-        chunk = remaining_text[:last_sentence_end].strip()
-        if chunk:
-            chunks.append(chunk)
-        
-        # Update remaining text
-        remaining_text = remaining_text[last_sentence_end:].strip()
-    
-    # Add any remaining text
-    if remaining_text:
-        chunks.append(remaining_text)
-    
-    return [chunk for chunk in chunks if chunk.strip()]
+    return pack_text(text, max_length)
 
 
 def truncate_text(text: str, max_length: int = 1024) -> str:
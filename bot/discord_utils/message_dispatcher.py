@@ -0,0 +1,199 @@
+"""
+Message Dispatcher - Centralized outbound queue for Discord messages
+
+Every channel gets its own FIFO queue and worker, paced by a token bucket that
+matches Discord's per-channel message bucket. Queued sends to the same channel are
+packed into as few messages as possible (up to 10 embeds / 6000 characters each),
+and role mentions ride along as the message content instead of a separate message.
+"""
+
+import asyncio
+import discord
+from utils.logger import logger
+from utils.rate_limiter import TokenBucket
+from utils.concurrency_groups import get_concurrency_group
+from .text_layout import MAX_EMBEDS_PER_MESSAGE, MAX_EMBED_CHARS_PER_MESSAGE
+
+MAX_CONTENT_CHARS = 2000
+
+# Discord allows 5 messages per 5 seconds per channel
+CHANNEL_BUCKET_CAPACITY = 5
+CHANNEL_BUCKET_PERIOD = 5.0
+
+
+class OutgoingMessage:
+    """A queued send request - resolved when all its embeds were sent"""
+    def __init__(self, embeds: list, content: str = None, error_context: str = "send_message"):
+        self.embeds = embeds
+        self.content = content
+        self.error_context = error_context
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class MessageDispatcher:
+    def __init__(self, bot: discord.Client):
+        """
+        Initialize MessageDispatcher
+
+        Args:
+            bot: Discord bot instance
+        """
+        self.bot = bot
+        self.queues = {}  # channel_id -> asyncio.Queue of OutgoingMessage
+        self.workers = {}  # channel_id -> worker task
+        self.buckets = {}  # channel_id -> TokenBucket
+
+    async def send(self, channel_id: int, embeds: list = None, content: str = None, error_context: str = "send_message") -> bool:
+        """
+        Queue embeds and/or content for a channel and wait until they are sent
+
+        Args:
+            channel_id: Target channel ID
+            embeds: List of discord.Embed
+            content: Text content, e.g. a role mention
+            error_context: Context for error logging
+
+        Returns:
+            bool: True if everything was sent, False otherwise
+        """
+        if not embeds and not content:
+            return True
+        item = OutgoingMessage(list(embeds or []), content, error_context)
+        self._get_queue(channel_id).put_nowait(item)
+        return await item.future
+
+    def _get_queue(self, channel_id: int) -> asyncio.Queue:
+        worker = self.workers.get(channel_id)
+        if worker is None or worker.done():
+            self.queues.setdefault(channel_id, asyncio.Queue())
+            self.buckets.setdefault(channel_id, TokenBucket(CHANNEL_BUCKET_CAPACITY, CHANNEL_BUCKET_PERIOD))
+            self.workers[channel_id] = asyncio.create_task(self._worker(channel_id))
+        return self.queues[channel_id]
+
+    async def _worker(self, channel_id: int):
+        queue = self.queues[channel_id]
+        while True:
+            items = [await queue.get()]
+            # Take everything that queued up meanwhile so it can be packed together
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            await self._send_items(channel_id, items)
+
+    async def _send_items(self, channel_id: int, items: list):
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            for item in items:
+                logger.error(f"❌ Could not find channel with ID: {channel_id} in {item.error_context}")
+                self._resolve(item, False)
+            return
+
+        for content, embeds, owners, finished in pack_messages(items):
+            ok = await self._send_with_retry(channel, content, embeds, owners)
+            for item in owners:
+                if not ok:
+                    self._resolve(item, False)
+            for item in finished:
+                self._resolve(item, True)
+
+    async def _send_with_retry(self, channel, content: str, embeds: list, owners: list, attempts: int = 3) -> bool:
+        bucket = self.buckets[channel.id]
+        for attempt in range(attempts):
+            await bucket.acquire()
+            try:
+                async with get_concurrency_group("discord-send").slot():
+                    await channel.send(content=content, embeds=embeds or None)
+                return True
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt < attempts - 1:
+                    retry_after = _retry_after(e)
+                    logger.warning(f"⚠️ Rate limited on channel {channel.id}, pausing {retry_after:.1f}s")
+                    bucket.pause(retry_after)
+                    continue
+                logger.error(f"❌ Error sending message to channel {channel.id} in {owners[0].error_context}: {e}")
+                return False
+            except Exception as e:
+                logger.error(f"❌ Error sending message to channel {channel.id} in {owners[0].error_context}: {e}")
+                return False
+        return False
+
+    def _resolve(self, item: OutgoingMessage, result: bool):
+        if not item.future.done():
+            item.future.set_result(result)
+
+
+def _retry_after(error: discord.HTTPException) -> float:
+    """Read the bucket reset time from the 429 response headers"""
+    headers = getattr(error.response, "headers", None) or {}
+    for header in ("X-RateLimit-Reset-After", "Retry-After"):
+        try:
+            return float(headers[header])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return CHANNEL_BUCKET_PERIOD
+
+
+def pack_messages(items: list) -> list:
+    """
+    Pack queued items into as few Discord messages as possible, keeping their order
+
+    Args:
+        items: List of OutgoingMessage
+
+    Returns:
+        list: (content, embeds, owners, finished) per message - owners are the items
+              with parts in the message, finished are the items whose last part it holds
+    """
+    messages = []
+    content, embeds, chars, owners, finished = None, [], 0, [], []
+
+    def flush():
+        nonlocal content, embeds, chars, owners, finished
+        if content or embeds:
+            messages.append((content, embeds, owners, finished))
+        content, embeds, chars, owners, finished = None, [], 0, [], []
+
+    for item in items:
+        # Content goes with the item's first embed (mentions render above the embeds)
+        if item.content:
+            joined = f"{content}\n{item.content}" if content else item.content
+            if len(joined) > MAX_CONTENT_CHARS:
+                flush()
+                joined = item.content
+            content = joined
+            if item not in owners:
+                owners.append(item)
+
+        for embed in item.embeds:
+            embed_chars = len(embed)
+            if len(embeds) >= MAX_EMBEDS_PER_MESSAGE or (embeds and chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE):
+                flush()
+            embeds.append(embed)
+            chars += embed_chars
+            if item not in owners:
+                owners.append(item)
+
+        finished.append(item)
+        if item not in owners:
+            owners.append(item)
+    flush()
+    return messages
+
+
+# Global message dispatcher instance
+_message_dispatcher = None
+
+
+def get_message_dispatcher(bot: discord.Client):
+    """
+    Get or create the global message dispatcher instance
+
+    Args:
+        bot: Discord bot instance
+
+    Returns:
+        MessageDispatcher: Global message dispatcher instance
+    """
+    global _message_dispatcher
+    if _message_dispatcher is None:
+        _message_dispatcher = MessageDispatcher(bot)
+    return _message_dispatcher
@@ -3,6 +3,7 @@ from datetime import datetime, timezone, timedelta
 from utils import logger, write_json_file
 import pytz
 from config import Config
+from .message_store import get_message_store
 import os
 
 class MessageHandler:
@@ -79,6 +80,13 @@ class MessageHandler:
             # Calculate the time threshold
             threshold_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
             
+            # Mirrored channels are read from the local store
+            message_store = get_message_store()
+            if message_store.covers(channel_id, threshold_time):
+                messages_list = self._read_stored_messages(message_store, channel_id, threshold_time, user_ids)
+                logger.info(f"Read {len(messages_list)} messages from {channel.name} (local store)")
+                return messages_list, channel.name
+            
             # Read messages
             messages_list = []
             
@@ -106,6 +114,19 @@ class MessageHandler:
             logger.error(f"Error reading channel {channel_id}: {e}")
             return [], None
 
+    def _read_stored_messages(self, message_store, channel_id: int, threshold_time: datetime, user_ids: list = None) -> list:
+        """Read messages from the local message store in the same format as the API path"""
+        messages_list = []
+        for message in message_store.get_messages(channel_id, threshold_time, user_ids):
+            content = (message.content or "").replace('\n', ' ').strip()
+            if content:  # Only include messages with content
+                messages_list.append({
+                    'timestamp': message.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    'author': message.author_name,
+                    'content': content
+                })
+        return messages_list
+
     async def save_messages_to_file(self, messages_list: list, channel_name: str, hours_back: int, user_ids: list = None):
         """
         Save messages to a text file
@@ -0,0 +1,225 @@
+"""
+Message Store - Local SQLite mirror of Discord channel history
+
+Mirrored channels are written live from on_message (plus edits and deletes) and
+backfilled incrementally from the last stored snowflake on startup, so reports and
+exports can read them without paginating the history API.
+"""
+
+from datetime import datetime, timezone, timedelta
+import discord
+from sqlalchemy import func
+from utils.logger import logger
+from config import Config
+from db.engine import get_db_sync
+from db.init_db import init_db
+from db.models.channel_messages import ChannelMessage, ChannelSyncState
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    return dt.astimezone(timezone.utc).replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _to_aware_utc(dt: datetime) -> datetime:
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class MessageStore:
+    def __init__(self, channel_ids: list = None):
+        """
+        Initialize MessageStore
+
+        Args:
+            channel_ids: Channels to mirror (default: Config.MESSAGE_STORE.MIRRORED_CHANNELS)
+        """
+        self.channel_ids = set(channel_ids if channel_ids is not None else Config.MESSAGE_STORE.MIRRORED_CHANNELS)
+        self.synced_channels = set()  # Channels that are complete up to now
+        self.backfilled_channels = set()  # Channels whose backfill finished in this session
+        self.first_live_ids = {}  # First message received live per channel since the last connect
+        init_db()
+
+    def is_mirrored(self, channel_id: int) -> bool:
+        return channel_id in self.channel_ids
+
+    def covers(self, channel_id: int, since: datetime) -> bool:
+        """
+        Check if all messages of a channel since a given time are stored locally
+
+        Args:
+            channel_id: Discord channel ID
+            since: Start of the requested window (aware or naive UTC)
+        """
+        if channel_id not in self.synced_channels:
+            return False
+        db = get_db_sync()
+        try:
+            state = db.query(ChannelSyncState).filter(ChannelSyncState.channel_id == channel_id).first()
+            return state is not None and state.coverage_start <= _to_naive_utc(since)
+        finally:
+            db.close()
+
+    def mark_disconnected(self):
+        """Live events may be missed until the gateway resumes or the next backfill"""
+        self.synced_channels.clear()
+        self.first_live_ids.clear()
+
+    def mark_resumed(self):
+        """A resumed session replays missed events, so backfilled channels are complete again"""
+        self.synced_channels.update(self.backfilled_channels)
+
+    def _message_to_row(self, message: discord.Message) -> dict:
+        return {
+            "id": message.id,
+            "channel_id": message.channel.id,
+            "author_id": message.author.id,
+            "author_name": message.author.display_name,
+            "content": message.content,
+            "created_at": _to_naive_utc(message.created_at),
+            "edited_at": _to_naive_utc(message.edited_at) if message.edited_at else None,
+        }
+
+    def add_message(self, message: discord.Message):
+        """Store a new message if its channel is mirrored"""
+        if not self.is_mirrored(message.channel.id):
+            return
+        self.first_live_ids.setdefault(message.channel.id, message.id)
+        db = get_db_sync()
+        try:
+            db.merge(ChannelMessage(**self._message_to_row(message)))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Error storing message {message.id}: {e}")
+        finally:
+            db.close()
+
+    def edit_message(self, payload: discord.RawMessageUpdateEvent):
+        """Apply an edit (raw event, so it also works for messages outside the cache)"""
+        if not self.is_mirrored(payload.channel_id) or "content" not in payload.data:
+            return
+        db = get_db_sync()
+        try:
+            edited_at = payload.data.get("edited_timestamp")
+            db.query(ChannelMessage).filter(ChannelMessage.id == payload.message_id).update({
+                "content": payload.data["content"],
+                "edited_at": _to_naive_utc(datetime.fromisoformat(edited_at)) if edited_at else None,
+            })
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Error updating message {payload.message_id}: {e}")
+        finally:
+            db.close()
+
+    def delete_messages(self, channel_id: int, message_ids: list):
+        """Remove deleted messages"""
+        if not self.is_mirrored(channel_id):
+            return
+        db = get_db_sync()
+        try:
+            db.query(ChannelMessage).filter(ChannelMessage.id.in_(list(message_ids))).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Error deleting messages {message_ids}: {e}")
+        finally:
+            db.close()
+
+    async def backfill(self, bot: discord.Client):
+        """
+        Fetch everything posted since the last stored message of each mirrored channel
+
+        Args:
+            bot: Discord bot instance
+        """
+        for channel_id in self.channel_ids:
+            try:
+                await self._backfill_channel(bot, channel_id)
+            except Exception as e:
+                logger.error(f"❌ Error backfilling channel {channel_id}: {e}")
+
+    async def _backfill_channel(self, bot: discord.Client, channel_id: int):
+        channel = bot.get_channel(channel_id)
+        if not channel:
+            logger.error(f"Channel with ID {channel_id} not found")
+            return
+
+        db = get_db_sync()
+        try:
+            state = db.query(ChannelSyncState).filter(ChannelSyncState.channel_id == channel_id).first()
+            # Resume below the first live message, messages received live may already be ahead of a gap
+            last_id_query = db.query(func.max(ChannelMessage.id)).filter(ChannelMessage.channel_id == channel_id)
+            if channel_id in self.first_live_ids:
+                last_id_query = last_id_query.filter(ChannelMessage.id < self.first_live_ids[channel_id])
+            last_id = last_id_query.scalar()
+
+            if state is None or last_id is None:
+                # Nothing stored yet - start a fresh window
+                coverage_start = datetime.now(timezone.utc) - timedelta(hours=Config.MESSAGE_STORE.INITIAL_BACKFILL_HOURS)
+                after = coverage_start
+            else:
+                coverage_start = state.coverage_start
+                after = discord.Object(id=last_id)
+
+            count = 0
+            async for message in channel.history(limit=None, after=after, oldest_first=True):
+                db.merge(ChannelMessage(**self._message_to_row(message)))
+                count += 1
+                if count % Config.MESSAGE_STORE.BACKFILL_COMMIT_EVERY == 0:
+                    db.commit()
+
+            if state is None:
+                db.add(ChannelSyncState(channel_id=channel_id, coverage_start=_to_naive_utc(coverage_start)))
+            else:
+                state.coverage_start = _to_naive_utc(coverage_start)
+            db.commit()
+            self.synced_channels.add(channel_id)
+            self.backfilled_channels.add(channel_id)
+            logger.info(f"📥 Backfilled {count} messages from {channel.name}")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def get_messages(self, channel_id: int, since: datetime, user_ids: list = None) -> list:
+        """
+        Read stored messages of a channel
+
+        Args:
+            channel_id: Discord channel ID
+            since: Only messages created after this time
+            user_ids: List of user IDs to filter by (default: None - all users)
+
+        Returns:
+            list: ChannelMessage rows, oldest first
+        """
+        db = get_db_sync()
+        try:
+            # Snowflakes are time ordered, so the (channel_id, id) index serves the time filter too
+            query = db.query(ChannelMessage).filter(
+                ChannelMessage.channel_id == channel_id,
+                ChannelMessage.id > discord.utils.time_snowflake(_to_aware_utc(since)),
+            )
+            if user_ids:
+                query = query.filter(ChannelMessage.author_id.in_(user_ids))
+            return query.order_by(ChannelMessage.id).all()
+        finally:
+            db.close()
+
+
+# Global message store instance
+_message_store = None
+
+
+def get_message_store():
+    """
+    Get or create the global message store instance
+
+    Returns:
+        MessageStore: Global message store instance
+    """
+    global _message_store
+    if _message_store is None:
+        _message_store = MessageStore()
+    return _message_store
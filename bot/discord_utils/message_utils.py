@@ -6,6 +6,8 @@ import discord
 from utils.logger import logger
 from config_ext import NotificationRole
 from .role_utils import get_role_mention
+from .message_dispatcher import get_message_dispatcher
+from .text_layout import pack_text, build_description_embeds
 
 
 def split_long_message(message: str, max_length: int = 1900) -> list:
@@ -21,36 +23,10 @@ def split_long_message(message: str, max_length: int = 1900) -> list:
     """
     if len(message) <= max_length:
         return [message]
-    
-    chunks = []
-    current_chunk = ""
-    
-    # Split by lines to avoid breaking in the middle of content
-    lines = message.split('\n')
-    
-    for line in lines:
-        # If adding this line would exceed the limit, start a new chunk
-        if len(current_chunk) + len(line) + 1 > max_length:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = line
-            else:
-                # Single line is too long, split it
-                while len(line) > max_length:
-                    chunks.append(line[:max_length])
-                    line = line[max_length:]
-                current_chunk = line
-        else:
-            current_chunk += '\n' + line if current_chunk else line
-    
-    # Add the last chunk if it has content
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
-    
-    return chunks
+    return pack_text(message, max_length)
 
 
-async def send_embed_message(bot: discord.Client, channel_id: int, message: str, color: int, title: str, error_context: str = "send_message"):
+async def send_embed_message(bot: discord.Client, channel_id: int, message: str, color: int, title: str, error_context: str = "send_message", mention_role: NotificationRole = None):
     """
     Send a message to a specific channel with splitting support
     
@@ -61,6 +37,7 @@ async def send_embed_message(bot: discord.Client, channel_id: int, message: str,
         color: Embed color (hex)
         title: Embed title
         error_context: Context for error logging
+        mention_role: Notification role to mention in the same message (optional)
     
     Returns:
         bool: True if successful, False otherwise
@@ -71,24 +48,17 @@ async def send_embed_message(bot: discord.Client, channel_id: int, message: str,
             logger.error(f"❌ Could not find channel with ID: {channel_id} in {error_context}")
             return False
         
-        # Split message if it's too long
-        message_chunks = split_long_message(message)
+        # Split message into embeds that fill Discord messages (RTL text is marked for Hebrew)
+        embeds = build_description_embeds(message, title, color)
         
-        for i, chunk in enumerate(message_chunks):
-            # Create embed
-            embed = discord.Embed(
-                title=title,
-                description=chunk,
-                color=color
-            )
-            
-            # Add footer for split messages
-            if len(message_chunks) > 1:
-                embed.set_footer(text=f"Part {i+1} of {len(message_chunks)}")
-            
-            await channel.send(embed=embed)
+        content = None
+        if mention_role:
+            content = await get_role_mention(bot, mention_role.full_name, getattr(channel, "guild", None))
+            if not content:
+                logger.warning(f"⚠️ Could not find role: {mention_role.full_name}")
         
-        return True
+        # The dispatcher packs the embeds (and the mention) into as few messages as possible
+        return await get_message_dispatcher(bot).send(channel_id, embeds, content, error_context)
         
     except Exception as e:
         logger.error(f"❌ Error sending message to channel {channel_id} in {error_context}: {e}")
@@ -98,18 +68,17 @@ async def send_embed_message(bot: discord.Client, channel_id: int, message: str,
 async def send_mention_message(bot: discord.Client, channel_id: int, notification_role: NotificationRole):
     """Send a role mention as a separate text message"""
     try:
+        channel = bot.get_channel(channel_id)
+        if not channel:
+            logger.error(f"❌ Could not find alert channel: {channel_id}")
+            return
         
-        role_mention = await get_role_mention(bot, notification_role.full_name)
+        role_mention = await get_role_mention(bot, notification_role.full_name, getattr(channel, "guild", None))
         
         if role_mention:
-            channel = bot.get_channel(channel_id)
-            if channel:
-                await channel.send(role_mention)
-            else:
-                logger.error(f"❌ Could not find alert channel: {channel_id}")
+            await get_message_dispatcher(bot).send(channel_id, content=role_mention, error_context="send_mention_message")
         else:
             logger.warning(f"⚠️ Could not find role: {notification_role.full_name}")
     except Exception as e:
         logger.error(f"❌ Error sending role mention: {e}")
 
- 
\ No newline at end of file
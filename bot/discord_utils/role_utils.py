@@ -6,25 +6,105 @@ import discord
 from utils.logger import logger
 
 
-async def get_role_mention(bot, role_name: str) -> str:
-    """Get role mention string for a given role name"""
+class RoleIndex:
+    """
+    Per-guild index of roles by name.
+
+    Each guild is indexed once on first use and then kept up to date from the
+    on_guild_role_create/update/delete events, so lookups don't scan guild.roles.
+    """
+
+    def __init__(self):
+        self.guilds = {}  # guild_id -> {role name: discord.Role}
+
+    def _index_guild(self, guild: discord.Guild) -> dict:
+        roles_by_name = {}
+        # guild.roles is ordered from lowest position, keep the first match like discord.utils.get
+        for role in guild.roles:
+            roles_by_name.setdefault(role.name, role)
+        self.guilds[guild.id] = roles_by_name
+        return roles_by_name
+
+    def _get_guild_index(self, guild: discord.Guild) -> dict:
+        roles_by_name = self.guilds.get(guild.id)
+        if roles_by_name is None:
+            roles_by_name = self._index_guild(guild)
+        return roles_by_name
+
+    def get(self, guild: discord.Guild, role_name: str):
+        """Get a role by name, or None if the guild doesn't have it"""
+        return self._get_guild_index(guild).get(role_name)
+
+    def get_notification_role(self, guild: discord.Guild, notification_role):
+        """Get the Discord role of a NotificationRole, or None if it wasn't created yet"""
+        return self.get(guild, notification_role.full_name)
+
+    def add_role(self, role: discord.Role):
+        """Index a created role (on_guild_role_create)"""
+        if role.guild.id in self.guilds:
+            self.guilds[role.guild.id].setdefault(role.name, role)
+
+    def update_role(self, before: discord.Role, after: discord.Role):
+        """Re-index a renamed or changed role (on_guild_role_update)"""
+        self.remove_role(before)
+        self.add_role(after)
+
+    def remove_role(self, role: discord.Role):
+        """Drop a deleted role (on_guild_role_delete)"""
+        roles_by_name = self.guilds.get(role.guild.id)
+        if roles_by_name is None:
+            return
+        indexed = roles_by_name.get(role.name)
+        if indexed is not None and indexed.id == role.id:
+            del roles_by_name[role.name]
+            # Another role may share the name
+            for other in role.guild.roles:
+                if other.name == role.name and other.id != role.id:
+                    roles_by_name[role.name] = other
+                    break
+
+    def remove_guild(self, guild: discord.Guild):
+        """Forget a guild the bot left (on_guild_remove)"""
+        self.guilds.pop(guild.id, None)
+
+
+# Global role index instance
+_role_index = None
+
+
+def get_role_index() -> RoleIndex:
+    """
+    Get or create the global role index instance
+
+    Returns:
+        RoleIndex: Global role index instance
+    """
+    global _role_index
+    if _role_index is None:
+        _role_index = RoleIndex()
+    return _role_index
+
+
+async def get_role_mention(bot, role_name: str, guild: discord.Guild = None) -> str:
+    """Get role mention string for a given role name (in the given guild, default: the first guild)"""
     try:
         if not bot:
             return ""
-        
-        # Get the first guild (assuming single server setup)
-        guild = bot.guilds[0] if bot.guilds else None
+
+        if guild is None:
+            # Assuming single server setup when no guild is given
+            guild = bot.guilds[0] if bot.guilds else None
         if not guild:
             return ""
-        
+
         # Find the role by name
-        role = discord.utils.get(guild.roles, name=role_name)
+        role = get_role_index().get(guild, role_name)
         if role:
             return role.mention
         else:
             logger.warning(f"⚠️ Role '{role_name}' not found in guild")
             return ""
-            
+
     except Exception as e:
         logger.error(f"❌ Error getting role mention for '{role_name}': {e}")
-        return "" 
\ No newline at end of file
+        return ""
@@ -0,0 +1,195 @@
+"""
+Text Layout - Split text into Discord-sized pieces in linear time
+
+The text is tokenized once into segments that end at a line break or a sentence
+end, then the segments are packed greedily into chunks. Embed helpers build
+ready-to-send embeds that respect Discord's limits.
+"""
+
+import re
+import discord
+
+DESCRIPTION_LIMIT = 4096
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+MAX_FIELDS = 25
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+FOOTER_RESERVE = 20  # Room for "Part 10 of 10" style footers
+
+RLM = "\u200f"  # Right-to-left mark
+_SEGMENT_END = re.compile(r"\n|[.!?]+(?:\s+|$)")
+_HEBREW = re.compile("[\u0590-\u05ff]")
+_LATIN = re.compile(r"[A-Za-z]")
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text into segments ending at a line break or a sentence end.
+    Joining the segments gives back the original text.
+    """
+    segments = []
+    start = 0
+    for match in _SEGMENT_END.finditer(text):
+        segments.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        segments.append(text[start:])
+    return segments
+
+
+def _split_oversized(segment: str, max_length: int) -> list:
+    """Split a segment longer than max_length at the last whitespace of each window"""
+    pieces = []
+    start = 0
+    while len(segment) - start > max_length:
+        end = start + max_length
+        space = segment.rfind(" ", start + 1, end)
+        if space > start:
+            end = space + 1
+        pieces.append(segment[start:end])
+        start = end
+    pieces.append(segment[start:])
+    return pieces
+
+
+def _pack(segments: list, next_limit) -> list:
+    """
+    Greedily pack segments into chunks
+
+    Args:
+        segments: Text segments (from tokenize)
+        next_limit: Callable returning the max length of the next chunk
+
+    Returns:
+        list: Stripped, non-empty chunks
+    """
+    chunks = []
+    parts = []
+    length = 0
+    limit = next_limit()
+
+    def flush():
+        nonlocal parts, length, limit
+        chunk = "".join(parts).strip()
+        if chunk:
+            chunks.append(chunk)
+            limit = next_limit()
+        parts = []
+        length = 0
+
+    for segment in segments:
+        pieces = [segment] if len(segment) <= limit else _split_oversized(segment, limit)
+        for piece in pieces:
+            if length + len(piece.rstrip()) > limit and parts:
+                flush()
+                piece = piece.lstrip()
+            parts.append(piece)
+            length += len(piece)
+    flush()
+    return chunks
+
+
+def pack_text(text: str, max_length: int) -> list:
+    """
+    Split text into chunks of at most max_length, breaking at line and sentence ends
+
+    Args:
+        text: Text to split
+        max_length: Maximum length per chunk
+
+    Returns:
+        list: Text chunks
+    """
+    if not text:
+        return []
+    return _pack(tokenize(text), lambda: max_length)
+
+
+def is_rtl(text: str) -> bool:
+    """Check if text is mostly right-to-left (Hebrew)"""
+    return len(_HEBREW.findall(text)) > len(_LATIN.findall(text))
+
+
+def mark_rtl(text: str) -> str:
+    """
+    Prefix every line with a right-to-left mark, so lines that start with a number,
+    a ticker or a link are still rendered right-to-left in Discord
+    """
+    return "\n".join(RLM + line if line and not line.startswith(RLM) else line for line in text.split("\n"))
+
+
+def build_description_embeds(text: str, title: str, color: int, rtl: bool = None) -> list:
+    """
+    Build embeds for a long text, sized so consecutive embeds fill Discord messages
+    (up to 10 embeds / 6000 characters each)
+
+    Args:
+        text: Text for the embed descriptions
+        title: Title of every embed
+        color: Embed color (hex)
+        rtl: Mark lines right-to-left (default: detect Hebrew text)
+
+    Returns:
+        list: discord.Embed objects, with "Part x of y" footers when there is more than one
+    """
+    if rtl is None:
+        rtl = is_rtl(text)
+    if rtl:
+        text = mark_rtl(text)
+
+    title = (title or "")[:FIELD_NAME_LIMIT]
+    overhead = len(title) + FOOTER_RESERVE
+    message_state = {"chars": 0, "embeds": 0}
+
+    def next_limit():
+        # Start a new message when this one is out of embeds or characters
+        remaining = MAX_EMBED_CHARS_PER_MESSAGE - message_state["chars"] - overhead
+        if message_state["embeds"] >= MAX_EMBEDS_PER_MESSAGE or remaining < FIELD_VALUE_LIMIT:
+            message_state["chars"] = 0
+            message_state["embeds"] = 0
+            remaining = MAX_EMBED_CHARS_PER_MESSAGE - overhead
+        limit = min(DESCRIPTION_LIMIT, remaining)
+        message_state["chars"] += limit + overhead
+        message_state["embeds"] += 1
+        return limit
+
+    chunks = _pack(tokenize(text), next_limit) or [""]
+    embeds = []
+    for i, chunk in enumerate(chunks):
+        embed = discord.Embed(title=title, description=chunk, color=color)
+        if len(chunks) > 1:
+            embed.set_footer(text=f"Part {i+1} of {len(chunks)}")
+        embeds.append(embed)
+    return embeds
+
+
+def add_text_fields(embed: discord.Embed, name: str, text: str, color: int = None, rtl: bool = None) -> list:
+    """
+    Add a long text as fields (1024 chars each), continuing into new embeds when
+    the embed runs out of fields or characters
+
+    Args:
+        embed: Embed to fill first
+        name: Field name (repeated for every field)
+        text: Text to add
+        color: Color for continuation embeds (default: the first embed's color)
+        rtl: Mark lines right-to-left (default: detect Hebrew text)
+
+    Returns:
+        list: Continuation embeds (empty if everything fit in the given embed)
+    """
+    if rtl is None:
+        rtl = is_rtl(text)
+    if rtl:
+        text = mark_rtl(text)
+    name = name[:FIELD_NAME_LIMIT]
+
+    embeds = [embed]
+    for chunk in pack_text(text, FIELD_VALUE_LIMIT):
+        current = embeds[-1]
+        if len(current.fields) >= MAX_FIELDS or len(current) + len(name) + len(chunk) + FOOTER_RESERVE > MAX_EMBED_CHARS_PER_MESSAGE:
+            current = discord.Embed(color=color if color is not None else embed.color)
+            embeds.append(current)
+        current.add_field(name=name, value=chunk, inline=False)
+    return embeds[1:]
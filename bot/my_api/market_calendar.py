@@ -0,0 +1,78 @@
+"""
+Market Calendar - In-memory US market schedule keyed by date
+
+Holds the open/close times (in the app timezone) and holiday of every market day in a
+date -> MarketDay dict, so daily lookups are O(1) instead of DataFrame scans. The
+schedule is persisted as compact column lists in one JSON file.
+"""
+
+import json
+import os
+from typing import NamedTuple, Optional
+import pandas as pd
+from utils.logger import logger
+
+
+class MarketDay(NamedTuple):
+    date: str  # yyyy-mm-dd
+    open_time: Optional[str]  # HH:MM, None on full holidays
+    close_time: Optional[str]
+    holiday: Optional[str]
+
+
+def _none_if_missing(value):
+    return None if value is None or (isinstance(value, float) and pd.isna(value)) else value
+
+
+class MarketCalendar:
+    COLUMNS = list(MarketDay._fields)
+
+    def __init__(self, days: list = None):
+        """
+        Initialize MarketCalendar
+
+        Args:
+            days: MarketDay entries (weekends are not listed)
+        """
+        self.days = {day.date: day for day in sorted(days or [])}
+
+    @classmethod
+    def from_frame(cls, schedule: pd.DataFrame) -> "MarketCalendar":
+        """Build the calendar from a date/open_time/close_time/holiday DataFrame"""
+        columns = [schedule[column].tolist() if column in schedule else [None] * len(schedule) for column in cls.COLUMNS]
+        return cls([MarketDay(*(_none_if_missing(value) for value in row)) for row in zip(*columns)])
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(list(self.days.values()), columns=self.COLUMNS)
+
+    def get_day(self, date: str) -> Optional[MarketDay]:
+        """Get a market day (yyyy-mm-dd), or None if the market is not scheduled that day"""
+        return self.days.get(date)
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return next(reversed(self.days), None)
+
+    def __len__(self):
+        return len(self.days)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = {column: [getattr(day, column) for day in self.days.values()] for column in self.COLUMNS}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["MarketCalendar"]:
+        """Load a saved calendar, or None if there is none (or it can't be read)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return cls([MarketDay(*row) for row in zip(*(data[column] for column in cls.COLUMNS))])
+        except Exception as e:
+            logger.error(f"❌ Error loading market calendar {path}: {e}")
+            return None
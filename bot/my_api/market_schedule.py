@@ -2,10 +2,11 @@ from datetime import datetime, timedelta
 from utils import logger, get_time_deltas_for_date_range
 from config import Config
 from scrapers import InvestingScraper, InvestingParams
+from my_api.market_calendar import MarketCalendar
 import asyncio
 import pandas as pd
-import re
-import os
+
+MARKET_CALENDAR_PATH = "data/market_calendar.json"
 
 def get_weekday_for_date(date: str):
     "Date in format yyyy-mm-dd"
@@ -13,7 +14,7 @@ def get_weekday_for_date(date: str):
 
 
 async def get_market_schedule_for_dates_range(start_date: str, end_date: str, target_tz, source_tz='America/New_York')-> pd.DataFrame:
-    """returns dataframe with date and delta_hours"""
+    """returns dataframe with date, open_time, close_time and holiday"""
     scraper = InvestingScraper(proxy=Config.PROXY.APP_PROXY, timezone=target_tz)
     holiday_df = await scraper.get_calendar("holiday_calendar", 
                                 InvestingParams.TIME_RANGES.CUSTOM, 
@@ -26,58 +27,96 @@ async def get_market_schedule_for_dates_range(start_date: str, end_date: str, ta
         return None
     
 
+    return build_market_schedule(start_date, end_date, holiday_df, target_tz, source_tz)
+
+
+def _shift_time(time_str: str, delta_hours: pd.Series) -> pd.Series:
+    return (pd.Timestamp(f"1900-01-01 {time_str}") + pd.to_timedelta(delta_hours, unit="h")).dt.strftime("%H:%M")
+
+
+def build_market_schedule(start_date: str, end_date: str, holiday_df: pd.DataFrame, target_tz, source_tz='America/New_York') -> pd.DataFrame:
+    """
+    Compute the market days of a date range with column operations
+
+    Args:
+        start_date: First date (yyyy-mm-dd)
+        end_date: End date, excluded (yyyy-mm-dd)
+        holiday_df: Holiday calendar with date, time ('all day', 'HH:MM' early close or 'unknown time') and holiday
+        target_tz: Timezone of the output times
+        source_tz: Timezone of the regular 09:30-16:00 session
+
+    Returns:
+        pd.DataFrame: date, open_time, close_time and holiday of each weekday
+    """
     delta_df = get_time_deltas_for_date_range(start_date, end_date, target_tz, source_tz)
-    # market open at 9:30am + delta_hours, close at 4:00pm + delta_hours (convert numbers to time)
-    def apply_delta_and_convert_to_time(time_str, delta_hours):
-        return (datetime.strptime(time_str, "%H:%M") + timedelta(hours=delta_hours)).strftime("%H:%M")
-    
-    delta_df['open_time'] = delta_df['delta_hours'].apply(lambda x: apply_delta_and_convert_to_time("09:30", x))
-    delta_df['close_time'] = delta_df['delta_hours'].apply(lambda x: apply_delta_and_convert_to_time("16:00", x))
+    delta_df = delta_df[pd.to_datetime(delta_df['date']).dt.dayofweek < 5].reset_index(drop=True)
 
-    # if date of week is 5 or 6, set open and close time to None
-    delta_df['is_weekend'] = delta_df['date'].apply(lambda x: get_weekday_for_date(x) in [5, 6])
-    # drop rows where is_weekend is True
-    delta_df = delta_df.loc[~delta_df['is_weekend']]
-    # if date in holidays_df, add "holiday" column which will be equal to holiday_df['holiday']
-    for index, row in holiday_df.iterrows():
-        delta_df.loc[delta_df['date'] == row['date'], 'holiday'] = row['holiday']
-        if row['time'] == "all day":
-            delta_df.loc[delta_df['date'] == row['date'], 'open_time'] = None
-            delta_df.loc[delta_df['date'] == row['date'], 'close_time'] = None
-        # check if match h:m pattern
-        elif re.match(r'^\d{1,2}:\d{2}$', row['time']):
-            delta_df.loc[delta_df['date'] == row['date'], 'close_time'] = row['time']
-        elif row['time'] == "unknown time":
-            logger.error(f"Unknown time for {row['date']}")
+    # market open at 9:30am + delta_hours, close at 4:00pm + delta_hours
+    schedule = pd.DataFrame({
+        'date': delta_df['date'],
+        'open_time': _shift_time("09:30", delta_df['delta_hours']),
+        'close_time': _shift_time("16:00", delta_df['delta_hours']),
+    }).astype(object)
+    schedule['holiday'] = None
 
-    output_df = delta_df[['date', 'open_time', 'close_time', 'holiday']].sort_values(by='date')
-    return output_df
+    if holiday_df is not None and not holiday_df.empty:
+        holidays = holiday_df[holiday_df['date'].isin(schedule['date'])]
+        holiday_names = holidays.drop_duplicates('date', keep='last').set_index('date')['holiday']
+        is_holiday = schedule['date'].isin(holiday_names.index)
+        schedule.loc[is_holiday, 'holiday'] = schedule.loc[is_holiday, 'date'].map(holiday_names)
 
+        early_close = holidays[holidays['time'].str.match(r'^\d{1,2}:\d{2}$', na=False)]
+        early_close = early_close.drop_duplicates('date', keep='last').set_index('date')['time']
+        is_early_close = schedule['date'].isin(early_close.index)
+        schedule.loc[is_early_close, 'close_time'] = schedule.loc[is_early_close, 'date'].map(early_close)
 
+        # A full-day closing wins over an early close listed for the same date
+        is_closed = schedule['date'].isin(holidays.loc[holidays['time'] == "all day", 'date'])
+        schedule.loc[is_closed, ['open_time', 'close_time']] = None
 
+        for date in holidays.loc[holidays['time'] == "unknown time", 'date']:
+            logger.error(f"Unknown time for {date}")
 
-async def get_market_schedule_for_next_quarter(target_tz)-> pd.DataFrame:
-    """returns dataframe with date and open_time, close_time, holiday"""
+    return schedule
 
-    output_file_path = "data/market_schedule.csv"
 
-    today_date = datetime.now().strftime("%Y-%m-%d")
-    quarter_from_now = (datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d")
+_market_calendar = None
+
+
+async def get_market_calendar(target_tz)-> MarketCalendar:
+    """
+    Get the market calendar for the next 90 days, loaded once and extended when it gets short
+
+    Args:
+        target_tz: Timezone of the open/close times
+
+    Returns:
+        MarketCalendar: In-memory calendar (None if it could not be built)
+    """
+    global _market_calendar
+    month_from_now = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+
+    if _market_calendar is None:
+        _market_calendar = MarketCalendar.load(MARKET_CALENDAR_PATH)
+    # if the calendar covers more than a month forward, use it
+    if _market_calendar is not None and _market_calendar.last_date and _market_calendar.last_date > month_from_now:
+        return _market_calendar
 
-    # if df updated month forward, return the saved df
-    if os.path.exists(output_file_path):
-        df = pd.read_csv(output_file_path)
-        month_from_now = (datetime.now() + timedelta(days=30))
-        last_date = datetime.strptime(df.iloc[-1]['date'], "%Y-%m-%d")
-        if month_from_now < last_date:
-            logger.info(f"Market hours for next 90 days already exists")
-            return df
-   
     logger.info(f"Getting market hours for next 90 days")
+    today_date = datetime.now().strftime("%Y-%m-%d")
+    quarter_from_now = (datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d")
     result = await get_market_schedule_for_dates_range(today_date, quarter_from_now, target_tz, source_tz=Config.TIMEZONES.EASTERN_US)
-    result.to_csv(output_file_path, index=False)
+    if result is None:
+        return _market_calendar
+    _market_calendar = MarketCalendar.from_frame(result)
+    _market_calendar.save(MARKET_CALENDAR_PATH)
+    return _market_calendar
+
 
-    return result
+async def get_market_schedule_for_next_quarter(target_tz)-> pd.DataFrame:
+    """returns dataframe with date and open_time, close_time, holiday"""
+    market_calendar = await get_market_calendar(target_tz)
+    return market_calendar.to_frame() if market_calendar is not None else None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+"""
+Live news ingestion - parse, embed and score news messages as they arrive.
+
+Messages from the news channel are parsed on arrival and put on a bounded queue.
+A single worker embeds them in micro-batches (flushed by count or by time), scores
+them with the impact classifier and posts high-impact items as live alerts.
+"""
+
+import asyncio
+import time
+from typing import List, Dict, Any
+import discord
+from utils.logger import logger
+from config import Config
+from discord_utils import send_embed_message
+from ai_tools.llm_usage import atracked_embed_documents
+from .discord_news_parser import parse_single_message
+
+
+class LiveNewsIngestor:
+    """Event-driven ingestion of news messages into the impact classifier."""
+
+    def __init__(self, bot: discord.Client, config=Config.LIVE_NEWS):
+        self.bot = bot
+        self.config = config
+        self.queue = asyncio.Queue(maxsize=config.MAX_QUEUE_SIZE)
+        self.classifier = None
+        self.worker_task = None
+        self.starting = False
+        self.enabled = config.ENABLED
+
+    async def start(self):
+        """Load the classifier (centroid embeddings) and start the worker"""
+        if not self.enabled or self.starting or self.worker_task is not None:
+            return
+        self.starting = True
+        try:
+            # Imported lazily - the pipeline pulls in langchain, which is optional for the bot
+            from pipe_line_v1.classifier import ImpactClassifier
+            self.classifier = await asyncio.to_thread(ImpactClassifier)
+        except ImportError as e:
+            logger.error(f"❌ Live news ingestion disabled, pipeline dependencies missing: {e}")
+            self.enabled = False
+            return
+        except Exception as e:
+            logger.error(f"❌ Live news ingestion disabled, failed to load classifier: {e}")
+            self.enabled = False
+            return
+        finally:
+            self.starting = False
+
+        self.worker_task = asyncio.create_task(self._worker())
+        logger.info("📡 Live news ingestion started")
+
+    def submit(self, message: discord.Message):
+        """Parse a new message and queue it for scoring (called from on_message)"""
+        if not self.enabled or message.channel.id != self.config.SOURCE_CHANNEL:
+            return
+        if self.config.SOURCE_USERS and message.author.id not in self.config.SOURCE_USERS:
+            return
+
+        article = parse_single_message({
+            'timestamp': message.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            'author': message.author.display_name,
+            'content': message.content,
+        })
+        if not article:
+            return
+        article['received_at'] = time.perf_counter()
+
+        if self.queue.full():
+            dropped = self.queue.get_nowait()
+            logger.warning(f"⚠️ Live news queue full, dropping: {dropped.get('headline', '')[:80]}")
+        self.queue.put_nowait(article)
+
+    async def _worker(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"❌ Error processing live news batch: {e}")
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Wait for the first item, then collect more until the batch is full or the flush interval passed"""
+        batch = [await self.queue.get()]
+        deadline = time.perf_counter() + self.config.FLUSH_INTERVAL_MS / 1000
+        while len(batch) < self.config.BATCH_SIZE:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _process_batch(self, batch: List[Dict[str, Any]]):
+        embeddings = await atracked_embed_documents(
+            self.classifier.embeddings,
+            [article['headline'] for article in batch],
+            caller="live_news"
+        )
+
+        for article, embedding in zip(batch, embeddings):
+            article['embedding'] = embedding
+            score = self.classifier.score_article_impact(article)
+            if score >= self.config.IMPACT_THRESHOLD:
+                await self._send_alert(article, score)
+
+            latency_ms = (time.perf_counter() - article['received_at']) * 1000
+            if latency_ms > self.config.LATENCY_BUDGET_MS:
+                logger.warning(f"⚠️ Live news over latency budget: {latency_ms:.0f}ms (score {score:.2f}, batch {len(batch)})")
+            else:
+                logger.debug(f"📡 Live news scored {score:.2f} in {latency_ms:.0f}ms")
+
+    async def _send_alert(self, article: Dict[str, Any], score: float):
+        message = f"{article['headline']}\n[Link to tweet]({article['link']})\n\nImpact score: {score:.2f}"
+        await send_embed_message(
+            self.bot,
+            self.config.ALERT_CHANNEL,
+            message,
+            Config.COLORS.RED,
+            "📰 Live News",
+            error_context="live_news_alert",
+            mention_role=Config.NOTIFICATION_ROLES.LIVE_NEWS
+        )
+
+
+# Global live news ingestor instance
+_live_news_ingestor = None
+
+
+def get_live_news_ingestor(bot: discord.Client):
+    """
+    Get or create the global live news ingestor instance
+
+    Args:
+        bot: Discord bot instance
+
+    Returns:
+        LiveNewsIngestor: Global live news ingestor instance
+    """
+    global _live_news_ingestor
+    if _live_news_ingestor is None:
+        _live_news_ingestor = LiveNewsIngestor(bot)
+    return _live_news_ingestor
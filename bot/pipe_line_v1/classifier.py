@@ -6,6 +6,7 @@ Handles centroid-based impact scoring using embeddings.
 import numpy as np
 from typing import List, Dict, Any
 from langchain_openai import OpenAIEmbeddings
+from ai_tools.llm_usage import tracked_embed_documents
 from .config import Config
 from utils import logger
 
@@ -75,10 +76,10 @@ class ImpactClassifier:
     def _cache_embeddings(self):
         """Cache embeddings for all vector categories"""
         try:
-            self.economic_embeddings = self.embeddings.embed_documents(self.economic_vectors)
-            self.positive_embeddings = self.embeddings.embed_documents(self.positive_vectors)
-            self.negative_embeddings = self.embeddings.embed_documents(self.negative_vectors)
-            self.neutral_embeddings = self.embeddings.embed_documents(self.neutral_vectors)
+            self.economic_embeddings = tracked_embed_documents(self.embeddings, self.economic_vectors, caller="classifier_centroids")
+            self.positive_embeddings = tracked_embed_documents(self.embeddings, self.positive_vectors, caller="classifier_centroids")
+            self.negative_embeddings = tracked_embed_documents(self.embeddings, self.negative_vectors, caller="classifier_centroids")
+            self.neutral_embeddings = tracked_embed_documents(self.embeddings, self.neutral_vectors, caller="classifier_centroids")
             logger.info("Cached all centroid embeddings")
         except Exception as e:
             logger.error(f"Failed to cache centroid embeddings: {e}")
@@ -7,6 +7,7 @@ import numpy as np
 from typing import List, Dict, Any, Optional
 from langchain_openai import OpenAIEmbeddings
 from langchain.schema import Document
+from ai_tools.llm_usage import tracked_embed_documents
 from .config import Config
 
 class EmbeddingManager:
@@ -18,7 +19,7 @@ class EmbeddingManager:
 
     def embed_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         texts = [article.get('headline', '') for article in articles]
-        embeddings_list = self.embeddings.embed_documents(texts)
+        embeddings_list = tracked_embed_documents(self.embeddings, texts, caller="pipeline_embed_articles")
         
         for article, embedding in zip(articles, embeddings_list):
             article['embedding'] = embedding
@@ -6,6 +6,7 @@ Handles cluster summarization using OpenAI LLM.
 from typing import List, Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
+from ai_tools.llm_usage import track_llm_call
 from .config import Config
 
 class ClusterSummarizer:
@@ -25,9 +26,13 @@ class ClusterSummarizer:
         articles_text = self._prepare_articles_text(articles)
         
         try:
-            response = self.llm.invoke(
-                self.summary_template.format(articles_text=articles_text)
-            )
+            with track_llm_call("cluster_summarizer", Config.LLM_MODEL) as record:
+                record.retries = None  # LangChain retries inside the client
+                response = self.llm.invoke(
+                    self.summary_template.format(articles_text=articles_text)
+                )
+                usage = response.usage_metadata or {}
+                record.set_usage(usage.get("input_tokens"), usage.get("output_tokens"))
             return response.content.strip()
         except Exception:
             return "Summary generation failed."
@@ -6,16 +6,25 @@ A class-based system for generating HTML and PDF news reports with theme support
 
 import json
 from datetime import datetime
-from utils import logger, read_json_file
+from utils import logger, read_json_file, JsonSpec
 from scrapers import YfScraper, QouteFields as qf
 import pytz
 import discord
-from ai_tools.process_discord_news import process_news_to_list
+from ai_tools.process_discord_news import process_news_to_list, stream_news_items
 import requests
 import asyncio
 from discord_utils import send_embed_message, send_mention_message
+from discord_utils.message_dispatcher import get_message_dispatcher
 from config import Config
 
+MARKET_QUOTE_SPEC = JsonSpec({
+    "ticker": '["symbol"]',
+    "price": f'["{qf.REGULAR_MARKET_PRICE}"]["fmt"]',
+    "abs_change": f'["{qf.REGULAR_MARKET_CHANGE}"]["fmt"]',
+    "percent_change": f'["{qf.REGULAR_MARKET_CHANGE_PERCENT}"]["fmt"]',
+    "change": f'["{qf.REGULAR_MARKET_CHANGE}"]["raw"]',
+})
+
 class NewsReport:
     
     def __init__(self, discord_bot: discord.Client, timezone: str):
@@ -31,6 +40,8 @@ class NewsReport:
         self.yf_requests = YfScraper(proxy=Config.PROXY.APP_PROXY)
         self.summary_symbols = self._load_summary_symbols()
         self.full_report = None
+        self.formatted_news = []  # Discord lines aligned with full_report["news_data"]
+        self.market_summary_posted = False
     
     def _load_summary_symbols(self) -> dict:
         """Load symbols configuration from JSON file and flatten it"""
@@ -103,6 +114,54 @@ class NewsReport:
             logger.error(f"❌ Error loading news data: {e}")
             return []
 
+    async def _stream_discord_news(self, hours_back: int = 24) -> list:
+        """
+        Load news data from Discord channel, formatting each item for Discord while the model is still writing the rest.
+        Errors are raised - a stream cut off midway must not be published as the full report.
+        """
+        news_with_lines = []
+        async for news in stream_news_items(discord_bot=self.discord_bot, hours_back=hours_back):
+            if not isinstance(news, dict):
+                logger.error(f"❌ Skipping invalid news item: {news}")
+                continue
+            news_with_lines.append((news, self._format_news_line(news)))
+            if len(news_with_lines) == 1:
+                logger.info("📰 First news item received from the model")
+
+        # Sort news by date (oldest first)
+        news_with_lines.sort(key=lambda x: x[0].get('date', ''), reverse=False)
+        self.formatted_news = [line for _, line in news_with_lines]
+        logger.info(f"✅ Loaded and sorted {len(news_with_lines)} news items by date")
+        return [news for news, _ in news_with_lines]
+
+    def _format_news_line(self, news: dict) -> str:
+        """Format a single news item for the Discord news embed (without its number)"""
+        message = news.get('message', 'N/A')
+        time = news.get('time', 'N/A')
+        links = news.get('links', [])
+        
+        news_line = f"{message}"
+        if time != 'N/A':
+            news_line += f" **({time})**"
+        
+        # Handle multiple links
+        if links:
+            # New format with multiple links
+            link_texts = []
+            for j, link_url in enumerate(links, 1):
+                if link_url:
+                    link_texts.append(f"[קישור {j}]({link_url})")
+            if link_texts:
+                news_line += f"\n{' | '.join(link_texts)}"  # New line with pipe separator between links
+        return news_line
+
+
+    async def _load_and_post_market_summary(self, channel_id: int = None) -> dict:
+        """Load the market summary and, with a channel, post its embed right away"""
+        categorized_prices = await self._load_market_summary()
+        if channel_id and categorized_prices.get("categories"):
+            self.market_summary_posted = await self.send_market_summary_to_discord(channel_id, categorized_prices)
+        return categorized_prices
 
     async def _load_market_summary(self) -> list:
         """
@@ -139,9 +198,10 @@ class NewsReport:
         # Group symbols by type first
         symbols_by_type = {}
         
-        for symbol_result in res["quoteResponse"]["result"]:
+        results = res["quoteResponse"]["result"]
+        for symbol_result, quote_fields in zip(results, MARKET_QUOTE_SPEC.extract_many(results)):
             try:
-                data_processed = self._process_symbol_data(symbol_result)
+                data_processed = self._process_symbol_data(symbol_result, quote_fields)
                 if data_processed is not None:
                     symbol = data_processed["ticker"]
                     if symbol not in self.summary_symbols:
@@ -172,25 +232,30 @@ class NewsReport:
         
         return categorized_data
 
-    def _process_symbol_data(self, company: dict) -> dict:
+    def _process_symbol_data(self, company: dict, quote_fields: dict = None) -> dict:
         """
         Process individual symbol data from market summary.
         
         Args:
             company (dict): Company data from market summary
+            quote_fields (dict): The company's MARKET_QUOTE_SPEC fields, if already extracted
             
         Returns:
             dict: Processed symbol data or None if invalid
         """
         try:
+            quote_fields = quote_fields or MARKET_QUOTE_SPEC.extract(company)
+            missing = [name for name in ("price", "abs_change", "percent_change", "change") if quote_fields[name] is None]
+            if missing:
+                raise ValueError(f"missing {missing}")
             symbol_data = {
-                "ticker": company.get("symbol", "N/A"),
+                "ticker": quote_fields["ticker"] or "N/A",
                 "name": "N/A",
                 "type": "N/A",
-                "price": company.get(qf.REGULAR_MARKET_PRICE)["fmt"],
-                "abs_change": company.get(qf.REGULAR_MARKET_CHANGE)["fmt"],
-                "percent_change": company.get(qf.REGULAR_MARKET_CHANGE_PERCENT)["fmt"],
-                "is_positive": float(company.get(qf.REGULAR_MARKET_CHANGE)["raw"]) > 0
+                "price": quote_fields["price"],
+                "abs_change": quote_fields["abs_change"],
+                "percent_change": quote_fields["percent_change"],
+                "is_positive": float(quote_fields["change"]) > 0
             }
             
             return symbol_data
@@ -201,13 +266,32 @@ class NewsReport:
             return None
     
 
-    async def generate_full_json_report(self, report_time: str = 'auto', hours_back: int = 24) -> dict:
+    async def generate_full_json_report(self, report_time: str = 'auto', hours_back: int = 24, stream: bool = True,
+                                        market_channel_id: int = None) -> dict:
         """
         Generate a full JSON report with news and prices data.
+
+        Args:
+            report_time: 'morning', 'evening' or 'auto'
+            hours_back: How many hours of news to read
+            stream: Stream the model output and format news items as they arrive
+            market_channel_id: Post the market summary embed to this channel as soon as the prices arrive,
+                               while the model is still generating the news (send_report_to_discord then skips it)
+
+        Returns:
+            dict: The report, or None if it could not be generated (e.g. the news stream failed midway)
         """
         try:
-            categorized_prices = await self._load_market_summary()
-            news_data = await self._read_and_process_discord_news(hours_back)
+            # Market summary is fetched (and posted) while the model generates the news
+            market_summary_task = asyncio.create_task(self._load_and_post_market_summary(market_channel_id))
+            try:
+                if stream:
+                    news_data = await self._stream_discord_news(hours_back)
+                else:
+                    news_data = await self._read_and_process_discord_news(hours_back)
+                    self.formatted_news = [self._format_news_line(news) for news in news_data]
+            finally:
+                categorized_prices = await market_summary_task
             report_time = self._get_report_time(report_time)
             
             hebrew_report_time = "בוקר" if report_time == "morning" else "ערב"
@@ -252,6 +336,51 @@ class NewsReport:
             logger.error(f"❌ Error sending report to server: {e}")
             return None
         
+    async def send_market_summary_to_discord(self, channel_id: int, categorized_prices: dict) -> bool:
+        """
+        Create and send the market summary embed
+
+        Returns:
+            bool: True if the embed was sent
+        """
+        try:
+            # Create embed
+            market_embed = discord.Embed(
+                title="📊 תנועות שוק נכון לעכשיו",
+                color=Config.COLORS.GREEN
+            )
+
+            # Emoji mappings for categories
+            category_emojis = {
+                "index": "📈",
+                "index_futures": "📈",
+                "commodity": "💎",
+                "crypto": "🚀"
+            }
+
+            # Process each category
+            for category in categorized_prices.get("categories", []):
+                symbols = category.get("symbols", [])
+                if symbols:  # Only process if category has symbols
+                    category_type = category.get("category_type")
+                    hebrew_type = category.get("category_hebrew_type", category_type)
+                    emoji = category_emojis.get(category_type, "📊")
+                    header = f"{emoji} **{hebrew_type}**"
+                    market_embed.add_field(name=header, value="", inline=False)
+
+                    for symbol in symbols[:6]:  # Limit to 6 per category
+                        change_emoji = "🟢" if symbol.get("is_positive", False) else "🔴"
+                        field_name = f"{change_emoji} {symbol.get('name', 'N/A')}"
+                        field_value = f"{symbol.get('price', 'N/A')}\n{symbol.get('percent_change', 'N/A')}"
+                        market_embed.add_field(name=field_name, value=field_value, inline=True)
+
+            # Send market embed
+            await get_message_dispatcher(self.discord_bot).send(channel_id, [market_embed], error_context="send_report_to_discord")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error sending market summary to discord: {e}")
+            return False
+
     async def send_report_to_discord(self, channel_id: int, notification_role: str):
         """
         Create and send embeds with the report data to Discord
@@ -260,46 +389,13 @@ class NewsReport:
             if not self.full_report:
                 logger.error(f"❌ use first generate_full_json_report before sending to discord")
                 return None
-        
-            
-            # Create market data summary embed with inline fields
+
+
+            # Market summary embed, unless generate_full_json_report already posted it
             categorized_prices = self.full_report.get("market_summary_prices", {})
-            if categorized_prices:
-                # Create embed
-                market_embed = discord.Embed(
-                    title="📊 תנועות שוק נכון לעכשיו",
-                    color=Config.COLORS.GREEN
-                )
-                
-                # Emoji mappings for categories
-                category_emojis = {
-                    "index": "📈",
-                    "index_futures": "📈",
-                    "commodity": "💎", 
-                    "crypto": "🚀"
-                }
-                
-                # Process each category
-                for category in categorized_prices.get("categories", []):
-                    symbols = category.get("symbols", [])
-                    if symbols:  # Only process if category has symbols
-                        category_type = category.get("category_type")
-                        hebrew_type = category.get("category_hebrew_type", category_type)
-                        emoji = category_emojis.get(category_type, "📊")
-                        header = f"{emoji} **{hebrew_type}**"
-                        market_embed.add_field(name=header, value="", inline=False)
-                        
-                        for symbol in symbols[:6]:  # Limit to 6 per category
-                            change_emoji = "🟢" if symbol.get("is_positive", False) else "🔴"
-                            field_name = f"{change_emoji} {symbol.get('name', 'N/A')}"
-                            field_value = f"{symbol.get('price', 'N/A')}\n{symbol.get('percent_change', 'N/A')}"
-                            market_embed.add_field(name=field_name, value=field_value, inline=True)
-                
-                # Send market embed
-                channel = self.discord_bot.get_channel(channel_id)
-                if channel:
-                    await channel.send(embed=market_embed)
-            
+            if categorized_prices and not self.market_summary_posted:
+                await self.send_market_summary_to_discord(channel_id, categorized_prices)
+
             link_to_report = await self.send_report_to_server()
             # Create news summary embed
             news_data = self.full_report.get("news_data", [])
@@ -307,26 +403,11 @@ class NewsReport:
                 news_summary = "📰 **חדשות אחרונות:**\n\n"
                 news_summary += f"[קישור לקריאה נוחה של החדשות באתר האינטרנט]({link_to_report})\n\n"
 
-                for i, news in enumerate(news_data, 1):  
-                    message = news.get('message', 'N/A')
-                    time = news.get('time', 'N/A')
-                    links = news.get('links', [])
-                    
-                    news_summary += f"{i}. {message}"
-                    if time != 'N/A':
-                        news_summary += f" **({time})**"
-                    
-                    # Handle multiple links
-                    if links:
-                        # New format with multiple links
-                        link_texts = []
-                        for j, link_url in enumerate(links, 1):
-                            if link_url:
-                                link_texts.append(f"[קישור {j}]({link_url})")
-                        if link_texts:
-                            news_summary += f"\n{' | '.join(link_texts)}"  # New line with pipe separator between links
-                    
-                    news_summary += "\n\n"
+                formatted_news = self.formatted_news
+                if len(formatted_news) != len(news_data):
+                    formatted_news = [self._format_news_line(news) for news in news_data]
+                for i, news_line in enumerate(formatted_news, 1):
+                    news_summary += f"{i}. {news_line}\n\n"
                 
                 
                 await send_embed_message(
@@ -335,11 +416,11 @@ class NewsReport:
                     message=news_summary,
                     color=Config.COLORS.ORANGE,
                     title="📰 חדשות פיננסיות",
-                    error_context="send_report_to_discord"
+                    error_context="send_report_to_discord",
+                    mention_role=notification_role
                 )
-            
-            # Send role mention last
-            await send_mention_message(self.discord_bot, channel_id, notification_role)
+            else:
+                await send_mention_message(self.discord_bot, channel_id, notification_role)
             
             logger.info(f"✅ Successfully sent report to Discord")
             return True
@@ -4,23 +4,40 @@ Discord Scheduler - APScheduler-based scheduler with Discord integration and tas
 
 import asyncio
 import discord
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone as dt_timezone
 from typing import Optional, Callable, Union, List
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.util import obj_to_ref, ref_to_obj
+from apscheduler.events import EVENT_JOB_SUBMITTED, EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES
 from utils.logger import logger
 from config import Config
 import pytz
 from .job_summary import JobSummary
+from .job_metrics import get_job_metrics
+from .scheduler_manager import get_scheduler, set_scheduler
+from db.engine import engine, get_db_sync
+from db.init_db import init_db
+from db.models.scheduler_state import SchedulerState
 from discord_utils import send_embed_message, send_mention_message
-from time import time
+from time import perf_counter
 from bot_manager import get_bot
 
 
+async def run_scheduled_job(**job_kwargs):
+    """Entry point of every scheduled job (a module function, so stored jobs can reference it)"""
+    scheduler = get_scheduler()
+    if scheduler is None:
+        logger.error(f"❌ No scheduler instance to run job {job_kwargs.get('job_id')}")
+        return None
+    return await scheduler.run_job(**job_kwargs)
+
+
 class CoreScheduler:
     """APScheduler-based scheduler with Discord integration"""
     
@@ -32,12 +49,20 @@ class CoreScheduler:
         self.timezone = pytz.timezone(timezone)
         self.post_event_delay = post_event_delay  # Delay in seconds for post-event updates
         self.job_summary = JobSummary(timezone)
+        self.job_metrics = get_job_metrics()
         self.schedule = schedule
         
-        # Configure APScheduler
-        jobstores = {
-            'default': MemoryJobStore()
-        }
+        # Configure APScheduler - jobs are kept in the bot DB, so a restart restores today's jobs
+        self.persistent = Config.JOB_STORE.PERSISTENT
+        if self.persistent:
+            init_db()
+            jobstores = {
+                'default': SQLAlchemyJobStore(engine=engine, tablename=Config.JOB_STORE.TABLE_NAME)
+            }
+        else:
+            jobstores = {
+                'default': MemoryJobStore()
+            }
         executors = {
             'default': AsyncIOExecutor()
         }
@@ -54,18 +79,93 @@ class CoreScheduler:
             timezone=self.timezone
         )
         
-        # Add job listeners for better monitoring
-        self.scheduler.add_listener(self._job_listener, mask=1 | 2 | 4096)  # Only listen to specific events
+        # Lateness, misfires and crashes the job runner can't see
+        self.scheduler.add_listener(
+            self._job_listener,
+            mask=EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+        )
         
         self.running = False
+        # Stored jobs run through the global scheduler
+        set_scheduler(self)
     
+    def _send_alert(self, message: str):
+        """Post a scheduler alert to the dev channel without blocking the caller"""
+        try:
+            asyncio.get_running_loop().create_task(
+                send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, message, Config.COLORS.RED, "🔧 Scheduler Alert")
+            )
+        except RuntimeError:
+            logger.debug(f"No running loop for scheduler alert: {message}")
+
+    def _func_ref(self, func: Callable) -> str:
+        """Textual reference of a job function, so the job can be stored (scheduler methods are 'self:<name>')"""
+        if getattr(func, "__self__", None) is self:
+            return f"self:{func.__name__}"
+        return obj_to_ref(func)
+
+    def _resolve_func(self, func_ref: str) -> Callable:
+        if func_ref.startswith("self:"):
+            return getattr(self, func_ref[len("self:"):])
+        return ref_to_obj(func_ref)
+
+    def _job_kwargs(self, func: Callable, job_id: str, args: tuple = None, kwargs: dict = None,
+                    send_alert: bool = True, slo_seconds: float = None, one_time: bool = False) -> dict:
+        """Arguments of run_scheduled_job for a job (everything must be picklable for the job store)"""
+        return {
+            "job_id": job_id,
+            "func_ref": self._func_ref(func),
+            "args": tuple(args or ()),
+            "kwargs": dict(kwargs or {}),
+            "send_alert": send_alert,
+            "slo_seconds": slo_seconds,
+            "one_time": one_time,
+        }
+
+    async def run_job(self, job_id: str, func_ref: str, args: tuple, kwargs: dict,
+                      send_alert: bool = True, slo_seconds: float = None, one_time: bool = False):
+        """
+        Run a scheduled function
+
+        Each run is timed and recorded in the job metrics. The dev channel only gets an
+        alert when the run fails or breaks its SLO, successful runs go to the periodic summary.
+
+        Args:
+            job_id: Unique job identifier
+            func_ref: Function reference from _func_ref
+            args: Function arguments
+            kwargs: Function keyword arguments
+            send_alert: Whether failures and SLO breaches are posted to the dev channel
+            slo_seconds: Run time budget (default: Config.JOB_METRICS.SLO_DURATION_SECONDS)
+            one_time: Date job, removed from the job summary when it starts
+        """
+        if one_time:
+            self._remove_date_job_from_summary(job_id)
+        started = perf_counter()
+        result = None
+        error = None
+        try:
+            result = await self._resolve_func(func_ref)(*args, **kwargs)
+        except Exception as e:
+            error = e
+            logger.error(f"❌ Job failed {job_id}: {e}")
+
+        duration = perf_counter() - started
+        alert = self.job_metrics.record_run(job_id, duration, error, slo_seconds)
+        if error is None:
+            logger.debug(f"✅ Job {job_id} completed in {duration:.2f}s")
+        if alert and send_alert:
+            self._send_alert(alert)
+        return result
+
     def add_cron_job(self, 
                      func: Callable, 
                      cron_expression: str, 
                      job_id: str,
                      args: tuple = None,
                      kwargs: dict = None,
-                     send_alert: bool = True) -> bool:
+                     send_alert: bool = True,
+                     slo_seconds: float = None) -> bool:
         """
         Add a cron-based job
         
@@ -75,7 +175,8 @@ class CoreScheduler:
             job_id: Unique job identifier
             args: Function arguments
             kwargs: Function keyword arguments
-            send_alert: Whether to send Discord alert
+            send_alert: Whether to alert the dev channel on failure or SLO breach
+            slo_seconds: Run time budget (default: Config.JOB_METRICS.SLO_DURATION_SECONDS)
         """
         try:
             # Check if job already exists
@@ -83,33 +184,11 @@ class CoreScheduler:
             if existing_job:
                 logger.warning(f"⚠️ Job {job_id} already exists, replacing it")
             
-            async def wrapped_func():
-                try:
-                    if args and kwargs:
-                        result = await func(*args, **kwargs)
-                    elif args:
-                        result = await func(*args)
-                    elif kwargs:
-                        result = await func(**kwargs)
-                    else:
-                        result = await func()
-                    
-                    if send_alert:
-                        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, f"✅ **{job_id}** completed successfully", Config.COLORS.GREEN, "🔧 Scheduler Alert")
-                    
-                    return result
-                    
-                except Exception as e:
-                    error_msg = f"❌ **{job_id}** failed: {str(e)}"
-                    logger.error(f"Job failed {job_id}: {e}")
-                    
-                    if send_alert:
-                        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, error_msg, Config.COLORS.RED, "🔧 Scheduler Alert")
-            
             self.scheduler.add_job(
-                wrapped_func,
+                run_scheduled_job,
                 CronTrigger.from_crontab(cron_expression, timezone=self.timezone),
                 id=job_id,
+                kwargs=self._job_kwargs(func, job_id, args, kwargs, send_alert, slo_seconds),
                 replace_existing=True
             )
             
@@ -135,7 +214,8 @@ class CoreScheduler:
                      job_id: str,
                      args: tuple = None,
                      kwargs: dict = None,
-                     send_alert: bool = True) -> bool:
+                     send_alert: bool = True,
+                     slo_seconds: float = None) -> bool:
         """
         Add a one-time job for a specific date/time
         
@@ -145,7 +225,8 @@ class CoreScheduler:
             job_id: Unique job identifier
             args: Function arguments
             kwargs: Function keyword arguments
-            send_alert: Whether to send Discord alert
+            send_alert: Whether to alert the dev channel on failure or SLO breach
+            slo_seconds: Run time budget (default: Config.JOB_METRICS.SLO_DURATION_SECONDS)
         """
         try:
             # Check if run_date is in the past
@@ -169,36 +250,11 @@ class CoreScheduler:
                 except ValueError:
                     pass  # Continue with original logic if parsing fails
             
-            async def wrapped_func():
-                try:
-                    # Remove one-time jobs from summary when they start
-                    self._remove_date_job_from_summary(job_id)
-                    
-                    if args and kwargs:
-                        result = await func(*args, **kwargs)
-                    elif args:
-                        result = await func(*args)
-                    elif kwargs:
-                        result = await func(**kwargs)
-                    else:
-                        result = await func()
-                    
-                    if send_alert:
-                        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, f"✅ **{job_id}** completed successfully", Config.COLORS.GREEN, "🔧 Scheduler Alert")
-                    
-                    return result
-                    
-                except Exception as e:
-                    error_msg = f"❌ **{job_id}** failed: {str(e)}"
-                    logger.error(f"One-time job failed {job_id}: {e}")
-                    
-                    if send_alert:
-                        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, error_msg, Config.COLORS.RED, "🔧 Scheduler Alert")
-            
             self.scheduler.add_job(
-                wrapped_func,
+                run_scheduled_job,
                 DateTrigger(run_date=run_date),
                 id=job_id,
+                kwargs=self._job_kwargs(func, job_id, args, kwargs, send_alert, slo_seconds, one_time=True),
                 replace_existing=True
             )
             
@@ -221,7 +277,8 @@ class CoreScheduler:
                         seconds: int = 60,
                         args: tuple = None,
                         kwargs: dict = None,
-                        send_alert: bool = True) -> bool:
+                        send_alert: bool = True,
+                        slo_seconds: float = None) -> bool:
         """
         Add an interval-based job
         
@@ -231,36 +288,15 @@ class CoreScheduler:
             job_id: Unique job identifier
             args: Function arguments
             kwargs: Function keyword arguments
-            send_alert: Whether to send Discord alert
+            send_alert: Whether to alert the dev channel on failure or SLO breach
+            slo_seconds: Run time budget (default: Config.JOB_METRICS.SLO_DURATION_SECONDS)
         """
         try:
-            async def wrapped_func():
-                try:
-                    if args and kwargs:
-                        result = await func(*args, **kwargs)
-                    elif args:
-                        result = await func(*args)
-                    elif kwargs:
-                        result = await func(**kwargs)
-                    else:
-                        result = await func()
-                    
-                    if send_alert:
-                        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, f"✅ **{job_id}** completed successfully", Config.COLORS.GREEN, "🔧 Scheduler Alert")
-                    
-                    return result
-                    
-                except Exception as e:
-                    error_msg = f"❌ **{job_id}** failed: {str(e)}"
-                    logger.error(f"Interval job failed {job_id}: {e}")
-                    
-                    if send_alert:
-                        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, error_msg, Config.COLORS.RED, "🔧 Scheduler Alert")
-            
             self.scheduler.add_job(
-                wrapped_func,
+                run_scheduled_job,
                 IntervalTrigger(seconds=seconds),
                 id=job_id,
+                kwargs=self._job_kwargs(func, job_id, args, kwargs, send_alert, slo_seconds),
                 replace_existing=True
             )
             
@@ -277,6 +313,37 @@ class CoreScheduler:
             logger.error(f"❌ Failed to add interval job {job_id}: {e}")
             return False
     
+    def is_done_today(self, key: str) -> bool:
+        """Check if a daily step (e.g. the gatekeeper) already ran today and its jobs are stored"""
+        if not self.persistent:
+            return False
+        db = get_db_sync()
+        try:
+            state = db.get(SchedulerState, key)
+            return state is not None and state.value == datetime.now(self.timezone).strftime("%Y-%m-%d")
+        except Exception as e:
+            logger.error(f"❌ Error reading scheduler state {key}: {e}")
+            return False
+        finally:
+            db.close()
+
+    def mark_done_today(self, key: str):
+        """Store that a daily step ran today, so a restart later today restores its jobs instead of running it again"""
+        if not self.persistent:
+            return
+        db = get_db_sync()
+        try:
+            db.merge(SchedulerState(
+                key=key,
+                value=datetime.now(self.timezone).strftime("%Y-%m-%d"),
+                updated_at=datetime.now(dt_timezone.utc).replace(tzinfo=None),
+            ))
+            db.commit()
+        except Exception as e:
+            logger.error(f"❌ Error storing scheduler state {key}: {e}")
+        finally:
+            db.close()
+
     def remove_job(self, job_id: str) -> bool:
         """Remove a job by ID"""
         try:
@@ -313,6 +380,7 @@ class CoreScheduler:
             self.scheduler.start()
             self.running = True
             logger.info("🚀 Discord Scheduler started")
+            self._sync_stored_jobs()
             
             # Generate and send job summary to dev channel
             summary = self.generate_job_summary()
@@ -328,6 +396,27 @@ class CoreScheduler:
         else:
             logger.warning("⚠️ Scheduler is already running, ignoring start request")
     
+    def _sync_stored_jobs(self):
+        """Track the date jobs restored from the job store, drop stored recurring jobs that were not set up again"""
+        tracked = {job['id'] for job in self.job_summary.jobs_added}
+        restored = 0
+        for job in self.get_jobs():
+            if job.id in tracked:
+                continue
+            if isinstance(job.trigger, DateTrigger):
+                self.job_summary.add_job({
+                    'id': job.id,
+                    'type': 'date',
+                    'run_date': str(job.trigger.run_date),
+                    'timezone': str(self.timezone)
+                })
+                restored += 1
+            else:
+                logger.info(f"🗑️ Dropping stored job that is no longer scheduled: {job.id}")
+                self.remove_job(job.id)
+        if restored:
+            logger.info(f"♻️ Restored {restored} one-time jobs from the job store")
+    
     def stop(self):
         """Stop the scheduler"""
         if self.running:
@@ -369,41 +458,39 @@ class CoreScheduler:
             ]
         }
     
+    async def send_metrics_summary(self):
+        """Send the job metrics since the last summary to the dev channel (nothing if no job ran)"""
+        summary = self.job_metrics.format_summary()
+        if summary is None:
+            logger.debug("No job runs since the last metrics summary")
+            return
+        await send_embed_message(self.bot, Config.CHANNEL_IDS.DEV, summary, Config.COLORS.BLUE, "🔧 Scheduler Summary")
+
     def _job_listener(self, event):
-        """Handle job events for monitoring"""
+        """Record run lateness and misfires, log crashes that got past the job runner"""
         try:
-            event_code = getattr(event, 'code', None)
-            
-            # Only process job execution events
-            if event_code == 1:  # EVENT_JOB_EXECUTED
-                # Get job ID from the job object
-                job_id = 'unknown'
-                if hasattr(event, 'job') and event.job and hasattr(event.job, 'id'):
-                    job_id = event.job.id
-                
-                # Only log if we have a valid job ID
-                if job_id != 'unknown':
-                    logger.info(f"🚀 Starting job: {job_id}")
-                
-            elif event_code == 2:  # EVENT_JOB_ERROR
-                job_id = 'unknown'
-                if hasattr(event, 'job') and event.job and hasattr(event.job, 'id'):
-                    job_id = event.job.id
-                exception = getattr(event, 'exception', 'unknown error')
-                logger.error(f"❌ Job failed: {job_id} - {exception}")
-                
-            elif event_code == 4096:  # EVENT_JOB_MISSED
-                job_id = 'unknown'
-                if hasattr(event, 'job') and event.job and hasattr(event.job, 'id'):
-                    job_id = event.job.id
-                scheduled_time = getattr(event, 'scheduled_run_time', 'unknown')
-                # Only log significant delays (more than 30 seconds)
-                current_time = datetime.now(self.timezone)
-                if hasattr(scheduled_time, 'replace'):
-                    delay = (current_time - scheduled_time.replace(tzinfo=self.timezone)).total_seconds()
-                    if delay > 30:
-                        logger.warning(f"⚠️ Job significantly delayed: {job_id} - {delay:.1f}s late")
-                
+            job_id = getattr(event, 'job_id', 'unknown')
+            alert = None
+
+            if event.code == EVENT_JOB_SUBMITTED:
+                scheduled_time = event.scheduled_run_times[-1]
+                lateness = (datetime.now(self.timezone) - scheduled_time).total_seconds()
+                alert = self.job_metrics.record_start(job_id, lateness)
+
+            elif event.code == EVENT_JOB_MISSED:
+                alert = self.job_metrics.record_misfire(job_id, f"missed {event.scheduled_run_time.strftime('%H:%M:%S')} (past the grace time)")
+
+            elif event.code == EVENT_JOB_MAX_INSTANCES:
+                alert = self.job_metrics.record_misfire(job_id, "previous runs still in progress")
+
+            elif event.code == EVENT_JOB_ERROR:
+                logger.error(f"❌ Job failed: {job_id} - {event.exception}")
+
+            elif event.code == EVENT_JOB_EXECUTED:
+                logger.debug(f"🏁 Job finished: {job_id}")
+
+            if alert:
+                self._send_alert(alert)
+
         except Exception as e:
             logger.debug(f"Error in job listener: {e}")
-
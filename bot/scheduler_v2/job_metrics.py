@@ -0,0 +1,202 @@
+"""
+Job Metrics - In-process registry of scheduler job runs
+
+Every job run goes through the CoreScheduler job runner, which records its duration and
+outcome here, and the scheduler listener records how late each run started and the runs
+that were missed. Jobs are grouped by name (the job id without trailing time parts, so
+economic_update_14_30 counts as economic_update). The registry decides when a run needs
+an immediate alert (failure or SLO breach) and formats the periodic summary and the
+/scheduler stats view.
+"""
+
+import re
+import time
+from collections import deque
+from utils.logger import logger
+from utils.stats import percentile
+from config import Config
+
+_TIME_SUFFIX = re.compile(r"(_\d+)+$")
+
+
+def job_name(job_id: str) -> str:
+    """Group job ids that only differ by a trailing time (economic_update_14_30 -> economic_update)"""
+    return _TIME_SUFFIX.sub("", job_id) or job_id
+
+
+def _format_seconds(seconds) -> str:
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.1f}s"
+
+
+class JobStats:
+    """Counters and recent durations/lateness of one job"""
+    COUNTERS = ("runs", "failures", "misfires", "slo_breaches")
+
+    def __init__(self, max_samples: int):
+        self.totals = dict.fromkeys(self.COUNTERS, 0)
+        self.period = dict.fromkeys(self.COUNTERS, 0)  # Since the last summary
+        self.durations = deque(maxlen=max_samples)  # Seconds
+        self.lateness = deque(maxlen=max_samples)  # Seconds
+        self.last_error = None
+        self.last_alert_at = 0.0
+        self.suppressed_alerts = 0
+
+    def count(self, counter: str):
+        self.totals[counter] += 1
+        self.period[counter] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            **self.totals,
+            "p50_s": percentile(self.durations, 50),
+            "p95_s": percentile(self.durations, 95),
+            "late_p95_s": percentile(self.lateness, 95),
+            "last_error": self.last_error,
+        }
+
+
+class JobMetrics:
+    def __init__(self, config=None):
+        """
+        Initialize JobMetrics
+
+        Args:
+            config: Metrics settings (default: Config.JOB_METRICS)
+        """
+        self.config = config or Config.JOB_METRICS
+        self.jobs = {}  # job name -> JobStats
+
+    def _get_stats(self, job_id: str) -> JobStats:
+        name = job_name(job_id)
+        stats = self.jobs.get(name)
+        if stats is None:
+            stats = self.jobs[name] = JobStats(self.config.SAMPLES)
+        return stats
+
+    def _alert(self, stats: JobStats, message: str):
+        """Return the alert message, or None while the job's alert cooldown runs"""
+        now = time.monotonic()
+        if stats.last_alert_at and now - stats.last_alert_at < self.config.ALERT_COOLDOWN_SECONDS:
+            stats.suppressed_alerts += 1
+            return None
+        stats.last_alert_at = now
+        return message
+
+    def record_run(self, job_id: str, duration: float, error: Exception = None, slo_seconds: float = None):
+        """
+        Record a finished run
+
+        Args:
+            job_id: Scheduler job id
+            duration: Run time in seconds
+            error: Exception raised by the job, if it failed
+            slo_seconds: Run time budget (default: config SLO_DURATION_SECONDS)
+
+        Returns:
+            str: Alert message for a failure or SLO breach, None if no alert is due
+        """
+        stats = self._get_stats(job_id)
+        stats.count("runs")
+        stats.durations.append(duration)
+        if error is not None:
+            stats.count("failures")
+            stats.last_error = f"{type(error).__name__}: {error}"[:200]
+            return self._alert(stats, f"❌ **{job_id}** failed after {_format_seconds(duration)}: {error}")
+
+        slo_seconds = slo_seconds or self.config.SLO_DURATION_SECONDS
+        if duration > slo_seconds:
+            stats.count("slo_breaches")
+            return self._alert(stats, f"🐢 **{job_id}** took {_format_seconds(duration)} (SLO {_format_seconds(slo_seconds)})")
+        return None
+
+    def record_start(self, job_id: str, lateness: float):
+        """
+        Record how late a run started
+
+        Returns:
+            str: Alert message when the lateness breaches the SLO, None otherwise
+        """
+        stats = self._get_stats(job_id)
+        stats.lateness.append(max(lateness, 0.0))
+        if lateness > self.config.SLO_LATENESS_SECONDS:
+            stats.count("slo_breaches")
+            logger.warning(f"⚠️ Job significantly delayed: {job_id} - {lateness:.1f}s late")
+            return self._alert(stats, f"⏰ **{job_id}** started {_format_seconds(lateness)} late")
+        return None
+
+    def record_misfire(self, job_id: str, reason: str):
+        """
+        Record a run that did not happen (missed its grace time or hit max instances)
+
+        Returns:
+            str: Alert message, None while the job's alert cooldown runs
+        """
+        stats = self._get_stats(job_id)
+        stats.count("misfires")
+        logger.warning(f"⚠️ Job run skipped: {job_id} - {reason}")
+        return self._alert(stats, f"⚠️ **{job_id}** run skipped: {reason}")
+
+    def get_stats(self) -> dict:
+        """
+        Get per-job metrics since startup
+
+        Returns:
+            dict: job name -> runs, failures, misfires, slo_breaches, p50/p95 duration and p95 lateness (seconds), last_error
+        """
+        return {name: stats.to_dict() for name, stats in self.jobs.items()}
+
+    def format_stats(self) -> str:
+        """Format the per-job metrics for /scheduler stats"""
+        if not self.jobs:
+            return "No jobs ran yet"
+        lines = []
+        for name, stats in sorted(self.get_stats().items()):
+            line = (f"• `{name}` {stats['runs']} runs, p50 {_format_seconds(stats['p50_s'])}, "
+                    f"p95 {_format_seconds(stats['p95_s'])}, late p95 {_format_seconds(stats['late_p95_s'])}")
+            problems = [f"{stats[counter]} {label}" for counter, label in
+                        (("failures", "failed"), ("misfires", "missed"), ("slo_breaches", "over SLO")) if stats[counter]]
+            if problems:
+                line += " ⚠️ " + ", ".join(problems)
+            lines.append(line)
+        return "\n".join(lines)
+
+    def format_summary(self) -> str:
+        """
+        Format the runs since the last summary and start a new period
+
+        Returns:
+            str: Summary text, None if no job ran or missed a run in the period
+        """
+        lines = []
+        for name, stats in sorted(self.jobs.items()):
+            period = stats.period
+            if not (period["runs"] or period["misfires"]):
+                continue
+            line = f"• `{name}` {period['runs']} runs, p95 {_format_seconds(percentile(stats.durations, 95))}"
+            if period["failures"] or period["misfires"] or period["slo_breaches"]:
+                line += f" ⚠️ {period['failures']} failed, {period['misfires']} missed, {period['slo_breaches']} over SLO"
+            if stats.suppressed_alerts:
+                line += f" ({stats.suppressed_alerts} alerts held back)"
+            lines.append(line)
+            stats.period = dict.fromkeys(JobStats.COUNTERS, 0)
+            stats.suppressed_alerts = 0
+        return "\n".join(lines) if lines else None
+
+
+# Global job metrics instance
+_job_metrics = None
+
+
+def get_job_metrics() -> JobMetrics:
+    """
+    Get or create the global job metrics instance
+
+    Returns:
+        JobMetrics: Global job metrics instance
+    """
+    global _job_metrics
+    if _job_metrics is None:
+        _job_metrics = JobMetrics()
+    return _job_metrics
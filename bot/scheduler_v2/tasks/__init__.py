@@ -10,8 +10,12 @@ from .economic_calendar import (
     economic_warning_task,
     economic_update_task
 )
+from .dev_digest import (
+    dev_digest_task
+)
 
 __all__ = [
     'news_report_task',
     'schedule_economic_calendar_task', 'economic_warning_task', 'economic_update_task',
+    'dev_digest_task',
 ] 
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""
+Dev Digest Tasks Package
+"""
+
+from .dev_digest_task import dev_digest_task
+
+__all__ = [
+    'dev_digest_task'
+] 
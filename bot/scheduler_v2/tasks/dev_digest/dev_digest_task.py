@@ -0,0 +1,43 @@
+"""
+Dev Digest Task - Sends the daily usage digest to the dev channel
+"""
+
+from utils.logger import logger
+from ai_tools.llm_usage import format_daily_digest
+from scrapers.http_client import get_http_client
+from utils.concurrency_groups import format_concurrency_stats
+from scrapers.yf.quote_cache import get_quote_cache
+from scrapers.investing.calendar_cache import get_calendar_cache
+from scheduler_v2.tasks.economic_calendar.economic_release_watcher import format_release_latencies
+from config import Config
+from discord_utils import send_embed_message
+from bot_manager import get_bot
+
+
+async def dev_digest_task():
+    """Send today's LLM usage roll-up, scraper, cache and release latency metrics to the dev channel"""
+    try:
+        bot = get_bot()
+        if not bot:
+            logger.error("❌ No Discord bot instance available")
+            return
+
+        logger.info("🧾 Sending dev digest...")
+        digest = format_daily_digest()
+        digest += "\n\n**🌐 HTTP (since startup)**\n" + get_http_client().format_stats()
+        digest += "\n\n**⏱️ Endpoint tail latency (since startup)**\n" + get_http_client().format_endpoint_stats()
+        digest += "\n\n**💾 Quote cache (since startup)**\n" + get_quote_cache().format_stats()
+        digest += "\n\n**📅 Calendar parses (since startup)**\n" + get_calendar_cache().format_stats()
+        digest += "\n\n**⏱️ Economic release latency**\n" + format_release_latencies()
+        digest += "\n\n**🚦 Concurrency groups (since startup)**\n" + format_concurrency_stats()
+        await send_embed_message(
+            bot,
+            Config.CHANNEL_IDS.DEV,
+            digest,
+            Config.COLORS.BLUE,
+            "🧾 Daily Dev Digest"
+        )
+        logger.info("✅ dev digest sent")
+
+    except Exception as e:
+        logger.error(f"❌ Error in dev digest: {e}")
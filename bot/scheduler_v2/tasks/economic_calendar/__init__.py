@@ -5,7 +5,9 @@ Economic Calendar Tasks Package
 from .economic_calendar_daily_task import schedule_economic_calendar_task
 from .economic_warning_task import economic_warning_task
 from .economic_update_task import economic_update_task
+from .economic_release_watcher import EconomicReleaseWatcher, get_release_watcher, format_release_latencies
 
 __all__ = [
-    'schedule_economic_calendar_task', 'economic_warning_task', 'economic_update_task'
+    'schedule_economic_calendar_task', 'economic_warning_task', 'economic_update_task',
+    'EconomicReleaseWatcher', 'get_release_watcher', 'format_release_latencies'
 ] 
\ No newline at end of file
@@ -11,7 +11,7 @@ from scrapers import InvestingScraper, InvestingParams, economic_calendar_to_tex
 from config import Config
 from .economic_warning_task import economic_warning_task
 from .economic_update_task import economic_update_task
-from discord_utils import send_embed_message, send_mention_message
+from discord_utils import send_embed_message
 from bot_manager import get_bot
 from scheduler_v2.scheduler_manager import get_scheduler
 
@@ -62,6 +62,7 @@ async def schedule_economic_calendar_task():
         
         # Schedule alerts for each unique time
         await _schedule_economic_alerts(unique_times, calendar_data, discord_scheduler)
+        discord_scheduler.mark_done_today("economic_calendar")
 
     except Exception as e:
         logger.error(f"❌ Error in economic calendar task: {e}")
@@ -78,11 +79,9 @@ async def _send_tasks_initial_summary(calendar_data: pd.DataFrame, bot, discord_
         summary_msg = economic_calendar_to_text(calendar_data)
         
         # Send to alert channel using send_message
-        await send_embed_message(bot, Config.CHANNEL_IDS.ECONOMIC_CALENDAR, summary_msg, Config.COLORS.GREEN, "Economic Events For Today")
-        
-        # Send role mention as separate text message
+        # Role mention goes in the same message as the embeds
         economic_role = Config.NOTIFICATION_ROLES.ECONOMIC_CALENDAR
-        await send_mention_message(bot, Config.CHANNEL_IDS.ECONOMIC_CALENDAR, economic_role)
+        await send_embed_message(bot, Config.CHANNEL_IDS.ECONOMIC_CALENDAR, summary_msg, Config.COLORS.GREEN, "Economic Events For Today", mention_role=economic_role)
 
         logger.debug(f"📊 Sent initial calendar summary")
     except Exception as e:
@@ -133,7 +132,8 @@ async def _schedule_alert_at_time(time_str: str, calendar_data: pd.DataFrame, di
                     func=economic_warning_task,
                     run_date=warning_time,
                     job_id=f"economic_warning_{time_str.replace(':', '_')}",
-                    args=(time_str, time_events)
+                    # Event names only, job arguments are stored with the job
+                    args=(time_str, time_events['description'].fillna('Unknown Event').tolist())
                 )
                 jobs_added.append({
                     'id': f"economic_warning_{time_str.replace(':', '_')}",
@@ -141,14 +141,20 @@ async def _schedule_alert_at_time(time_str: str, calendar_data: pd.DataFrame, di
                     'type': 'warning'
                 })
             
-            # Schedule update task (after event) - only if event hasn't passed
-            update_time = event_datetime + timedelta(seconds=discord_scheduler.post_event_delay)
-            if update_time > current_time:
+            # Schedule update task - pre-armed a few seconds before the event, polling starts at the event time
+            pre_arm_seconds = Config.ECONOMIC_RELEASES.PRE_ARM_SECONDS
+            if pre_arm_seconds:
+                update_time = event_datetime - timedelta(seconds=pre_arm_seconds)
+            else:
+                update_time = event_datetime + timedelta(seconds=discord_scheduler.post_event_delay)
+            # Only if the event hasn't passed
+            if event_datetime + timedelta(seconds=discord_scheduler.post_event_delay) > current_time:
+                update_time = max(update_time, current_time + timedelta(seconds=1))
                 discord_scheduler.add_date_job(
                     func=economic_update_task,
                     run_date=update_time,
                     job_id=f"economic_update_{time_str.replace(':', '_')}",
-                    args=(time_str,)
+                    args=(time_str, time_events['description'].fillna('Unknown Event').tolist())
                 )
                 jobs_added.append({
                     'id': f"economic_update_{time_str.replace(':', '_')}",
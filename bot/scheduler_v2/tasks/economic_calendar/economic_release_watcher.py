@@ -0,0 +1,337 @@
+"""
+Economic Release Watcher - One shared poller for all pending economic releases
+
+Update jobs register their release time with the watcher instead of polling on their
+own. Each tick fetches today's calendar once for every pending time, diffs the rows
+against the last seen state and posts each event's actual as soon as it appears.
+Polling is fast right after a release and backs off while nothing changes.
+
+Update jobs are started a few seconds early (pre-armed): the watcher prefetches the
+table to warm the pooled proxy connection, then starts polling exactly at the release
+time. The release-to-Discord latency of every event is stored for the dev digest.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+import pandas as pd
+import pytz
+from utils.logger import logger
+from utils.stats import percentile
+from scrapers import InvestingScraper, InvestingParams, economic_calendar_to_text
+from config import Config
+from discord_utils import send_embed_message
+from bot_manager import get_bot
+
+
+def _event_key(row) -> tuple:
+    return row["time"], row["description"]
+
+
+class PendingRelease:
+    """Events scheduled at one release time"""
+    def __init__(self, time_str: str, release_at: float, deadline: float, event_names: list = None):
+        self.time_str = time_str
+        self.event_names = event_names or []  # Descriptions known from scheduling, posted if no data ever arrives
+        self.release_at = release_at  # monotonic time of the scheduled release
+        self.deadline = deadline  # monotonic time to give up waiting for actuals
+        self.posted = set()  # event keys already posted
+        self.done = asyncio.get_running_loop().create_future()
+
+
+class EconomicReleaseWatcher:
+    def __init__(self, config=None):
+        """
+        Initialize EconomicReleaseWatcher
+
+        Args:
+            config: Polling settings (default: Config.ECONOMIC_RELEASES)
+        """
+        self.config = config or Config.ECONOMIC_RELEASES
+        self.pending = {}  # time_str -> PendingRelease
+        self.last_actuals = {}  # event key -> last seen actual
+        self.worker = None
+        self.post_tasks = set()
+        self.timezone = None
+        self.warmed_at = 0.0  # monotonic time of the last pre-arm prefetch
+
+    async def watch(self, time_str: str, timezone, event_names: list = None) -> bool:
+        """
+        Watch the releases at a time until every event was posted (or the wait timed out)
+
+        Args:
+            time_str: Release time ('HH:MM', as in the calendar)
+            timezone: Timezone of the calendar times (pytz timezone)
+            event_names: Descriptions of the events at time_str, from scheduling
+
+        Returns:
+            bool: True if all actuals were posted, False on timeout
+        """
+        release = self.pending.get(time_str)
+        if release is None:
+            release_dt = timezone.localize(datetime.combine(datetime.now(timezone).date(), datetime.strptime(time_str, "%H:%M").time()))
+            release_at = time.monotonic() + (release_dt - datetime.now(timezone)).total_seconds()
+            deadline = max(release_at, time.monotonic()) + self.config.MAX_WAIT_SECONDS
+            release = self.pending[time_str] = PendingRelease(time_str, release_at, deadline, event_names)
+            logger.info(f"📊 Watching economic releases at {time_str} ({len(self.pending)} pending times)")
+
+        self.timezone = timezone
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self._run())
+        return await asyncio.shield(release.done)
+
+    async def _fetch_calendar(self, scraper: InvestingScraper) -> pd.DataFrame:
+        return await scraper.get_calendar(
+            calendar_name=InvestingParams.CALENDARS.ECONOMIC_CALENDAR,
+            current_tab=InvestingParams.TIME_RANGES.TODAY,
+            importance=InvestingParams.IMPORTANCE.APP_IMPORTANCES,
+            countries=[InvestingParams.COUNTRIES.UNITED_STATES],
+            time_zone=InvestingParams.TIME_ZONES.ISRAEL
+        )
+
+    async def _run(self):
+        scraper = InvestingScraper(proxy=Config.PROXY.APP_PROXY, timezone=self.timezone)
+        interval = self.config.MIN_POLL_INTERVAL
+        try:
+            while self.pending:
+                started = time.monotonic()
+                next_release = min(release.release_at for release in self.pending.values())
+                if started < next_release:
+                    # Pre-armed: warm the proxy connection and the parse cache, then wait for T0
+                    if started - self.warmed_at > self.config.PRE_ARM_SECONDS:
+                        await self._fetch_calendar(scraper)
+                        self.warmed_at = time.monotonic()
+                        logger.debug(f"🔥 Economic watcher pre-armed, release in {next_release - self.warmed_at:.1f}s")
+                    await asyncio.sleep(max(0.0, next_release - time.monotonic()))
+                    interval = self.config.MIN_POLL_INTERVAL
+                    continue
+
+                calendar_data = await self._fetch_calendar(scraper)
+                changed = self._process_tick(calendar_data, time.monotonic())
+
+                # Releases come in clusters - poll fast right after T0 and after a change, back off while nothing moves
+                in_fast_window = any(0 <= started - release.release_at < self.config.FAST_POLL_SECONDS for release in self.pending.values())
+                if changed or in_fast_window:
+                    interval = self.config.MIN_POLL_INTERVAL
+                else:
+                    interval = min(interval * self.config.POLL_BACKOFF, self.config.MAX_POLL_INTERVAL)
+                if self.pending:
+                    await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except Exception as e:
+            logger.error(f"❌ Error in economic release watcher: {e}")
+            for release in list(self.pending.values()):
+                self._post_missing(release, f"watcher crashed: {e}")
+                self._finish(release, False)
+        finally:
+            self.last_actuals.clear()
+
+    def _process_tick(self, calendar_data: pd.DataFrame, now: float) -> bool:
+        """Diff the fetched rows against the last tick, post new actuals and finish completed times"""
+        changed = False
+        for time_str, release in list(self.pending.items()):
+            if now < release.release_at:
+                continue
+            if "time" not in calendar_data.columns:
+                time_events = calendar_data.iloc[0:0]
+            else:
+                time_events = calendar_data[calendar_data["time"] == time_str]
+
+            released = []
+            quiet = []  # Events without a previous value (speeches, auctions...) never get an actual
+            waiting = []
+            for _, row in time_events.iterrows():
+                key = _event_key(row)
+                if key in release.posted:
+                    continue
+                actual = row.get("actual")
+                if pd.notna(actual):
+                    if self.last_actuals.get(key) != actual:
+                        self.last_actuals[key] = actual
+                        changed = True
+                    released.append(row)
+                elif pd.isna(row.get("previous")):
+                    quiet.append(row)
+                else:
+                    waiting.append(row)
+
+            completed = not time_events.empty and not waiting
+            timed_out = now >= release.deadline
+            # Quiet events ride along with the first released actuals
+            to_post = released + quiet if released or completed or timed_out else []
+            if timed_out and not completed:
+                logger.warning(f"⏰ Timeout reached waiting for economic releases at {time_str}")
+                # Post whatever is still missing so the update isn't lost
+                to_post += waiting
+                if not to_post and not release.posted:
+                    self._post_missing(release, "no calendar rows before the deadline")
+            if to_post:
+                release.posted.update(_event_key(row) for row in to_post)
+                self._post(release, pd.DataFrame(to_post), now)
+
+            if completed:
+                logger.info(f"✅ All economic releases at {time_str} posted")
+                self._finish(release, True)
+            elif timed_out:
+                self._finish(release, False)
+        return changed
+
+    def _post(self, release: PendingRelease, events: pd.DataFrame, detected_at: float):
+        task = asyncio.create_task(_send_release_update(release, events, detected_at))
+        self.post_tasks.add(task)
+        task.add_done_callback(self.post_tasks.discard)
+
+    def _post_missing(self, release: PendingRelease, reason: str):
+        """Alert the dev channel and post the scheduled event names of a release that got no data"""
+        task = asyncio.create_task(_send_release_missing(release, reason))
+        self.post_tasks.add(task)
+        task.add_done_callback(self.post_tasks.discard)
+
+    def _finish(self, release: PendingRelease, result: bool):
+        self.pending.pop(release.time_str, None)
+        if not release.done.done():
+            release.done.set_result(result)
+
+
+async def _send_release_update(release: PendingRelease, events: pd.DataFrame, detected_at: float):
+    """Post released events to the economic calendar channel and record their latency"""
+    time_str = release.time_str
+    try:
+        bot = get_bot()
+        if not bot:
+            logger.error("❌ No Discord bot instance available")
+            return
+
+        update_msg = f"📊 **Economic Events Update for {time_str}:**\n"
+        update_msg += economic_calendar_to_text(events)
+        # Role mention goes in the same message as the embeds
+        economic_role = Config.NOTIFICATION_ROLES.ECONOMIC_CALENDAR
+        success = await send_embed_message(bot, Config.CHANNEL_IDS.ECONOMIC_CALENDAR, update_msg, Config.COLORS.GREEN, "Economic Events Update", mention_role=economic_role)
+        post_latency_ms = (time.monotonic() - release.release_at) * 1000
+        logger.info(f"📊 Post-event update sent for {len(events)} events at {time_str} ({post_latency_ms:.0f}ms after release)")
+        record_release_latencies(time_str, events, (detected_at - release.release_at) * 1000, post_latency_ms, bool(success))
+    except Exception as e:
+        logger.error(f"❌ Error sending economic release update for {time_str}: {e}")
+
+
+async def _send_release_missing(release: PendingRelease, reason: str):
+    """Tell the dev channel a release got no data, and post the events known from scheduling without actuals"""
+    time_str = release.time_str
+    posted = {description for _, description in release.posted}
+    missing = [name for name in release.event_names if name not in posted]
+    logger.error(f"❌ Economic releases at {time_str} got no data ({reason}): {missing}")
+    try:
+        bot = get_bot()
+        if not bot:
+            logger.error("❌ No Discord bot instance available")
+            return
+
+        await send_embed_message(bot, Config.CHANNEL_IDS.DEV,
+                                 f"❌ **Economic releases at {time_str} got no data**\nReason: {reason}\nEvents: {', '.join(missing) or 'unknown'}",
+                                 Config.COLORS.RED, "🔧 Economic Release Watcher")
+        if missing:
+            update_msg = f"📊 **Economic Events Update for {time_str}:**\n"
+            update_msg += ", ".join(missing) + "\n(actual values are not available yet)"
+            await send_embed_message(bot, Config.CHANNEL_IDS.ECONOMIC_CALENDAR, update_msg, Config.COLORS.ORANGE, "Economic Events Update")
+    except Exception as e:
+        logger.error(f"❌ Error sending missing economic release notice for {time_str}: {e}")
+
+
+_tables_ready = False
+
+
+def _ensure_tables():
+    global _tables_ready
+    if not _tables_ready:
+        from db.init_db import init_db
+        _tables_ready = init_db()
+
+
+def record_release_latencies(time_str: str, events: pd.DataFrame, detect_latency_ms: float, post_latency_ms: float, success: bool):
+    """Store the release-to-Discord latency of each posted event"""
+    try:
+        from db.engine import get_db_sync
+        from db.models.economic_releases import EconomicReleaseLatency
+
+        _ensure_tables()
+        db = get_db_sync()
+        try:
+            for _, row in events.iterrows():
+                actual = row.get("actual")
+                db.add(EconomicReleaseLatency(
+                    release_time=time_str,
+                    description=str(row.get("description"))[:255],
+                    actual=str(actual)[:50] if pd.notna(actual) else None,
+                    detect_latency_ms=detect_latency_ms if pd.notna(actual) else None,
+                    post_latency_ms=post_latency_ms,
+                    success=success,
+                ))
+            db.commit()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"❌ Error recording economic release latency for {time_str}: {e}")
+
+
+def format_release_latencies(day: str = None, timezone: str = Config.TIMEZONES.APP_TIMEZONE) -> str:
+    """
+    Format one day's release-to-Discord latencies for the dev digest
+
+    Args:
+        day: Date in format yyyy-mm-dd (default: today in the given timezone)
+        timezone: Timezone that defines the day boundaries
+
+    Returns:
+        str: p50/p95 detect and post latency, and the slowest event
+    """
+    tz = pytz.timezone(timezone)
+    if day is None:
+        day = datetime.now(tz).strftime("%Y-%m-%d")
+    day_start = tz.localize(datetime.strptime(day, "%Y-%m-%d"))
+    # Stored timestamps are naive UTC (SQLite CURRENT_TIMESTAMP)
+    start_utc = day_start.astimezone(pytz.utc).replace(tzinfo=None)
+    end_utc = (day_start + timedelta(days=1)).astimezone(pytz.utc).replace(tzinfo=None)
+
+    try:
+        from db.engine import get_db_sync
+        from db.models.economic_releases import EconomicReleaseLatency
+
+        _ensure_tables()
+        db = get_db_sync()
+        try:
+            rows = db.query(EconomicReleaseLatency).filter(
+                EconomicReleaseLatency.created_at >= start_utc,
+                EconomicReleaseLatency.created_at < end_utc,
+                EconomicReleaseLatency.actual.isnot(None)
+            ).all()
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"❌ Error loading economic release latencies for {day}: {e}")
+        return "Failed to load release latencies"
+
+    if not rows:
+        return "No economic releases posted"
+    detect = [row.detect_latency_ms for row in rows if row.detect_latency_ms is not None]
+    post = [row.post_latency_ms for row in rows]
+    slowest = max(rows, key=lambda row: row.post_latency_ms)
+    text = f"{len(rows)} events, detect p50 {percentile(detect, 50) or 0:.0f}ms / p95 {percentile(detect, 95) or 0:.0f}ms, "
+    text += f"post p50 {percentile(post, 50):.0f}ms / p95 {percentile(post, 95):.0f}ms\n"
+    text += f"Slowest: {slowest.release_time} {slowest.description} ({slowest.post_latency_ms:.0f}ms)"
+    return text
+
+
+# Global release watcher instance
+_release_watcher = None
+
+
+def get_release_watcher() -> EconomicReleaseWatcher:
+    """
+    Get or create the global economic release watcher instance
+
+    Returns:
+        EconomicReleaseWatcher: Global release watcher instance
+    """
+    global _release_watcher
+    if _release_watcher is None:
+        _release_watcher = EconomicReleaseWatcher()
+    return _release_watcher
@@ -22,7 +22,10 @@ async def news_report_task(report_time, hours_back):
         logger.info("📰 Generating news report...")
         
         news_report = NewsReport(bot, Config.TIMEZONES.APP_TIMEZONE)
-        await news_report.generate_full_json_report(report_time, hours_back)
+        # The market summary is posted as soon as the prices arrive, the news once the model is done
+        report = await news_report.generate_full_json_report(report_time, hours_back, market_channel_id=Config.CHANNEL_IDS.MARKET_NEWS)
+        if not report:
+            raise RuntimeError("news report generation failed, the news was not published")
         await news_report.send_report_to_discord(Config.CHANNEL_IDS.MARKET_NEWS, Config.NOTIFICATION_ROLES.NEWS_REPORT)
 
         
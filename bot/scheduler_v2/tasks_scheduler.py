@@ -5,11 +5,12 @@ Task Manager - Extends DiscordScheduler with task management functionality
 from datetime import datetime, timedelta, time
 import pandas as pd
 from utils.logger import logger
-from my_api.market_schedule import get_market_schedule_for_next_quarter
+from my_api.market_schedule import get_market_calendar
 from .tasks.news_report import (
     news_report_task
 )
 from .tasks.economic_calendar.economic_calendar_daily_task import schedule_economic_calendar_task
+from .tasks.dev_digest import dev_digest_task
 from config import Config
 from .core_scheduler import CoreScheduler
 from .scheduler_manager import set_scheduler
@@ -33,6 +34,7 @@ class TasksScheduler(CoreScheduler):
             await self._startup_setup()
             await self._daily_setup()
             await self._weekly_setup()
+            self._monitoring_setup()
             
         except Exception as e:
             logger.error(f"❌ Error setting up tasks: {str(e)}")
@@ -45,15 +47,22 @@ class TasksScheduler(CoreScheduler):
             setup_time = self.schedule.DAILY_SETUP.time
             economic_calendar_time = self.schedule.DAILY_ECONOMIC_CALENDAR.time
             
+            # Today's jobs are restored from the job store when the daily steps already ran today
             # Run daily gatekeeper if past setup time
             if current_time.time() >= setup_time:
-                logger.info(f"🌅 Running daily gatekeeper startup task")
-                await self._daily_gatekeeper()
+                if self.is_done_today("daily_gatekeeper"):
+                    logger.info(f"♻️ Daily gatekeeper already ran today, restoring its jobs from the job store")
+                else:
+                    logger.info(f"🌅 Running daily gatekeeper startup task")
+                    await self._daily_gatekeeper()
             
             # Run economic calendar task if past scheduled time
             if current_time.time() >= economic_calendar_time:
-                logger.info(f"📊 Running economic calendar task on startup (past scheduled time)")
-                await schedule_economic_calendar_task()
+                if self.is_done_today("economic_calendar"):
+                    logger.info(f"♻️ Economic calendar already scheduled today, restoring its jobs from the job store")
+                else:
+                    logger.info(f"📊 Running economic calendar task on startup (past scheduled time)")
+                    await schedule_economic_calendar_task()
             elif current_time.time() < setup_time:
                 logger.info(f"🌙 Skipping startup tasks, waiting for daily cron job")
         except Exception as e:
@@ -71,6 +80,14 @@ class TasksScheduler(CoreScheduler):
             )
             
             logger.debug("✅ Daily gatekeeper scheduled")
+
+            # Dev digest - LLM usage roll-up for the day
+            self.add_cron_job(
+                func=dev_digest_task,
+                cron_expression=f"{self.schedule.DAILY_DEV_DIGEST.minute} {self.schedule.DAILY_DEV_DIGEST.hour} * * *",
+                job_id="daily_dev_digest"
+            )
+            logger.debug("✅ Daily dev digest scheduled")
         except Exception as e:
             logger.error(f"❌ Error setting up daily tasks: {str(e)}")
             raise
@@ -84,27 +101,41 @@ class TasksScheduler(CoreScheduler):
             logger.error(f"❌ Error setting up weekly tasks: {str(e)}")
             raise
 
+    def _monitoring_setup(self):
+        """Setup the periodic job metrics summary"""
+        self.add_interval_job(
+            func=self.send_metrics_summary,
+            job_id="job_metrics_summary",
+            seconds=Config.JOB_METRICS.SUMMARY_INTERVAL_MINUTES * 60,
+            send_alert=False
+        )
+        logger.debug("✅ Job metrics summary scheduled")
+
     async def _daily_gatekeeper(self):
         """Main gatekeeper that checks conditions and sets up today's tasks"""
         try:
             logger.info("🚪 Daily gatekeeper starting...")
             
             # Get market schedule
-            market_schedule = await get_market_schedule_for_next_quarter(Config.TIMEZONES.APP_TIMEZONE)
+            market_calendar = await get_market_calendar(Config.TIMEZONES.APP_TIMEZONE)
+            if market_calendar is None:
+                logger.error("❌ No market calendar available - skipping tasks")
+                return
             today_date = datetime.now(self.timezone).strftime("%Y-%m-%d")
             
-            if today_date not in market_schedule['date'].values:
+            # Get today's data
+            today_data = market_calendar.get_day(today_date)
+            if today_data is None:
                 logger.info("🚨 Today is not a market day - skipping tasks")
+                self.mark_done_today("daily_gatekeeper")
                 return
             
-            # Get today's data
-            today_data = market_schedule.loc[market_schedule['date'] == today_date].to_dict(orient='records')[0]
-            market_open = datetime.strptime(today_data["open_time"], "%H:%M").time() if today_data["open_time"] is not None else None
-            market_close = datetime.strptime(today_data["close_time"], "%H:%M").time() if today_data["close_time"] is not None else None
+            market_open = datetime.strptime(today_data.open_time, "%H:%M").time() if today_data.open_time is not None else None
+            market_close = datetime.strptime(today_data.close_time, "%H:%M").time() if today_data.close_time is not None else None
             
             # Check if today is a holiday
-            if today_data.get('holiday') is not None:
-                logger.info(f"🏖️ Holiday detected: {today_data.get('holiday', 'Unknown holiday')}")
+            if today_data.holiday is not None:
+                logger.info(f"🏖️ Holiday detected: {today_data.holiday}")
                 if market_open is None:
                     await self._setup_full_holiday_tasks()
                 else:
@@ -112,6 +143,7 @@ class TasksScheduler(CoreScheduler):
             else:
                 logger.info("📈 Regular market day detected")
                 await self._setup_regular_day_tasks(market_open, market_close)
+            self.mark_done_today("daily_gatekeeper")
                 
         except Exception as e:
             logger.error(f"❌ Error in daily gatekeeper: {str(e)}")
@@ -2,6 +2,11 @@
 Scrapers Package - Centralized access to all scraping functionality
 """
 
+# Shared HTTP session
+from .http_client import HttpClient, get_http_client
+from .resilience import CircuitOpenError
+from .http_replay import HttpRecorder, ReplayMissError, get_http_recorder
+
 # Investing Scraper
 from .investing.investing_scraper import InvestingScraper
 from .investing.economic_calendar_to_text import economic_calendar_to_text
@@ -13,6 +18,7 @@ from .yf.yf_params import QouteFields
 
 # Symbols List Scraper
 from .sybmols_list import get_symbols_list
+from .symbol_index import SymbolIndex, get_symbol_index
 
 # CNBC Scraper
 from .cnbc.cnbc_scraper import (
@@ -22,17 +28,28 @@ from .cnbc.cnbc_scraper import (
     get_all_modules,
     get_clean_assets
 )
+from .cnbc.cnbc_crawler import CnbcCrawler, get_cnbc_crawler
 
 # Reuters Scraper
 from .company_info import (
     get_company_info,
     get_info_async,
-    get_companies_info
+    get_companies_info,
+    CompanyProfileFetcher,
+    get_profile_fetcher
 )
 
 
 # Main classes and functions to expose
 __all__ = [
+    # HTTP
+    'HttpClient',
+    'get_http_client',
+    'CircuitOpenError',
+    'HttpRecorder',
+    'ReplayMissError',
+    'get_http_recorder',
+    
     # Investing
     'InvestingScraper',
     'economic_calendar_to_text',
@@ -48,10 +65,14 @@ __all__ = [
     'extract_s_data_dict_from_html',
     'get_all_modules',
     'get_clean_assets',
+    'CnbcCrawler',
+    'get_cnbc_crawler',
     
     # Reuters
     'get_company_info',
     'get_info_async',
     'get_companies_info',
+    'CompanyProfileFetcher',
+    'get_profile_fetcher',
 ]
 
@@ -0,0 +1,138 @@
+"""
+Benchmark - Scraper and report throughput over recorded HTTP responses
+
+Runs the Yahoo quote, Investing calendar and CNBC world page scrapers and the full JSON
+news report against the fixtures of scrapers.http_replay, with injected latency, and
+prints per-scenario latency percentiles and throughput. Caches are reset before every
+batch so each call goes through the HTTP layer and the parsers.
+
+The news stage of the report reads Discord and calls the LLM, which are outside the HTTP
+layer. It is served from <fixtures dir>/news_items.json (the news_data of a real report)
+when that file exists, and is empty otherwise.
+
+Record once, on a machine with network access (run from the bot directory):
+    python -m scrapers.benchmark_replay --record
+Then replay anywhere, without network:
+    python -m scrapers.benchmark_replay --rounds 50 --concurrency 5 --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from config import Config
+from utils.stats import percentile
+from scrapers.http_client import get_http_client
+from scrapers.http_replay import get_http_recorder
+from scrapers.yf import quote_cache
+from scrapers.yf.yf_scraper import YfScraper
+from scrapers.investing import calendar_cache
+from scrapers.investing.investing_scraper import InvestingScraper
+from scrapers.investing.investing_params import InvestingParams
+from scrapers.cnbc.cnbc_scraper import get_cnbc_world_assets
+from report_generator.news_report import NewsReport
+
+
+def reset_caches():
+    quote_cache._quote_cache = None
+    calendar_cache._calendar_cache = None
+
+
+async def load_news_items(hours_back: int = 24) -> list:
+    path = os.path.join(Config.HTTP_CLIENT.FIXTURES_DIR, "news_items.json")
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def yf_quote() -> bool:
+    report = NewsReport(discord_bot=None, timezone=Config.TIMEZONES.APP_TIMEZONE)
+    return bool(await YfScraper().get_quote(list(report.summary_symbols)))
+
+
+async def investing_calendar() -> bool:
+    scraper = InvestingScraper(timezone=Config.TIMEZONES.APP_TIMEZONE)
+    return not (await scraper.get_calendar(InvestingParams.CALENDARS.ECONOMIC_CALENDAR)).empty
+
+
+async def cnbc_world() -> bool:
+    return bool(await get_cnbc_world_assets(region=Config.CNBC_CRAWLER.REGION))
+
+
+async def news_report() -> bool:
+    report = NewsReport(discord_bot=None, timezone=Config.TIMEZONES.APP_TIMEZONE)
+    report._read_and_process_discord_news = load_news_items
+    result = await report.generate_full_json_report(stream=False)
+    return bool(result and result["market_summary_prices"].get("categories"))
+
+
+SCENARIOS = {
+    "yf_quote": yf_quote,
+    "investing_calendar": investing_calendar,
+    "cnbc_world": cnbc_world,
+    "news_report": news_report,
+}
+
+
+async def run_scenario(scenario, rounds: int, concurrency: int) -> dict:
+    """Run a scenario `rounds` times in batches of `concurrency` concurrent calls"""
+    latencies_ms = []
+    failures = 0
+
+    async def timed():
+        started = time.perf_counter()
+        try:
+            ok = await scenario()
+        except Exception:
+            ok = False
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        return ok
+
+    started = time.perf_counter()
+    for batch_start in range(0, rounds, concurrency):
+        reset_caches()
+        results = await asyncio.gather(*(timed() for _ in range(min(concurrency, rounds - batch_start))))
+        failures += results.count(False)
+    elapsed = time.perf_counter() - started
+    return {
+        "calls": len(latencies_ms),
+        "failures": failures,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "max_ms": max(latencies_ms),
+        "per_second": len(latencies_ms) / elapsed,
+    }
+
+
+async def main(args):
+    print(f"{'scenario':<20}{'calls':>7}{'failed':>8}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}{'calls/s':>9}")
+    for name in args.scenarios:
+        result = await run_scenario(SCENARIOS[name], args.rounds, args.concurrency)
+        print(f"{name:<20}{result['calls']:>7}{result['failures']:>8}{result['p50_ms']:>9.1f}"
+              f"{result['p95_ms']:>9.1f}{result['max_ms']:>9.1f}{result['per_second']:>9.1f}")
+    print(f"\nFixtures: {get_http_recorder().format_stats()}")
+    print(get_http_client().format_endpoint_stats())
+    await get_http_client().close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="Call the live sites and save the responses as fixtures")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=None, help="Fixed replay latency (default: the recorded latency)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiplier of the recorded latency")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra replay latency")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    args = parser.parse_args()
+
+    Config.HTTP_CLIENT.MODE = "record" if args.record else "replay"
+    if args.latency_ms is not None:
+        Config.HTTP_CLIENT.REPLAY_LATENCY_MS = args.latency_ms
+    Config.HTTP_CLIENT.REPLAY_LATENCY_SCALE = args.latency_scale
+    Config.HTTP_CLIENT.REPLAY_JITTER_MS = args.jitter_ms
+    if args.record:
+        args.rounds, args.concurrency = 1, 1
+    asyncio.run(main(args))
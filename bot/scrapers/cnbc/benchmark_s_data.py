@@ -0,0 +1,57 @@
+"""
+Benchmark - CNBC window.__s_data extraction, BeautifulSoup path vs the raw scanner
+
+Extracts the payload of the saved CNBC page fixtures with the previous implementation
+(full html.parser tree, regex per <script> tag) and with extract_s_data_dict_from_html,
+checks that both give the same result and prints timings.
+
+Run from the bot directory:
+    python -m scrapers.cnbc.benchmark_s_data
+"""
+
+import json
+import os
+import re
+import time
+from bs4 import BeautifulSoup
+from scrapers.cnbc.cnbc_scraper import extract_s_data_dict_from_html
+
+FIXTURES_DIR = "scrapers/cnbc/fixtures"
+PAGES = ["world_page", "article_page"]
+ROUNDS = 20
+
+
+def legacy_extract_s_data(html_content):
+    """The extract_s_data_dict_from_html implementation before the raw scanner"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    script_pattern = re.compile(r'window\.__s_data\s*=\s*({.*?});', re.DOTALL)
+    for script in soup.find_all('script'):
+        if script.string:
+            match = script_pattern.search(script.string)
+            if match:
+                return json.loads(match.group(1))
+    return {}
+
+
+def time_rounds(func, rounds: int = ROUNDS) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+if __name__ == "__main__":
+    for page_name in PAGES:
+        with open(os.path.join(FIXTURES_DIR, f"{page_name}.html"), encoding="utf-8") as f:
+            html_content = f.read()
+
+        expected = legacy_extract_s_data(html_content)
+        assert expected, f"legacy path found no window.__s_data in {page_name}"
+        assert extract_s_data_dict_from_html(html_content) == expected, f"scanner output differs from legacy for {page_name}"
+
+        legacy_ms = time_rounds(lambda: legacy_extract_s_data(html_content))
+        scanner_ms = time_rounds(lambda: extract_s_data_dict_from_html(html_content))
+        print(f"{page_name}: {len(html_content) // 1024} KB")
+        print(f"  beautifulsoup {legacy_ms:8.1f} ms")
+        print(f"  scanner       {scanner_ms:8.1f} ms  ({legacy_ms / scanner_ms:.1f}x)")
@@ -0,0 +1,192 @@
+"""
+CNBC Crawler - Incremental article crawler with a persistent seen-set
+
+Each run reads the news modules of the CNBC world page, skips the asset ids that are
+already stored and fetches only the new articles with a bounded worker pool (rate
+limited per host). Article bodies are stored zlib-compressed in one SQLite table, which
+doubles as the seen-set, so the news pipeline can read them without downloading again.
+"""
+
+import asyncio
+import time
+import zlib
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from utils.logger import logger
+from utils import TokenBucket, read_json_file
+from config import Config
+from db.engine import get_db_sync
+from db.init_db import init_db
+from db.models.cnbc_articles import CnbcArticle
+from scrapers.http_client import get_http_client
+from scrapers.cnbc.cnbc_scraper import get_cnbc_world_assets, parse_article_body
+
+
+class CnbcCrawler:
+    def __init__(self, config=None):
+        """
+        Initialize CnbcCrawler
+
+        Args:
+            config: Crawler settings (default: Config.CNBC_CRAWLER)
+        """
+        self.config = config or Config.CNBC_CRAWLER
+        self.host_buckets = {}  # host -> TokenBucket
+        self.headers = None
+        self.last_run = None  # Counters of the last crawl
+        init_db()
+
+    def _host_bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        if host not in self.host_buckets:
+            self.host_buckets[host] = TokenBucket(self.config.HOST_REQUESTS, self.config.HOST_PERIOD)
+        return self.host_buckets[host]
+
+    def get_seen_ids(self, asset_ids: list) -> set:
+        """Get the asset ids that are already stored"""
+        if not asset_ids:
+            return set()
+        db = get_db_sync()
+        try:
+            rows = db.query(CnbcArticle.asset_id).filter(CnbcArticle.asset_id.in_(asset_ids)).all()
+            return {row.asset_id for row in rows}
+        finally:
+            db.close()
+
+    def _store(self, asset_id: int, asset: dict, body: str):
+        db = get_db_sync()
+        try:
+            db.merge(CnbcArticle(
+                asset_id=asset_id,
+                module=asset["module"],
+                title=asset["title"][:500],
+                url=asset["url"][:500],
+                description=(asset.get("description") or "")[:1000] or None,
+                date_published=asset.get("datePublished"),
+                body=zlib.compress(body.encode("utf-8"), self.config.COMPRESSION_LEVEL) if body is not None else None,
+                fetched_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            ))
+            db.commit()
+        finally:
+            db.close()
+
+    async def _fetch_article(self, asset_id: int, asset: dict, proxy: str, counters: dict):
+        await self._host_bucket(asset["url"]).acquire()
+        try:
+            async with get_http_client().get(asset["url"], headers=self.headers, proxy=proxy) as response:
+                if response.status != 200:
+                    # Not marked as seen, the next run retries it
+                    logger.warning(f"⚠️ CNBC article returned {response.status}: {asset['url']}")
+                    counters["failed"] += 1
+                    return
+                html_content = await response.text()
+        except Exception as e:
+            logger.warning(f"⚠️ Error fetching CNBC article {asset['url']}: {e}")
+            counters["failed"] += 1
+            return
+
+        article = parse_article_body(html_content, asset["title"], asset["url"])
+        if article is None:
+            # Block/consent page or unparseable markup - not marked as seen, the next run retries it
+            counters["failed"] += 1
+            return
+        # Pages without an article body (live blogs, videos) are stored without one, so they are not fetched again
+        self._store(asset_id, asset, article["body"])
+        counters["fetched" if article["body"] is not None else "no_body"] += 1
+
+    async def crawl(self, region: str = None, proxy: str = None) -> dict:
+        """
+        Fetch and store the articles that are new since the last run
+
+        Args:
+            region: CNBC world page region (default: config REGION)
+            proxy: Proxy URL (default: Config.PROXY.APP_PROXY)
+
+        Returns:
+            dict: found, new, fetched, no_body and failed counts
+        """
+        started = time.monotonic()
+        proxy = proxy if proxy is not None else Config.PROXY.APP_PROXY
+        if self.headers is None:
+            self.headers = read_json_file("scrapers/cnbc/cnbc_headers.json")
+
+        try:
+            clean_assets = await get_cnbc_world_assets(region=region or self.config.REGION, proxy=proxy)
+        except Exception as e:
+            logger.error(f"❌ Error loading the CNBC world page: {e}")
+            clean_assets = {}
+        assets = {}  # asset id -> asset, an asset can be listed in several modules
+        for module_name, module_assets in clean_assets.items():
+            for asset_id, asset in module_assets.items():
+                assets.setdefault(int(asset_id), {**asset, "module": module_name})
+
+        seen_ids = self.get_seen_ids(list(assets))
+        new_ids = [asset_id for asset_id in assets if asset_id not in seen_ids]
+        # Newest first, so the cap leaves the oldest for the next run
+        new_ids.sort(key=lambda asset_id: assets[asset_id].get("datePublished") or "", reverse=True)
+        new_ids = new_ids[:self.config.MAX_ARTICLES_PER_RUN]
+
+        counters = {"found": len(assets), "new": len(new_ids), "fetched": 0, "no_body": 0, "failed": 0}
+        queue = asyncio.Queue()
+        for asset_id in new_ids:
+            queue.put_nowait(asset_id)
+
+        async def worker():
+            while not queue.empty():
+                asset_id = queue.get_nowait()
+                await self._fetch_article(asset_id, assets[asset_id], proxy, counters)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.config.WORKERS, len(new_ids)))))
+        self.last_run = counters
+        logger.info(f"📰 CNBC crawl: {counters['new']}/{counters['found']} new, {counters['fetched']} fetched, "
+                    f"{counters['no_body']} without body, {counters['failed']} failed ({time.monotonic() - started:.1f}s)")
+        return counters
+
+    def get_articles(self, since: datetime, with_body: bool = True) -> list:
+        """
+        Get stored articles fetched since a given time
+
+        Args:
+            since: Start of the window (aware or naive UTC)
+            with_body: Decompress the article text (articles without a body are skipped)
+
+        Returns:
+            list: Article dicts (asset_id, module, title, url, description, date_published, body), newest first
+        """
+        if since.tzinfo:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        db = get_db_sync()
+        try:
+            query = db.query(CnbcArticle).filter(CnbcArticle.fetched_at >= since)
+            if with_body:
+                query = query.filter(CnbcArticle.body.isnot(None))
+            rows = query.order_by(CnbcArticle.date_published.desc()).all()
+        finally:
+            db.close()
+
+        return [{
+            "asset_id": row.asset_id,
+            "module": row.module,
+            "title": row.title,
+            "url": row.url,
+            "description": row.description,
+            "date_published": row.date_published,
+            "body": zlib.decompress(row.body).decode("utf-8") if with_body else None,
+        } for row in rows]
+
+
+# Global CNBC crawler instance
+_cnbc_crawler = None
+
+
+def get_cnbc_crawler() -> CnbcCrawler:
+    """
+    Get or create the global CNBC crawler instance
+
+    Returns:
+        CnbcCrawler: Global CNBC crawler instance
+    """
+    global _cnbc_crawler
+    if _cnbc_crawler is None:
+        _cnbc_crawler = CnbcCrawler()
+    return _cnbc_crawler
@@ -1,45 +1,73 @@
 import json
 import re
-import pytz
-import os
-from bs4 import BeautifulSoup
 from config import Config
 import asyncio
-import aiohttp
-from utils import logger, read_json_file, write_json_file, convert_iso_time_to_datetime
+from datetime import datetime, timezone
+from scrapers.http_client import get_http_client
+from utils import logger, read_json_file, write_json_file, convert_iso_time_to_datetime, JsonSpec
 
 
 
+S_DATA_MARKER = "window.__s_data"
+
+# Strings (with escapes) are skipped whole, so braces inside them are not counted
+_JSON_TOKEN_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.DOTALL)
+
+
+def find_json_object_end(text: str, start: int) -> int:
+    """
+    Find the end of the JSON object that starts at text[start] with a balanced-brace scan
+
+    Returns:
+        int: Index just past the closing brace, or -1 if the object is not closed
+    """
+    depth = 0
+    for token in _JSON_TOKEN_PATTERN.finditer(text, start):
+        char = token.group()
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    return -1
+
+
 def extract_s_data_dict_from_html(html_content: str) -> dict:
     """
     Extract the window.__s_data dictionary from HTML content.
-    
+
+    The raw HTML is scanned for the assignment and only the assigned JSON object is
+    parsed - no DOM is built.
+
     Args:
         html_content (str): HTML content as string
-        
+
     Returns:
         dict: The parsed dictionary from window.__s_data, or empty dict if not found
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find script tag containing window.__s_data
-        script_pattern = re.compile(r'window\.__s_data\s*=\s*({.*?});', re.DOTALL)
-        
-        # Search in all script tags
-        for script in soup.find_all('script'):
-            if script.string:
-                match = script_pattern.search(script.string)
-                if match:
-                    json_str = match.group(1)
-                    # Parse the JSON string
-                    data_dict = json.loads(json_str)
-                    # logger.debug(f"✅ Successfully extracted window.__s_data dictionary")
-                    return data_dict
-        
+        position = html_content.find(S_DATA_MARKER)
+        while position != -1:
+            cursor = position + len(S_DATA_MARKER)
+            # Skip "  =  " between the name and the object
+            while cursor < len(html_content) and html_content[cursor].isspace():
+                cursor += 1
+            if html_content.startswith("=", cursor):
+                cursor += 1
+                while cursor < len(html_content) and html_content[cursor].isspace():
+                    cursor += 1
+                if html_content.startswith("{", cursor):
+                    end = find_json_object_end(html_content, cursor)
+                    if end == -1:
+                        logger.error("❌ window.__s_data object is not closed")
+                        return {}
+                    return json.loads(html_content[cursor:end])
+            position = html_content.find(S_DATA_MARKER, cursor)
+
         logger.warning("⚠️ window.__s_data not found in HTML")
         return {}
-        
+
     except json.JSONDecodeError as e:
         logger.error(f"❌ Error parsing JSON from window.__s_data: {e}")
         return {}
@@ -59,113 +87,110 @@ def get_all_modules(json_data: dict) -> list:
             # logger.debug(f"✅ {modules_names}")
     return all_modules
 
+_asset_specs = {}  # optional fields -> JsonSpec
+
+
+def _get_asset_spec(optional_fields: list) -> JsonSpec:
+    key = tuple(optional_fields)
+    if key not in _asset_specs:
+        fields = {"id": '["id"]', "title": '["title"]', "url": '["url"]'}
+        fields.update({field: f'["{field}"]' for field in optional_fields})
+        _asset_specs[key] = JsonSpec(fields)
+    return _asset_specs[key]
+
+
 def get_clean_assets(all_modules: list, wanted_modules: list, optional_fields: list = []) -> dict:
     clean_assets = {}
+    asset_spec = _get_asset_spec(optional_fields)
     for module in all_modules:
-        # if True:
         if module["name"] in wanted_modules:
             clean_assets[module["name"]] = {}
             data = module["data"]["assets"]
-            for i, asset in enumerate(data):
+            for asset, fields in zip(data, asset_spec.extract_many(data)):
                 try:
-                    if "title" not in asset:
+                    if fields["title"] is None:
                         continue
-                    id = asset["id"]
-                    title = asset["title"]
-                    url = asset["url"]
+                    if fields["id"] is None or fields["url"] is None:
+                        raise KeyError("id" if fields["id"] is None else "url")
                     clean_asset = {
-                        "title": title,
-                        "url": url,
+                        "title": fields["title"],
+                        "url": fields["url"],
                     }
                     for field in optional_fields:
-                        if field in asset:
+                        if fields[field] is not None:
                             if field == "datePublished":
-                                formatted_date = convert_iso_time_to_datetime(asset["datePublished"], pytz.timezone(Config.TIMEZONES.APP_TIMEZONE)).strftime('%Y-%m-%d %H:%M:%S')
+                                formatted_date = convert_iso_time_to_datetime(fields["datePublished"], Config.TIMEZONES.APP_TIMEZONE).strftime('%Y-%m-%d %H:%M:%S')
                                 clean_asset[field] = formatted_date
                             else:
-                                clean_asset[field] = asset[field]
+                                clean_asset[field] = fields[field]
 
-                    clean_assets[module["name"]][id] = clean_asset
+                    clean_assets[module["name"]][fields["id"]] = clean_asset
                 except Exception as e:
                     logger.warning(f"⚠️ {e} not found in {asset}")
     return clean_assets
 
 
 
-async def get_cnbc_world_assets(region: str = "us", proxy: str = None) -> dict[str, dict]:
+async def get_cnbc_world_assets(region: str = "us", proxy: str = None, debug_dump: bool = False) -> dict[str, dict]:
     full_url = f"https://www.cnbc.com/world/?region={region}"
     headers = read_json_file("scrapers/cnbc/cnbc_headers.json")
-    async with aiohttp.ClientSession() as session:
-        async with session.get(full_url, headers=headers, proxy=proxy) as response:
-            html_content = await response.text()
+    async with get_http_client().get(full_url, headers=headers, proxy=proxy) as response:
+        html_content = await response.text()
     json_data = extract_s_data_dict_from_html(html_content)
-    write_json_file("cnbc_world_s_data.json", json_data)
+    if debug_dump:
+        write_json_file("cnbc_world_s_data.json", json_data)
     all_modules = get_all_modules(json_data)
-    wanted_modules = ["latestNews", "riverPlus", "featuredNewsHero"]
-    clean_assets = get_clean_assets(all_modules, wanted_modules, ["datePublished", "description"])
+    clean_assets = get_clean_assets(all_modules, Config.CNBC_CRAWLER.NEWS_MODULES, ["datePublished", "description"])
     return clean_assets
 
 async def get_article_body(title: str, url: str, proxy: str = None) -> str:
     headers = read_json_file("scrapers/cnbc/cnbc_headers.json")
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers, proxy=proxy) as response:
-            html_content = await response.text()
-    
+    async with get_http_client().get(url, headers=headers, proxy=proxy) as response:
+        html_content = await response.text()
+    return parse_article_body(html_content, title, url)
+
+def parse_article_body(html_content: str, title: str, url: str) -> dict:
+    """
+    Get the article text from a CNBC article page
+
+    Returns:
+        dict: {"title", "body"} - body is None for a valid page without an articleBody (live blogs, videos...)
+              None if the page has no parseable window.__s_data (block, consent or captcha pages, markup changes)
+    """
     script_json = extract_s_data_dict_from_html(html_content)
-    if script_json:
-        try:
-            modules = []
-            for layout_item in script_json["page"]["page"]["layout"]:
-                layout_item_modules = layout_item["columns"][0]["modules"]
-                modules.extend(layout_item_modules)
-
-            try:
-                module_names = [module["name"] for module in modules]
-                # logger.debug(f"✅ {module_names}")
-                if "articleBody" in module_names:
-                    logger.debug(f"✅ articleBody found")
-                elif "liveBlogBody" in module_names:
-                    logger.debug(f"✅ liveBlogBody found")
-                    return None
-                else:
-                    logger.debug(f"❌ articleBody or liveBlogBody not found {module_names}\nPage url: {url}")
-                    return None
-            except Exception as e:
-                logger.error(f"❌ Error extracting module types: {e}")
-
-            for module in modules:
-                if module["name"] == "articleBody":
-                    article_body = module["data"]["articleBodyText"]
-                    return {"title": title, "body": article_body}
-        except Exception as e:
-            logger.error(f"❌ Error extracting article body: {e}")
-            return None
-    return None
+    if not script_json:
+        return None
+    try:
+        modules = []
+        for layout_item in script_json["page"]["page"]["layout"]:
+            layout_item_modules = layout_item["columns"][0]["modules"]
+            modules.extend(layout_item_modules)
+
+        module_names = [module["name"] for module in modules]
+        if "liveBlogBody" in module_names:
+            logger.debug(f"✅ liveBlogBody found")
+        elif "articleBody" not in module_names:
+            logger.debug(f"❌ articleBody or liveBlogBody not found {module_names}\nPage url: {url}")
+
+        for module in modules:
+            if module["name"] == "articleBody":
+                logger.debug(f"✅ articleBody found")
+                return {"title": title, "body": module["data"]["articleBodyText"]}
+        return {"title": title, "body": None}
+    except Exception as e:
+        logger.error(f"❌ Error extracting article body: {e}")
+        return None
 
 # Example usage
 async def main():
-
-    output_dir = "data/cnbc"
-    os.makedirs(output_dir, exist_ok=True)
-    clean_assets = await get_cnbc_world_assets(proxy=Config.PROXY.APP_PROXY, region="world")
-    
-    tasks = []
-    for module_name, assets in clean_assets.items():
-        write_json_file(f"{output_dir}/{module_name}.json", assets)
-        counter = 0
-        for id, asset in assets.items():
-            if counter > 2:
-                break
-            counter += 1
-            tasks.append(get_article_body(asset["title"], asset["url"], proxy=Config.PROXY.APP_PROXY))
-
-    results = await asyncio.gather(*tasks)
-    for result in results:
-        if result is not None:
-            safe_file_name = re.sub(r'[\\/:*?"<>|]', '', result["title"])
-            articles_dir = f"{output_dir}/articles"
-            os.makedirs(articles_dir, exist_ok=True)
-            write_json_file(f"{articles_dir}/{safe_file_name}.json", result)
+    from scrapers.cnbc.cnbc_crawler import get_cnbc_crawler
+
+    crawler = get_cnbc_crawler()
+    started = datetime.now(timezone.utc)
+    await crawler.crawl(proxy=Config.PROXY.APP_PROXY)
+    for article in crawler.get_articles(started):
+        logger.info(f"📰 {article['date_published']} {article['title']} ({len(article['body'])} chars)")
+    await get_http_client().close()
 
 
 
@@ -1,7 +1,18 @@
+"""
+Company Info - CNN company profiles with a persistent cache
+
+Profiles are fetched concurrently through the shared HTTP session, limited by a token
+bucket, and stored in SymbolsList (English description, market cap, P/E, website) with
+a refresh timestamp. Symbols with a fresh stored profile are not fetched again.
+"""
+
 import requests
 import asyncio
-import concurrent.futures
+from datetime import datetime, timezone, timedelta
 from utils.logger import logger
+from utils import TokenBucket
+from config import Config
+from scrapers.http_client import get_http_client
 
 headers = {
     'accept': '*/*',
@@ -21,35 +32,203 @@ headers = {
 }
 
 
+PROFILE_URL = "https://production.dataviz.cnn.io/quote/profile/{symbol}"
+WANTED_FIELDS = ["symbol", "description", "market_cap", "market_cap_profile", "website_url", "profit_earnings_ratio"]
+
+
+def _parse_profile(response_json) -> dict:
+    data = response_json[0]
+    return {field: data[field] for field in WANTED_FIELDS if field in data}
+
+
+def _to_float(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _make_profile(symbol: str, description, market_cap, pe_ratio, website_url) -> dict:
+    """Profile in the shape get_companies_info returns, whether it was stored or just fetched"""
+    return {
+        "symbol": symbol,
+        "description": description,
+        "market_cap": _to_float(market_cap),
+        "profit_earnings_ratio": _to_float(pe_ratio),
+        "website_url": (website_url or "")[:255] or None,
+    }
+
+
 def get_company_info(symbol):
-    url = f"https://production.dataviz.cnn.io/quote/profile/{symbol}"
+    url = PROFILE_URL.format(symbol=symbol)
     logger.info(f"Getting description for {symbol} from {url}")
     response = requests.get(url, headers=headers)
     if response.status_code == 200:
-        data = response.json()[0]
-        wanted_fields = ["symbol", "description", "market_cap", "market_cap_profile", "website_url", "profit_earnings_ratio"]
-        return {field: data[field] for field in wanted_fields if field in data}
+        return _parse_profile(response.json())
     else:
         logger.error(f"Error getting description for {symbol}")
         logger.error(response.status_code)
         return {}
 
-async def get_info_async(symbol):
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        return await loop.run_in_executor(executor, get_company_info, symbol)
-
-async def get_companies_info(companies_symbols):
-    descriptions = {}
-    for i, symbol in enumerate(companies_symbols):
-        # Add delay between requests (except for the first one)
-        if i > 0:
-            await asyncio.sleep(0.5)  # 0.5 second delay between requests
-        description = await get_info_async(symbol)
-        if description:
-            descriptions[symbol] = description
-
-    return descriptions
+
+class CompanyProfileFetcher:
+    def __init__(self, config=None):
+        """
+        Initialize CompanyProfileFetcher
+
+        Args:
+            config: Rate limit and cache settings (default: Config.COMPANY_PROFILES)
+        """
+        self.config = config or Config.COMPANY_PROFILES
+        self.bucket = TokenBucket(self.config.REQUESTS, self.config.PERIOD)
+        self.semaphore = None  # Created on first use, inside the running loop
+
+    async def fetch_profile(self, symbol: str, proxy: str = None) -> dict:
+        """
+        Fetch one profile from CNN (rate limited, 429 responses are retried)
+
+        Returns:
+            dict: Profile fields, or empty dict on error
+        """
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.config.CONCURRENCY)
+        url = PROFILE_URL.format(symbol=symbol)
+        async with self.semaphore:
+            for attempt in range(self.config.MAX_ATTEMPTS):
+                await self.bucket.acquire()
+                try:
+                    async with get_http_client().get(url, headers=headers, proxy=proxy) as response:
+                        if response.status == 429 and attempt < self.config.MAX_ATTEMPTS - 1:
+                            retry_after = _to_float(response.headers.get("Retry-After")) or 2.0
+                            logger.warning(f"⚠️ CNN profiles rate limited, pausing {retry_after:.1f}s")
+                            self.bucket.pause(retry_after)
+                            continue
+                        if response.status != 200:
+                            logger.error(f"❌ Error getting description for {symbol}: {response.status}")
+                            return {}
+                        return _parse_profile(await response.json(content_type=None))
+                except Exception as e:
+                    logger.error(f"❌ Error getting description for {symbol}: {e}")
+                    return {}
+        return {}
+
+    def _load_stored(self, symbols: list) -> dict:
+        from db.engine import get_db_sync
+        from db.models import SymbolsList
+
+        db = get_db_sync()
+        try:
+            rows = db.query(SymbolsList).filter(SymbolsList.symbol.in_(symbols)).all()
+            return {row.symbol: row for row in rows}
+        finally:
+            db.close()
+
+    def _store(self, profiles: dict):
+        from db.engine import get_db_sync
+        from db.models import SymbolsList
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        db = get_db_sync()
+        try:
+            rows = {row.symbol: row for row in db.query(SymbolsList).filter(SymbolsList.symbol.in_(list(profiles))).all()}
+            for symbol, profile in profiles.items():
+                row = rows.get(symbol)
+                if row is None:
+                    row = SymbolsList(symbol=symbol)
+                    db.add(row)
+                row.english_description = profile.get("description") or row.english_description
+                normalized = _make_profile(symbol, profile.get("description"), profile.get("market_cap"),
+                                           profile.get("profit_earnings_ratio"), profile.get("website_url"))
+                row.market_cap = normalized["market_cap"]
+                row.pe_ratio = normalized["profit_earnings_ratio"]
+                row.website_url = normalized["website_url"]
+                row.profile_updated_at = now
+            db.commit()
+        finally:
+            db.close()
+
+    async def get_companies_info(self, symbols: list, proxy: str = None, max_age_hours: float = None) -> dict:
+        """
+        Get company profiles, fetching only symbols without a fresh stored profile
+
+        Args:
+            symbols: Ticker symbols
+            proxy: Proxy URL
+            max_age_hours: Refetch stored profiles older than this (default: config MAX_AGE_HOURS, 0 = always fetch)
+
+        Returns:
+            dict: symbol -> profile (symbol, description, market_cap, profit_earnings_ratio, website_url)
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        max_age_hours = self.config.MAX_AGE_HOURS if max_age_hours is None else max_age_hours
+        fresh_after = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=max_age_hours)
+
+        _ensure_tables()
+        try:
+            stored = self._load_stored(symbols)
+        except Exception as e:
+            logger.error(f"❌ Error loading stored company profiles: {e}")
+            stored = {}
+
+        profiles = {}
+        to_fetch = []
+        for symbol in symbols:
+            row = stored.get(symbol)
+            if row is not None and row.profile_updated_at and row.profile_updated_at > fresh_after:
+                profiles[symbol] = _make_profile(symbol, row.english_description, row.market_cap, row.pe_ratio, row.website_url)
+            else:
+                to_fetch.append(symbol)
+
+        if to_fetch:
+            results = await asyncio.gather(*(self.fetch_profile(symbol, proxy) for symbol in to_fetch))
+            fetched = {symbol: profile for symbol, profile in zip(to_fetch, results) if profile}
+            if fetched:
+                try:
+                    self._store(fetched)
+                except Exception as e:
+                    logger.error(f"❌ Error storing company profiles: {e}")
+            profiles.update({
+                symbol: _make_profile(symbol, profile.get("description"), profile.get("market_cap"),
+                                      profile.get("profit_earnings_ratio"), profile.get("website_url"))
+                for symbol, profile in fetched.items()
+            })
+            logger.info(f"🏢 Company profiles: {len(symbols) - len(to_fetch)} fresh, {len(fetched)}/{len(to_fetch)} fetched")
+
+        return profiles
+
+
+_tables_ready = False
+
+
+def _ensure_tables():
+    global _tables_ready
+    if not _tables_ready:
+        from db.init_db import init_db
+        _tables_ready = init_db()
+
+
+# Global company profile fetcher instance
+_profile_fetcher = None
+
+
+def get_profile_fetcher() -> CompanyProfileFetcher:
+    """
+    Get or create the global company profile fetcher instance
+
+    Returns:
+        CompanyProfileFetcher: Global company profile fetcher instance
+    """
+    global _profile_fetcher
+    if _profile_fetcher is None:
+        _profile_fetcher = CompanyProfileFetcher()
+    return _profile_fetcher
+
+
+async def get_info_async(symbol, proxy: str = None):
+    return await get_profile_fetcher().fetch_profile(symbol, proxy)
+
+async def get_companies_info(companies_symbols, proxy: str = None):
+    return await get_profile_fetcher().get_companies_info(companies_symbols, proxy)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,346 @@
+"""
+HTTP Client - Process-wide pooled aiohttp session shared by all scrapers
+
+One ClientSession (and TCPConnector) is kept for the whole process, so requests to
+the same host reuse kept-alive connections through the proxy instead of redoing
+TCP + TLS for every call. Latency and connection reuse are tracked per host.
+
+Requests go through a circuit breaker per host and route (proxied or direct), and
+requests slower than their endpoint's p95 are hedged with a duplicate (see resilience).
+HTTP_MODE=record/replay saves responses as fixtures or serves them offline (see http_replay).
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import aiohttp
+from yarl import URL
+from utils.logger import logger
+from utils.stats import percentile
+from config import Config
+from scrapers.resilience import CircuitBreaker, CircuitOpenError, EndpointStats, endpoint_key
+from scrapers.http_replay import get_http_recorder
+
+
+class HostStats:
+    """Request counters and recent latencies of a single host"""
+    def __init__(self, max_samples: int):
+        self.requests = 0
+        self.errors = 0
+        self.fallbacks = 0  # Requests sent direct because the proxied circuit was open
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.latencies_ms = deque(maxlen=max_samples)
+
+    def to_dict(self) -> dict:
+        connections = self.new_connections + self.reused_connections
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "fallbacks": self.fallbacks,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_rate": self.reused_connections / connections if connections else None,
+            "p50_ms": percentile(self.latencies_ms, 50),
+            "p95_ms": percentile(self.latencies_ms, 95),
+        }
+
+
+class HttpClient:
+    def __init__(self, config=None):
+        """
+        Initialize HttpClient (the session is created lazily inside the running loop)
+
+        Args:
+            config: Connection settings (default: Config.HTTP_CLIENT)
+        """
+        self.config = config or Config.HTTP_CLIENT
+        self.session = None
+        self.loop = None
+        self.stats = {}  # host -> HostStats
+        self.endpoint_stats = {}  # endpoint key -> EndpointStats
+        self.breakers = {}  # (host, proxied) -> CircuitBreaker
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+            ctx.endpoint = getattr(ctx.trace_request_ctx, "endpoint", None)
+            ctx.started_at = time.perf_counter()
+
+        async def on_connection_create_end(session, ctx, params):
+            self._get_host_stats(ctx.host).new_connections += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._get_host_stats(ctx.host).reused_connections += 1
+
+        async def on_request_end(session, ctx, params):
+            latency_ms = (time.perf_counter() - ctx.started_at) * 1000
+            self._get_host_stats(ctx.host).latencies_ms.append(latency_ms)
+            if ctx.endpoint is not None:
+                self._get_endpoint_stats(ctx.endpoint).latencies_ms.append(latency_ms)
+
+        async def on_request_exception(session, ctx, params):
+            # Cancelled hedge attempts are not errors
+            if not isinstance(params.exception, asyncio.CancelledError):
+                self._get_host_stats(ctx.host).errors += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    def _get_host_stats(self, host: str) -> HostStats:
+        stats = self.stats.get(host)
+        if stats is None:
+            stats = self.stats[host] = HostStats(self.config.LATENCY_SAMPLES)
+        return stats
+
+    def _get_endpoint_stats(self, endpoint: str) -> EndpointStats:
+        stats = self.endpoint_stats.get(endpoint)
+        if stats is None:
+            if len(self.endpoint_stats) >= self.config.MAX_ENDPOINTS:
+                endpoint = endpoint.split("/", 1)[0] + "/*"
+                stats = self.endpoint_stats.get(endpoint)
+            if stats is None:
+                stats = self.endpoint_stats[endpoint] = EndpointStats(self.config.LATENCY_SAMPLES)
+        return stats
+
+    def _get_breaker(self, host: str, proxied: bool) -> CircuitBreaker:
+        breaker = self.breakers.get((host, proxied))
+        if breaker is None:
+            breaker = self.breakers[(host, proxied)] = CircuitBreaker(self.config.BREAKER_FAILURES, self.config.BREAKER_OPEN_SECONDS)
+        return breaker
+
+    def _hedge_delay(self, stats: EndpointStats):
+        """Seconds to wait before hedging, or None if the endpoint should not be hedged now"""
+        if len(stats.latencies_ms) < self.config.HEDGE_MIN_SAMPLES:
+            return None
+        if stats.hedged >= stats.requests * self.config.HEDGE_MAX_RATIO:
+            return None
+        delay_ms = min(max(percentile(stats.latencies_ms, 95), self.config.HEDGE_MIN_DELAY_MS), self.config.HEDGE_MAX_DELAY_MS)
+        return delay_ms / 1000
+
+    async def start(self):
+        """Create the shared session (no-op if it is already open in this loop)"""
+        # No awaits here, so concurrent callers can't create two sessions
+        loop = asyncio.get_running_loop()
+        if self.session and not self.session.closed and self.loop is loop:
+            return
+        if self.session and not self.session.closed:
+            # Opened by a loop that is gone (e.g. a previous asyncio.run), it can't be reused
+            logger.warning("⚠️ HTTP session belongs to another event loop, opening a new one")
+        connector = aiohttp.TCPConnector(
+            limit=self.config.LIMIT,
+            limit_per_host=self.config.LIMIT_PER_HOST,
+            ttl_dns_cache=self.config.DNS_CACHE_TTL,
+            keepalive_timeout=self.config.KEEPALIVE_TIMEOUT,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.TOTAL_TIMEOUT, connect=self.config.CONNECT_TIMEOUT),
+            trace_configs=[self._build_trace_config()],
+        )
+        self.loop = loop
+        logger.info("🌐 HTTP session started")
+
+    async def close(self):
+        """Close the shared session and its pooled connections"""
+        session, self.session, self.loop = self.session, None, None
+        if session and not session.closed:
+            await session.close()
+            logger.info("🌐 HTTP session closed")
+
+    async def _send(self, method: str, url: str, endpoint: str, stats: EndpointStats, hedge_delay, kwargs: dict) -> aiohttp.ClientResponse:
+        """Send a request, plus a duplicate if no response headers arrived within hedge_delay"""
+        def attempt():
+            return asyncio.ensure_future(self.session.request(method, url, trace_request_ctx=SimpleNamespace(endpoint=endpoint), **kwargs))
+
+        first = attempt()
+        if hedge_delay is None:
+            return await first
+
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return first.result()
+
+            stats.hedged += 1
+            second = attempt()
+            pending.add(second)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                responses = [task for task in done if task.exception() is None]
+                if responses:
+                    if responses[0] is second:
+                        stats.hedge_wins += 1
+                    # Both can finish in the same tick, the slower response is released unread
+                    for task in responses[1:]:
+                        task.result().release()
+                    return responses[0].result()
+                if not pending:
+                    # Both attempts failed
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, timeout: float = None, hedge: bool = None, **kwargs):
+        """
+        Send a request on the shared session
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Total timeout in seconds for this request (default: Config.HTTP_CLIENT.TOTAL_TIMEOUT)
+            hedge: Send a duplicate when the response is slower than the endpoint p95 (default: for HEDGE_METHODS)
+            **kwargs: Passed to aiohttp (headers, params, data, proxy...)
+
+        Yields:
+            aiohttp.ClientResponse: The response, released when the block exits
+
+        Raises:
+            CircuitOpenError: The target failed repeatedly and is not retried yet
+            ReplayMissError: Replay mode and the request was never recorded
+        """
+        host = URL(url).host
+        host_stats = self._get_host_stats(host)
+        host_stats.requests += 1
+        endpoint = endpoint_key(url)
+        stats = self._get_endpoint_stats(endpoint)
+        stats.requests += 1
+
+        if self.config.MODE == "replay":
+            started = time.perf_counter()
+            try:
+                response = await get_http_recorder().replay(method, url, kwargs)
+            except Exception:
+                host_stats.errors += 1
+                raise
+            latency_ms = (time.perf_counter() - started) * 1000
+            host_stats.latencies_ms.append(latency_ms)
+            stats.latencies_ms.append(latency_ms)
+            yield response
+            return
+
+        await self.start()
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout, connect=self.config.CONNECT_TIMEOUT)
+
+        breaker = self._get_breaker(host, bool(kwargs.get("proxy")))
+        if not breaker.allow():
+            direct_breaker = self._get_breaker(host, False)
+            if not (kwargs.get("proxy") and self.config.FALLBACK_DIRECT and direct_breaker.allow()):
+                host_stats.errors += 1
+                raise CircuitOpenError(f"Circuit open for {host}")
+            logger.warning(f"⚠️ Proxied circuit open for {host}, sending direct")
+            host_stats.fallbacks += 1
+            kwargs["proxy"] = None
+            breaker = direct_breaker
+
+        if hedge is None:
+            hedge = method in self.config.HEDGE_METHODS
+        hedge_delay = self._hedge_delay(stats) if hedge and self.config.HEDGE_ENABLED else None
+        started = time.perf_counter()
+        try:
+            response = await self._send(method, url, endpoint, stats, hedge_delay, kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        try:
+            if self.config.MODE == "record":
+                await get_http_recorder().record(method, url, kwargs, response, (time.perf_counter() - started) * 1000)
+            yield response
+        finally:
+            response.release()
+
+    def get(self, url: str, **kwargs):
+        """Send a GET request (see request)"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """Send a POST request (see request)"""
+        return self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> dict:
+        """
+        Get per-host metrics
+
+        Returns:
+            dict: host -> requests, errors, fallbacks, new/reused connections, reuse rate, p50/p95 latency (ms) and open circuits
+        """
+        stats = {host: host_stats.to_dict() for host, host_stats in self.stats.items()}
+        for (host, proxied), breaker in self.breakers.items():
+            if host in stats and breaker.state != CircuitBreaker.CLOSED:
+                stats[host].setdefault("open_circuits", []).append("proxy" if proxied else "direct")
+        return stats
+
+    def get_endpoint_stats(self) -> dict:
+        """
+        Get per-endpoint tail latency
+
+        Returns:
+            dict: endpoint -> requests, hedged, hedge_wins, p50/p95/p99 latency (ms)
+        """
+        return {endpoint: stats.to_dict() for endpoint, stats in self.endpoint_stats.items()}
+
+    def format_stats(self) -> str:
+        """Format the per-host metrics for the dev digest"""
+        if not self.stats:
+            return "No HTTP requests yet"
+        lines = []
+        for host, stats in sorted(self.get_stats().items(), key=lambda item: -item[1]["requests"]):
+            reuse = f"{stats['reuse_rate']:.0%}" if stats["reuse_rate"] is not None else "-"
+            p50 = f"{stats['p50_ms']:.0f}" if stats["p50_ms"] is not None else "-"
+            p95 = f"{stats['p95_ms']:.0f}" if stats["p95_ms"] is not None else "-"
+            line = f"• `{host}` {stats['requests']} req, {stats['errors']} err, reuse {reuse}, p50 {p50}ms, p95 {p95}ms"
+            if stats["fallbacks"]:
+                line += f", {stats['fallbacks']} direct"
+            if stats.get("open_circuits"):
+                line += f" ⛔ circuit open ({', '.join(stats['open_circuits'])})"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def format_endpoint_stats(self, limit: int = 10) -> str:
+        """Format the slowest endpoints (by p99) for the dev digest"""
+        endpoints = [(endpoint, stats) for endpoint, stats in self.get_endpoint_stats().items() if stats["p99_ms"] is not None]
+        if not endpoints:
+            return "No HTTP requests yet"
+        lines = []
+        for endpoint, stats in sorted(endpoints, key=lambda item: -item[1]["p99_ms"])[:limit]:
+            line = f"• `{endpoint}` p50 {stats['p50_ms']:.0f}ms, p95 {stats['p95_ms']:.0f}ms, p99 {stats['p99_ms']:.0f}ms"
+            if stats["hedged"]:
+                line += f", {stats['hedged']} hedged ({stats['hedge_wins']} won)"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+# Global HTTP client instance
+_http_client = None
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get or create the global HTTP client instance
+
+    Returns:
+        HttpClient: Global HTTP client instance
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
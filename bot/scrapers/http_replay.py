@@ -0,0 +1,241 @@
+"""
+HTTP Replay - Record real scraper responses as fixtures and serve them back offline
+
+With HTTP_MODE=record the shared HttpClient saves every response (status, a few headers,
+body and latency) as one JSON fixture per request. With HTTP_MODE=replay it serves the
+fixtures instead of opening connections, after the recorded (or a configured) latency,
+so scrapers and reports can be benchmarked deterministically without network access.
+
+Requests are matched on method, URL, query and body. Secrets in the query (API keys,
+crumbs) are not stored and not part of the match, and a request that was never recorded
+falls back to the latest successful recording of the same route (e.g. a calendar for
+another date). 304 and transient error responses (429, 5xx) are not recorded.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import time
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+import aiohttp
+from utils.logger import logger
+from config import Config
+
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+# Not recorded - they depend on request headers (304) or are transient, and would overwrite the real response
+UNRECORDED_STATUSES = (304, 408, 429)
+
+
+class ReplayMissError(aiohttp.ClientError):
+    """Raised in replay mode for a request without a recorded fixture"""
+
+
+class ReplayResponse:
+    """Stand-in for aiohttp.ClientResponse built from a fixture"""
+    def __init__(self, method: str, url: str, fixture: dict):
+        self.method = method
+        self.url = URL(url)
+        self.status = fixture["status"]
+        self.reason = fixture.get("reason")
+        self.headers = CIMultiDictProxy(CIMultiDict(fixture.get("headers", {})))
+        if "body_b64" in fixture:
+            self._body = base64.b64decode(fixture["body_b64"])
+        else:
+            self._body = fixture.get("body", "").encode("utf-8")
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or "utf-8", errors=errors)
+
+    async def json(self, encoding: str = None, loads=json.loads, content_type: str = "application/json"):
+        return loads(self._body.decode(encoding or "utf-8"))
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise aiohttp.ClientResponseError(None, (), status=self.status, message=self.reason or "", headers=self.headers)
+
+    def release(self):
+        pass
+
+
+class HttpRecorder:
+    def __init__(self, fixtures_dir: str = None, config=None):
+        """
+        Initialize HttpRecorder
+
+        Args:
+            fixtures_dir: Directory of the fixture files (default: config FIXTURES_DIR)
+            config: Record/replay settings (default: Config.HTTP_CLIENT)
+        """
+        self.config = config or Config.HTTP_CLIENT
+        self.fixtures_dir = fixtures_dir or self.config.FIXTURES_DIR
+        self.fixtures = None  # key -> fixture, loaded on the first replay
+        self.routes = {}  # route -> latest fixture of that route
+        self.recorded = 0
+        self.replayed = 0
+        self.fallbacks = 0  # Replays served by the route fallback
+        self.misses = 0
+
+    def _clean_url(self, url: str, params) -> URL:
+        """URL with the request params merged in and secret params removed"""
+        parsed = URL(url)
+        if params:
+            parsed = parsed.update_query(params)
+        query = [(key, value) for key, value in parsed.query.items() if key.lower() not in self.config.REDACTED_PARAMS]
+        return parsed.with_query(sorted(query))
+
+    @staticmethod
+    def _route(method: str, url: URL) -> str:
+        return f"{method} {url.host}{url.path}"
+
+    @staticmethod
+    def _body_text(kwargs: dict) -> str:
+        if kwargs.get("json") is not None:
+            return json.dumps(kwargs["json"], sort_keys=True, default=str)
+        data = kwargs.get("data")
+        if isinstance(data, dict):
+            return json.dumps(data, sort_keys=True, default=str)
+        if isinstance(data, bytes):
+            return data.decode("utf-8", errors="replace")
+        return str(data) if data is not None else ""
+
+    def request_key(self, method: str, url: str, kwargs: dict) -> tuple:
+        """
+        Match key of a request
+
+        Returns:
+            tuple: (key, route, clean url)
+        """
+        clean_url = self._clean_url(url, kwargs.get("params"))
+        raw = f"{method} {clean_url} {self._body_text(kwargs)}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16], self._route(method, clean_url), clean_url
+
+    def _path(self, host: str, key: str) -> str:
+        return os.path.join(self.fixtures_dir, host or "unknown", f"{key}.json")
+
+    def load(self):
+        """Index all fixture files (the latest recording of each route is kept as its fallback)"""
+        self.fixtures, self.routes = {}, {}
+        if not os.path.isdir(self.fixtures_dir):
+            logger.warning(f"⚠️ No HTTP fixtures in {self.fixtures_dir}")
+            return
+        for host in sorted(os.listdir(self.fixtures_dir)):
+            host_dir = os.path.join(self.fixtures_dir, host)
+            if not os.path.isdir(host_dir):
+                continue
+            for name in os.listdir(host_dir):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(host_dir, name), encoding="utf-8") as f:
+                        fixture = json.load(f)
+                except Exception as e:
+                    logger.error(f"❌ Error loading HTTP fixture {name}: {e}")
+                    continue
+                self.fixtures[fixture["key"]] = fixture
+                if not 200 <= fixture["status"] < 300:
+                    continue  # An error response is never served for another request
+                latest = self.routes.get(fixture["route"])
+                if latest is None or fixture["recorded_at"] > latest["recorded_at"]:
+                    self.routes[fixture["route"]] = fixture
+        logger.info(f"📼 Loaded {len(self.fixtures)} HTTP fixtures from {self.fixtures_dir}")
+
+    async def record(self, method: str, url: str, kwargs: dict, response: aiohttp.ClientResponse, latency_ms: float):
+        """Save a live response as a fixture (the body is read, so callers can still read it)"""
+        key, route, clean_url = self.request_key(method, url, kwargs)
+        if response.status in UNRECORDED_STATUSES or response.status >= 500:
+            logger.debug(f"📼 Not recording {response.status} for {method} {clean_url}")
+            return
+        body = await response.read()
+        fixture = {
+            "key": key,
+            "route": route,
+            "method": method,
+            "url": str(clean_url),
+            "status": response.status,
+            "reason": response.reason,
+            "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+            "latency_ms": round(latency_ms, 1),
+            "recorded_at": time.time(),
+        }
+        try:
+            fixture["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            fixture["body_b64"] = base64.b64encode(body).decode("ascii")
+
+        path = self._path(clean_url.host, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=1)
+        if self.fixtures is not None:
+            self.fixtures[key] = fixture
+            if 200 <= response.status < 300:
+                self.routes[route] = fixture
+        self.recorded += 1
+        logger.debug(f"📼 Recorded {method} {clean_url} -> {path}")
+
+    def replay_latency(self, fixture: dict) -> float:
+        """Seconds to wait before serving a fixture"""
+        latency_ms = self.config.REPLAY_LATENCY_MS
+        if latency_ms is None:
+            latency_ms = fixture.get("latency_ms", 0) * self.config.REPLAY_LATENCY_SCALE
+        if self.config.REPLAY_JITTER_MS:
+            latency_ms += random.uniform(0, self.config.REPLAY_JITTER_MS)
+        return latency_ms / 1000
+
+    async def replay(self, method: str, url: str, kwargs: dict) -> ReplayResponse:
+        """
+        Serve a recorded response after the injected latency
+
+        Raises:
+            ReplayMissError: Neither the request nor its route was recorded
+        """
+        if self.fixtures is None:
+            self.load()
+        key, route, clean_url = self.request_key(method, url, kwargs)
+        fixture = self.fixtures.get(key)
+        if fixture is None:
+            fixture = self.routes.get(route)
+            if fixture is None:
+                self.misses += 1
+                raise ReplayMissError(f"No recorded response for {method} {clean_url}")
+            self.fallbacks += 1
+        self.replayed += 1
+        delay = self.replay_latency(fixture)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return ReplayResponse(method, str(clean_url), fixture)
+
+    def format_stats(self) -> str:
+        return f"{self.recorded} recorded, {self.replayed} replayed ({self.fallbacks} by route), {self.misses} missing"
+
+
+# Global HTTP recorder instance
+_http_recorder = None
+
+
+def get_http_recorder() -> HttpRecorder:
+    """
+    Get or create the global HTTP recorder instance
+
+    Returns:
+        HttpRecorder: Global HTTP recorder instance
+    """
+    global _http_recorder
+    if _http_recorder is None:
+        _http_recorder = HttpRecorder()
+    return _http_recorder
@@ -0,0 +1,107 @@
+"""
+Benchmark - Investing table extraction, legacy path vs the table parser
+
+Parses calendar table HTML with the previous implementation (JSON config read per call,
+html.parser, per-cell select_one) and with TableSpec (lxml and the BeautifulSoup
+fallback), checks that all paths give the same result and prints timings.
+
+The bundled fixtures are synthetic: generated rows that follow the markup the table
+selectors expect, not saved Investing responses. They show the relative cost of the
+parsing paths, but matching output on them says nothing about real Investing markup.
+To check that, save the "data" HTML of real calendar responses as <page name>.html
+and pass their directory with --fixtures-dir.
+
+Run from the bot directory:
+    python -m scrapers.investing.benchmark_table_parser [--fixtures-dir DIR]
+"""
+
+import argparse
+import os
+import time
+from bs4 import BeautifulSoup
+from utils import read_json_file
+from scrapers.investing.table_parser import TableSpec, lxml_html
+
+FIXTURES_DIR = "scrapers/investing/fixtures"  # Synthetic pages
+PAGES = ["economic_calendar", "holiday_calendar", "earnings_calendar"]
+ROUNDS = 20
+
+
+def get_element_attributes(soup_element, attributes):
+    for attribute in attributes:
+        value = soup_element.text.strip() if attribute == "text" else soup_element.get(attribute)
+        if value:
+            return value
+    return None
+
+
+def legacy_process_table_data(page_name, table_html):
+    """The InvestingScraper._process_table_data implementation before the table parser"""
+    table_structure = read_json_file("scrapers/investing/tables_stucture.json")[page_name]
+    table_selectors = table_structure["table_selectors"]
+
+    def proccess_tr(tr):
+        row_data = {}
+        for item_name, selector in table_selectors.items():
+            if item_name == "date":
+                continue
+            data_element = tr.select_one(selector["selector"])
+            if data_element:
+                row_data[item_name] = get_element_attributes(data_element, selector["attribute"])
+        return row_data
+
+    all_rows = BeautifulSoup(table_html, "html.parser").find_all("tr")
+    events_by_date = {}
+    current_events = []
+    current_date = "unknown"
+    for row in all_rows:
+        date_element = row.select_one(table_selectors["date"]["selector"])
+        new_date = get_element_attributes(date_element, table_selectors["date"]["attribute"]) if date_element else None
+        if new_date:
+            if current_events:
+                events_by_date[current_date] = current_events
+                current_events = []
+            current_date = new_date
+        if not new_date or table_structure["is_date_inline"]:
+            proccessed_row = proccess_tr(row)
+            if proccessed_row:
+                current_events.append(proccessed_row)
+    if current_events:
+        events_by_date[current_date] = current_events
+    return events_by_date
+
+
+def time_rounds(func, rounds: int = ROUNDS) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures-dir", default=FIXTURES_DIR, help="Directory of <page name>.html table fixtures")
+    args = parser.parse_args()
+
+    structures = read_json_file("scrapers/investing/tables_stucture.json")
+    for page_name in PAGES:
+        path = os.path.join(args.fixtures_dir, f"{page_name}.html")
+        if not os.path.exists(path):
+            print(f"{page_name}: no fixture in {args.fixtures_dir}, skipped")
+            continue
+        with open(path, encoding="utf-8") as f:
+            table_html = f.read()
+
+        expected = legacy_process_table_data(page_name, table_html)
+        legacy_ms = time_rounds(lambda: legacy_process_table_data(page_name, table_html))
+        rows = sum(len(events) for events in expected.values())
+        print(f"{page_name}: {rows} rows, {len(table_html) // 1024} KB")
+        print(f"  legacy        {legacy_ms:8.1f} ms")
+
+        engines = [("soup", False)] + ([("lxml", True)] if lxml_html is not None else [])
+        for engine_name, use_lxml in engines:
+            spec = TableSpec(page_name, structures[page_name], use_lxml=use_lxml)
+            assert spec.parse(table_html) == expected, f"{engine_name} output differs from legacy for {page_name}"
+            engine_ms = time_rounds(lambda: spec.parse(table_html))
+            print(f"  {engine_name:<13} {engine_ms:8.1f} ms  ({legacy_ms / engine_ms:.1f}x)")
@@ -0,0 +1,113 @@
+"""
+Calendar Cache - Skip re-parsing calendar tables that did not change
+
+For every calendar request (page + payload) the cache keeps the HTTP validators
+(ETag / Last-Modified), a hash of the raw table payload and the parsed DataFrame.
+When a poll returns the same payload, the parsed DataFrame is reused.
+Entries are dropped least recently used first once MAX_ENTRIES is reached.
+"""
+
+import hashlib
+import json
+import pandas as pd
+from config import Config
+
+
+class CalendarCacheEntry:
+    def __init__(self):
+        self.etag = None
+        self.last_modified = None
+        self.table_html = None
+        self.not_modified = False  # The last fetch got a 304 and reused table_html
+        self.payload_hash = None
+        self.data = None  # Parsed DataFrame of payload_hash
+
+
+class CalendarCache:
+    def __init__(self, config=None):
+        """
+        Initialize CalendarCache
+
+        Args:
+            config: Cache settings (default: Config.CALENDAR_CACHE)
+        """
+        self.config = config or Config.CALENDAR_CACHE
+        self.entries = {}  # (page name, payload key) -> CalendarCacheEntry, least recently used first
+        self.stats = {}  # page name -> counters
+
+    @staticmethod
+    def request_key(page_name: str, payload: dict, timezone: str = None) -> tuple:
+        # The scraper timezone changes the processed DataFrame, so it is part of the key
+        return page_name, json.dumps(payload, sort_keys=True, default=str), str(timezone)
+
+    @staticmethod
+    def hash_payload(table_html: str) -> str:
+        return hashlib.blake2b(table_html.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_entry(self, key: tuple) -> CalendarCacheEntry:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            # Full - drop the least recently used entries
+            while len(self.entries) >= self.config.MAX_ENTRIES:
+                del self.entries[next(iter(self.entries))]
+            entry = CalendarCacheEntry()
+        # Reinsert so the dict stays ordered by last use
+        self.entries[key] = entry
+        return entry
+
+    def count(self, page_name: str, counter: str):
+        """Count a 'parsed', 'hash_skipped' or 'not_modified' result"""
+        counters = self.stats.setdefault(page_name, {"parsed": 0, "hash_skipped": 0, "not_modified": 0})
+        counters[counter] += 1
+
+    def get_cached_data(self, key: tuple, payload_hash: str):
+        """Get a copy of the parsed DataFrame if the payload hash matches, else None"""
+        entry = self.entries.get(key)
+        if entry is None or entry.payload_hash != payload_hash or entry.data is None:
+            return None
+        self.entries[key] = self.entries.pop(key)
+        # Callers add and modify columns, the cached frame must stay untouched
+        return entry.data.copy()
+
+    def set_data(self, key: tuple, payload_hash: str, data: pd.DataFrame):
+        entry = self.get_entry(key)
+        entry.payload_hash = payload_hash
+        entry.data = data.copy()
+
+    def get_stats(self) -> dict:
+        """
+        Get skip counters per calendar
+
+        Returns:
+            dict: page name -> parsed, hash_skipped and not_modified counts
+        """
+        return {page_name: dict(counters) for page_name, counters in self.stats.items()}
+
+    def format_stats(self) -> str:
+        """Format the skip counters for the dev digest"""
+        if not self.stats:
+            return "No calendar fetches yet"
+        lines = []
+        for page_name, counters in self.get_stats().items():
+            total = sum(counters.values())
+            skipped = counters["hash_skipped"] + counters["not_modified"]
+            lines.append(f"• `{page_name}` {skipped}/{total} parses skipped "
+                         f"({counters['hash_skipped']} same payload, {counters['not_modified']} not modified)")
+        return "\n".join(lines)
+
+
+# Global calendar cache instance
+_calendar_cache = None
+
+
+def get_calendar_cache() -> CalendarCache:
+    """
+    Get or create the global calendar cache instance
+
+    Returns:
+        CalendarCache: Global calendar cache instance
+    """
+    global _calendar_cache
+    if _calendar_cache is None:
+        _calendar_cache = CalendarCache()
+    return _calendar_cache
@@ -1,20 +1,21 @@
 import requests
-import aiohttp
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import os
 import pandas as pd
 import pytz
 import re
 from config import Config
-from utils import read_json_file, write_json_file, get_time_delta_for_date, logger
+from utils import write_json_file, get_time_delta_for_date, logger, get_concurrency_group
 import json
 from .investing_params import InvestingParams
+from scrapers.http_client import get_http_client
+from .table_parser import get_config_registry
+from .calendar_cache import get_calendar_cache
 import asyncio
 
 class InvestingScraper:
     def __init__(self, proxy=None, timezone:str=Config.TIMEZONES.APP_TIMEZONE):
-        self.headers = read_json_file(f'scrapers/investing/investing_headers.json')
+        self.headers = get_config_registry().get_headers()
         self.proxy = proxy
         self.timezone = timezone
         logger.debug(f"Initialized investing scraper" + (" with proxy" if self.proxy else "") + (f" with timezone {self.timezone}" if self.timezone else ""))
@@ -30,24 +31,44 @@ class InvestingScraper:
                 return value
         return None
 
-    async def _fetch_table(self, page_name, payload: dict):
-        """Fetch and parse the webpage asynchronously"""
+    async def _fetch_table(self, page_name, payload: dict, cache_key: tuple = None):
+        """Fetch and parse the webpage asynchronously (conditionally, when the last response had validators)"""
         # logger.debug(f"Fetching table data for {page_name}")
-        request_json = read_json_file(f'scrapers/investing/requests_json/{page_name}.json')
+        request_json = get_config_registry().get_request(page_name)
+        cache = get_calendar_cache()
+        entry = cache.get_entry(cache_key) if cache_key else None
+        headers = self.headers
+        if entry and entry.table_html is not None:
+            conditional = {}
+            if entry.etag:
+                conditional["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional["If-Modified-Since"] = entry.last_modified
+            if conditional:
+                headers = {**self.headers, **conditional}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(request_json['url'], headers=self.headers, data=payload, proxy=self.proxy) as response:
-                    # logger.debug(f"Request body: {payload}")
-                    if response.status != 200:
-                        logger.error(f"Failed to fetch page. Status code: {response.status}")
-                        return None
-                    try:
-                        json_response = await response.read()
-                        table_html = json.loads(json_response).get("data", '') 
-                        return table_html
-                    except Exception as e:
-                        logger.error(f"Error parsing JSON: {str(e)}")
-                        return None 
+            # Not hedged: a duplicate would run outside the investing concurrency group's slot
+            async with get_http_client().post(request_json['url'], headers=headers, data=payload, proxy=self.proxy) as response:
+                # logger.debug(f"Request body: {payload}")
+                if response.status == 304 and entry and entry.table_html is not None:
+                    cache.count(page_name, "not_modified")
+                    entry.not_modified = True
+                    return entry.table_html
+                if response.status != 200:
+                    logger.error(f"Failed to fetch page. Status code: {response.status}")
+                    return None
+                try:
+                    json_response = await response.read()
+                    table_html = json.loads(json_response).get("data", '') 
+                    if entry:
+                        entry.etag = response.headers.get("ETag")
+                        entry.last_modified = response.headers.get("Last-Modified")
+                        entry.table_html = table_html
+                        entry.not_modified = False
+                    return table_html
+                except Exception as e:
+                    logger.error(f"Error parsing JSON: {str(e)}")
+                    return None 
         except Exception as e:
             logger.error(f"Error fetching table: {str(e)}")
             return None
@@ -55,52 +76,7 @@ class InvestingScraper:
 
     def _process_table_data(self, page_name, table_html):
         """Process all rows in the table"""
-        table_structure = read_json_file(f'scrapers/investing/tables_stucture.json')[page_name]
-        table_selectors = table_structure["table_selectors"]
-
-        def proccess_tr(tr, table_selectors):
-            """Extract data from a single row"""
-            row_data = {}
-            for item_name, selector in table_selectors.items():
-                if item_name == "date":
-                    continue
-                try:
-                    data_element = tr.select_one(selector["selector"])
-                    if data_element:
-                        row_data[item_name] = self.get_element_attirbutes(data_element, selector["attribute"])
-                except Exception as e:
-                    logger.error(f"Error processing {item_name}: {str(e)}")
-            return row_data
-        
-        table_soup = BeautifulSoup(table_html, 'html.parser')   
-        all_rows = table_soup.find_all('tr')
-
-        events_by_date = {}
-        current_events = []
-        current_date = "unknown"
-        
-        for row in all_rows:
-            date_element = row.select_one(table_selectors['date']['selector'])
-            new_date = self.get_element_attirbutes(date_element, table_selectors['date']['attribute']) if date_element else None
-
-
-            # add the previous events to the matching date
-            if new_date:
-                if current_events:
-                    events_by_date[current_date] = current_events
-                    current_events = []
-                current_date = new_date
-                
-            # extract the events if if not a date tr, or if the date is inline
-            if not new_date or table_structure["is_date_inline"]:
-                proccessed_row = proccess_tr(row, table_selectors)
-                if proccessed_row:
-                    current_events.append(proccessed_row)
-        
-        if current_events:
-            events_by_date[current_date] = current_events
-        
-        return events_by_date
+        return get_config_registry().get_table_spec(page_name).parse(table_html)
     
     def _adjust_date_format(self, date: str):
         if re.match(r'^\d{1,2}\.\d{1,2}\.\d{4}$', date):
@@ -152,10 +128,25 @@ class InvestingScraper:
 
     
     async def run(self, page_name, payload: dict, save_data: bool = False):
-        table_html = await self._fetch_table(page_name, payload)
+        cache = get_calendar_cache()
+        cache_key = cache.request_key(page_name, payload, self.timezone)
+        # Concurrent identical requests (e.g. the release watcher and the daily task) share one fetch
+        table_html = await get_concurrency_group("investing").run(self._fetch_table, page_name, payload, cache_key, key=cache_key)
         if not table_html:
             logger.error(f"Failed to fetch table data for {page_name}")
             return pd.DataFrame()
+
+        # Same payload as the last poll - reuse the parsed DataFrame
+        payload_hash = cache.hash_payload(table_html)
+        df = cache.get_cached_data(cache_key, payload_hash)
+        if df is not None:
+            if not cache.entries[cache_key].not_modified:
+                cache.count(page_name, "hash_skipped")
+            if save_data:
+                now_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f") # with microseconds
+                self._save_data(f"{page_name}_{now_timestamp}", df)
+            return df
+
         events_by_dates = self._process_table_data(page_name, table_html)
         try:
             # os.makedirs("data/investing_scraper", exist_ok=True)
@@ -172,6 +163,8 @@ class InvestingScraper:
             if page_name == "holiday_calendar":
                 df = self._process_holidays_calendar(df)
                 pass
+            cache.set_data(cache_key, payload_hash, df)
+            cache.count(page_name, "parsed")
             if save_data:
                 now_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f") # with microseconds
                 self._save_data(f"{page_name}_{now_timestamp}", df)
@@ -48,6 +48,6 @@ def get_descriptions_text():
 
         חשוב: החזר JSON בלבד, ללא טקסט נוסף לפני או אחרי.
         """ + "\n" + "\n".join(descriptions_dict[i:i+chunk_size])
-        response = ai_interpreter.get_json_response(prompt)
+        response = ai_interpreter.get_json_response(prompt, caller="eco_events_descriptions")
         write_json_file(f"json.json", response)
 
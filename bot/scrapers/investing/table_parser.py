@@ -0,0 +1,162 @@
+"""
+Table Parser - Fast extraction of Investing.com calendar tables
+
+The scraper's JSON config (headers, request definitions and table structures) is read
+once into a registry, and each table's CSS selectors are compiled once. Tables are
+parsed with lxml when it is installed (falling back to BeautifulSoup's html.parser with
+precompiled selectors) and the rows are walked a single time.
+"""
+
+import soupsieve
+from bs4 import BeautifulSoup
+from utils import read_json_file, logger
+
+try:
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    lxml_html = None
+
+CONFIG_DIR = "scrapers/investing"
+
+
+class FieldSelector:
+    """A compiled selector of one table column"""
+    def __init__(self, name: str, selector: str, attributes: list, use_lxml: bool):
+        self.name = name
+        self.attributes = attributes
+        if use_lxml:
+            self.compiled = CSSSelector(selector)
+        else:
+            self.compiled = soupsieve.compile(selector)
+
+    def extract_lxml(self, row):
+        """Returns (value, found) - found is False when the row has no matching cell"""
+        elements = self.compiled(row)
+        if not elements:
+            return None, False
+        element = elements[0]
+        for attribute in self.attributes:
+            value = element.text_content().strip() if attribute == "text" else element.get(attribute)
+            if value:
+                return value, True
+        return None, True
+
+    def extract_soup(self, row):
+        element = self.compiled.select_one(row)
+        if element is None:
+            return None, False
+        for attribute in self.attributes:
+            value = element.text.strip() if attribute == "text" else element.get(attribute)
+            if value:
+                return value, True
+        return None, True
+
+
+class TableSpec:
+    """The compiled structure of a calendar table (from tables_stucture.json)"""
+    def __init__(self, page_name: str, structure: dict, use_lxml: bool = None):
+        self.page_name = page_name
+        self.is_date_inline = structure["is_date_inline"]
+        self.use_lxml = lxml_html is not None if use_lxml is None else use_lxml
+        selectors = structure["table_selectors"]
+        self.date = FieldSelector("date", selectors["date"]["selector"], selectors["date"]["attribute"], self.use_lxml)
+        self.fields = [
+            FieldSelector(name, selector["selector"], selector["attribute"], self.use_lxml)
+            for name, selector in selectors.items() if name != "date"
+        ]
+
+    def _iter_rows(self, table_html: str):
+        """Yield (date, row_data) per table row - date is None for non-date rows"""
+        if self.use_lxml:
+            root = lxml_html.fragment_fromstring(table_html, create_parent="div")
+            rows = root.iter("tr")
+            extract = FieldSelector.extract_lxml
+        else:
+            rows = BeautifulSoup(table_html, "html.parser").find_all("tr")
+            extract = FieldSelector.extract_soup
+
+        for row in rows:
+            date, _ = extract(self.date, row)
+            row_data = {}
+            if not date or self.is_date_inline:
+                for field in self.fields:
+                    try:
+                        value, found = extract(field, row)
+                        if found:
+                            row_data[field.name] = value
+                    except Exception as e:
+                        logger.error(f"Error processing {field.name}: {str(e)}")
+            yield date, row_data
+
+    def parse(self, table_html: str) -> dict:
+        """
+        Parse a calendar table
+
+        Args:
+            table_html: The table rows HTML returned by Investing.com
+
+        Returns:
+            dict: date -> list of row dicts (rows before the first date go under "unknown")
+        """
+        events_by_date = {}
+        current_events = []
+        current_date = "unknown"
+
+        for new_date, row_data in self._iter_rows(table_html):
+            # add the previous events to the matching date
+            if new_date:
+                if current_events:
+                    events_by_date[current_date] = current_events
+                    current_events = []
+                current_date = new_date
+            if row_data:
+                current_events.append(row_data)
+
+        if current_events:
+            events_by_date[current_date] = current_events
+        return events_by_date
+
+
+class InvestingConfigRegistry:
+    """Investing scraper config files, read from disk once per process"""
+    def __init__(self, config_dir: str = CONFIG_DIR):
+        self.config_dir = config_dir
+        self.headers = None
+        self.requests = {}  # page name -> request json
+        self.table_specs = {}  # page name -> TableSpec
+        self.table_structures = None
+
+    def get_headers(self) -> dict:
+        if self.headers is None:
+            self.headers = read_json_file(f"{self.config_dir}/investing_headers.json")
+        return self.headers
+
+    def get_request(self, page_name: str) -> dict:
+        if page_name not in self.requests:
+            self.requests[page_name] = read_json_file(f"{self.config_dir}/requests_json/{page_name}.json")
+        return self.requests[page_name]
+
+    def get_table_spec(self, page_name: str) -> TableSpec:
+        if page_name not in self.table_specs:
+            if self.table_structures is None:
+                self.table_structures = read_json_file(f"{self.config_dir}/tables_stucture.json")
+            self.table_specs[page_name] = TableSpec(page_name, self.table_structures[page_name])
+        return self.table_specs[page_name]
+
+
+# Global config registry instance
+_config_registry = None
+
+
+def get_config_registry() -> InvestingConfigRegistry:
+    """
+    Get or create the global Investing config registry
+
+    Returns:
+        InvestingConfigRegistry: Global config registry instance
+    """
+    global _config_registry
+    if _config_registry is None:
+        _config_registry = InvestingConfigRegistry()
+    return _config_registry
@@ -0,0 +1,89 @@
+"""
+Resilience - Circuit breakers and endpoint latency tracking for the shared HTTP client
+
+A CircuitBreaker per (host, route) stops sending requests to a target that keeps failing
+and lets one probe through after a cool-down. EndpointStats keeps recent latencies per
+endpoint, which give the tail latency in the dev digest and the delay after which
+HttpClient sends a hedged (duplicate) request.
+"""
+
+import re
+import time
+from collections import deque
+import aiohttp
+from yarl import URL
+from utils.stats import percentile
+
+_NUMBER_SEGMENT = re.compile(r"^\d+$")
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of sending a request while the target's circuit is open"""
+
+
+def endpoint_key(url: str, max_segments: int = 3) -> str:
+    """Group URLs by host and leading path segments (numeric segments become ':n')"""
+    parsed = URL(url)
+    segments = [":n" if _NUMBER_SEGMENT.match(segment) else segment for segment in parsed.path.split("/") if segment]
+    return f"{parsed.host}/" + "/".join(segments[:max_segments])
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, open_seconds: float):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            open_seconds: How long the circuit stays open before a probe request is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """Check if a request may be sent (an expired open circuit lets one probe through)"""
+        if self.state == self.CLOSED:
+            return True
+        # Open waits out the cool-down, half-open allows one probe per cool-down until one reports back
+        if time.monotonic() - self.opened_at < self.open_seconds:
+            return False
+        self.state = self.HALF_OPEN
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state == self.CLOSED:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class EndpointStats:
+    """Recent latencies and hedging counters of one endpoint"""
+    def __init__(self, max_samples: int):
+        self.requests = 0
+        self.hedged = 0  # Requests that sent a duplicate
+        self.hedge_wins = 0  # ...and the duplicate answered first
+        self.latencies_ms = deque(maxlen=max_samples)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "p50_ms": percentile(self.latencies_ms, 50),
+            "p95_ms": percentile(self.latencies_ms, 95),
+            "p99_ms": percentile(self.latencies_ms, 99),
+        }
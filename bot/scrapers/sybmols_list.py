@@ -1,21 +1,31 @@
 import requests
 from config import Config
+from scrapers.symbol_index import get_symbol_index
 
 def get_symbols_list():
+    """Get the FMP stock list, served from the local symbol index while it is fresh"""
     try:
-        res = requests.get(f"https://financialmodelingprep.com/api/v3/stock/list?apikey={Config.TOKENS.FMP_API_KEY}")
-
-        if res.status_code == 200:
-            res_json = res.json()
-            clean_list = [item for item in res_json if item["symbol"].isalpha()]
-            # sort clean_list by symbol alphabetically
-            clean_list = sorted(clean_list, key=lambda item: item["symbol"])
-            return clean_list
-    
+        index = get_symbol_index()
+        if not index.is_loaded:
+            index.load()
+        if index.is_loaded and not index.is_stale():
+            res_json = [
+                {"symbol": symbol, "name": name, "exchangeShortName": exchange, "type": symbol_type}
+                for symbol, name, exchange, symbol_type in index.entries.values()
+            ]
         else:
-            print(f"Error: {res.status_code}")
-            return None
+            res = requests.get(f"https://financialmodelingprep.com/api/v3/stock/list?apikey={Config.TOKENS.FMP_API_KEY}")
+            if res.status_code != 200:
+                print(f"Error: {res.status_code}")
+                return None
+            res_json = res.json()
+            index.set_items(res_json)
+
+        clean_list = [item for item in res_json if item["symbol"].isalpha()]
+        # sort clean_list by symbol alphabetically
+        clean_list = sorted(clean_list, key=lambda item: item["symbol"])
+        return clean_list
  
     except Exception as e:
         print(f"Error: {e}")
-        return None
\ No newline at end of file
+        return None
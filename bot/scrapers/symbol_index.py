@@ -0,0 +1,242 @@
+"""
+Symbol Index - Local, in-memory index of the FMP stock list
+
+The FMP symbol list is downloaded at most once a day and kept gzip-compressed on disk.
+In memory it is held as sorted arrays, so ticker validation is a dict lookup and
+autocomplete is a binary-search prefix scan over symbols and company name words, with
+one-edit fuzzy matches on the symbol as a fallback.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from bisect import bisect_left
+from string import ascii_uppercase, digits
+from utils.logger import logger
+from config import Config
+from scrapers.http_client import get_http_client
+
+FMP_LIST_URL = "https://financialmodelingprep.com/api/v3/stock/list"
+FUZZY_ALPHABET = ascii_uppercase + digits + ".^="
+
+
+def normalize_symbol(symbol: str) -> str:
+    # FMP writes share classes as BRK.B, Yahoo as BRK-B
+    return symbol.strip().upper().replace("-", ".")
+
+
+def _edits1(word: str) -> set:
+    """All strings one delete, transpose, replace or insert away"""
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    deletes = {left + right[1:] for left, right in splits if right}
+    transposes = {left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1}
+    replaces = {left + char + right[1:] for left, right in splits if right for char in FUZZY_ALPHABET}
+    inserts = {left + char + right for left, right in splits for char in FUZZY_ALPHABET}
+    return deletes | transposes | replaces | inserts
+
+
+class SymbolIndex:
+    def __init__(self, path: str = None, config=None):
+        """
+        Initialize SymbolIndex
+
+        Args:
+            path: Compressed index file (default: config DATA_PATH)
+            config: Index settings (default: Config.SYMBOL_INDEX)
+        """
+        self.config = config or Config.SYMBOL_INDEX
+        self.path = path or self.config.DATA_PATH
+        self.fetched_at = 0.0  # Epoch seconds of the FMP download
+        self.entries = {}  # normalized symbol -> (symbol, name, exchange, type)
+        self.symbols = []  # Sorted normalized symbols
+        self.name_words = []  # Sorted lowercase company name words
+        self.name_word_symbols = []  # Normalized symbol of each name word
+        self.refresh_task = None
+        self.refresh_attempted_at = 0.0  # Monotonic time of the last download attempt
+        self.refresh_failed = False
+        self.load_attempted = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self.entries)
+
+    def is_stale(self) -> bool:
+        return time.time() - self.fetched_at > self.config.REFRESH_HOURS * 3600
+
+    def build(self, items: list, fetched_at: float = None):
+        """
+        Build the in-memory arrays from FMP list items (or [symbol, name, exchange, type] rows)
+        """
+        entries = {}
+        for item in items:
+            if isinstance(item, dict):
+                item = [item.get("symbol"), item.get("name"), item.get("exchangeShortName"), item.get("type")]
+            if not item[0]:
+                continue
+            entries.setdefault(normalize_symbol(item[0]), (item[0], item[1] or "", item[2] or "", item[3] or ""))
+
+        name_words = []
+        for key, (_, name, _, _) in entries.items():
+            for word in set(name.lower().replace(",", " ").split()):
+                if len(word) > 1:
+                    name_words.append((word, key))
+
+        self.entries = entries
+        name_words.sort()
+        self.symbols = sorted(entries)
+        self.name_words = [word for word, _ in name_words]
+        self.name_word_symbols = [key for _, key in name_words]
+        self.fetched_at = fetched_at or time.time()
+
+    def load(self) -> bool:
+        """Load the index from disk, returns False if there is no stored index"""
+        self.load_attempted = True
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            self.build(data["symbols"], data["fetched_at"])
+            logger.debug(f"🔎 Loaded {len(self.entries)} symbols from {self.path}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error loading symbol index {self.path}: {e}")
+            return False
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        data = {"fetched_at": self.fetched_at, "symbols": [list(entry) for entry in self.entries.values()]}
+        tmp_path = self.path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def set_items(self, items: list):
+        """Replace the index with a freshly downloaded FMP list and store it"""
+        self.build(items)
+        self.save()
+        logger.info(f"🔎 Symbol index refreshed with {len(self.entries)} symbols")
+
+    async def refresh(self, proxy: str = None) -> bool:
+        """Download the FMP list and rebuild the index"""
+        self.refresh_attempted_at = time.monotonic()
+        self.refresh_failed = True
+        try:
+            params = {"apikey": Config.TOKENS.FMP_API_KEY}
+            async with get_http_client().get(FMP_LIST_URL, params=params, proxy=proxy, timeout=60) as response:
+                if response.status != 200:
+                    logger.error(f"❌ Error downloading the FMP symbol list: {response.status}")
+                    return False
+                items = await response.json(content_type=None)
+            self.set_items(items)
+            self.refresh_failed = False
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error refreshing the symbol index: {e}")
+            return False
+
+    def _ensure_loaded(self):
+        if not self.load_attempted:
+            self.load()
+
+    def refresh_if_stale(self):
+        """
+        Start a background refresh when the index is older than REFRESH_HOURS
+        (no-op while one runs, and for REFRESH_RETRY_MINUTES after a failed one)
+        """
+        self._ensure_loaded()
+        if not self.is_stale() or (self.refresh_task is not None and not self.refresh_task.done()):
+            return self.refresh_task
+        if self.refresh_failed and time.monotonic() - self.refresh_attempted_at < self.config.REFRESH_RETRY_MINUTES * 60:
+            return self.refresh_task
+        self.refresh_task = asyncio.create_task(self.refresh())
+        return self.refresh_task
+
+    def contains(self, symbol: str):
+        """
+        Check if a symbol is listed
+
+        Returns:
+            bool: True/False, or None if no index is available yet
+        """
+        self._ensure_loaded()
+        if not self.is_loaded:
+            return None
+        return normalize_symbol(symbol) in self.entries
+
+    def get(self, symbol: str) -> tuple:
+        """Get (symbol, name, exchange, type) of a listed symbol, or None"""
+        self._ensure_loaded()
+        return self.entries.get(normalize_symbol(symbol))
+
+    @staticmethod
+    def _prefix_range(array: list, prefix: str, limit: int) -> range:
+        """Indexes of the first `limit` items of a sorted array that start with prefix"""
+        start = bisect_left(array, prefix)
+        end = start
+        while end < len(array) and end - start < limit and array[end].startswith(prefix):
+            end += 1
+        return range(start, end)
+
+    def search(self, query: str, limit: int = None) -> list:
+        """
+        Search symbols for autocomplete
+
+        Symbol prefix matches come first (shortest first), then company name word
+        prefixes, then symbols one edit away from the query.
+
+        Args:
+            query: Typed text
+            limit: Maximum results (default: config MAX_RESULTS)
+
+        Returns:
+            list: (symbol, name, exchange, type) tuples
+        """
+        self._ensure_loaded()
+        limit = limit or self.config.MAX_RESULTS
+        query = query.strip()
+        if not query or not self.is_loaded:
+            return []
+
+        results = []
+        seen = set()
+
+        def add(key):
+            if key not in seen and len(results) < limit:
+                seen.add(key)
+                results.append(self.entries[key])
+
+        symbol_query = normalize_symbol(query)
+        # Rank a window of prefix matches by length, so AAPL comes before AAPLX and its other share classes
+        prefix_keys = [self.symbols[i] for i in self._prefix_range(self.symbols, symbol_query, self.config.PREFIX_SCAN)]
+        for key in sorted(prefix_keys, key=lambda key: (len(key), key)):
+            add(key)
+
+        if len(results) < limit:
+            word = query.lower().split()[0]
+            for i in self._prefix_range(self.name_words, word, self.config.PREFIX_SCAN):
+                add(self.name_word_symbols[i])
+
+        if len(results) < limit and len(symbol_query) <= self.config.FUZZY_MAX_LENGTH:
+            for key in sorted(_edits1(symbol_query) & self.entries.keys(), key=lambda key: (len(key), key)):
+                add(key)
+        return results
+
+
+# Global symbol index instance
+_symbol_index = None
+
+
+def get_symbol_index() -> SymbolIndex:
+    """
+    Get or create the global symbol index instance
+
+    Returns:
+        SymbolIndex: Global symbol index instance
+    """
+    global _symbol_index
+    if _symbol_index is None:
+        _symbol_index = SymbolIndex()
+    return _symbol_index
@@ -0,0 +1,275 @@
+"""
+Chart Store - Local columnar store of Yahoo chart bars
+
+Bars are kept per symbol and interval in a numpy structured array (.npy), next to a
+JSON list of the time ranges that were already fetched. A request only downloads the
+ranges that are missing (usually just the tail) and merges them in. Reads are
+memory-mapped, so long history queries don't load whole files.
+
+Yahoo restates older bars after a split or dividend (adjclose, and close for splits),
+so when a download brings an event that is new to the store and newer than stored bars,
+the symbol's stored bars are dropped and the requested range is fetched again whole.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+import numpy as np
+from utils.logger import logger
+from config import Config
+
+BAR_DTYPE = np.dtype([
+    ("timestamp", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("adjclose", "f8"),
+    ("volume", "f8"),
+])
+
+INTERVAL_SECONDS = {
+    "1m": 60, "2m": 120, "5m": 300, "15m": 900, "30m": 1800, "60m": 3600, "90m": 5400,
+    "1h": 3600, "1d": 86400, "5d": 5 * 86400, "1wk": 7 * 86400, "1mo": 31 * 86400, "3mo": 92 * 86400,
+}
+
+
+def chart_response_to_bars(response: dict) -> np.ndarray:
+    """
+    Convert a Yahoo chart response to a bar array
+
+    Returns:
+        np.ndarray: BAR_DTYPE array sorted by timestamp (missing values are NaN), or None if the response has no result
+    """
+    try:
+        result = response["chart"]["result"][0]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+    timestamps = result.get("timestamp") or []
+    bars = np.zeros(len(timestamps), dtype=BAR_DTYPE)
+    if not timestamps:
+        return bars
+
+    bars["timestamp"] = timestamps
+    quote = (result.get("indicators", {}).get("quote") or [{}])[0]
+    for field in ("open", "high", "low", "close", "volume"):
+        values = quote.get(field)
+        bars[field] = np.array(values, dtype="f8") if values else np.nan  # None becomes NaN
+    adjclose = (result.get("indicators", {}).get("adjclose") or [{}])[0].get("adjclose")
+    bars["adjclose"] = np.array(adjclose, dtype="f8") if adjclose else bars["close"]
+    return np.sort(bars, order="timestamp")
+
+
+def chart_response_event_times(response: dict) -> set:
+    """Get the epoch times of the split and dividend events in a Yahoo chart response"""
+    try:
+        events = response["chart"]["result"][0].get("events") or {}
+    except (KeyError, IndexError, TypeError):
+        return set()
+    times = set()
+    for kind in ("splits", "dividends"):
+        for event in (events.get(kind) or {}).values():
+            if event.get("date"):
+                times.add(int(event["date"]))
+    return times
+
+
+def merge_ranges(ranges: list) -> list:
+    """Merge overlapping or touching [start, end] ranges"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def missing_ranges(covered: list, start: int, end: int) -> list:
+    """Get the parts of [start, end] that the (merged) covered ranges don't hold"""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append([cursor, covered_start])
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        gaps.append([cursor, end])
+    return gaps
+
+
+class ChartStore:
+    def __init__(self, data_dir: str = None):
+        """
+        Initialize ChartStore
+
+        Args:
+            data_dir: Directory for the bar files (default: Config.CHART_STORE.DATA_DIR)
+        """
+        self.data_dir = data_dir or Config.CHART_STORE.DATA_DIR
+        self.locks = {}  # (symbol, interval) -> asyncio.Lock
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def _paths(self, symbol: str, interval: str):
+        # Index symbols like ^GSPC or EURUSD=X need a file-safe name
+        name = re.sub(r"[^A-Za-z0-9.\-]", "_", symbol.upper())
+        base = os.path.join(self.data_dir, f"{name}_{interval}")
+        return base + ".npy", base + ".ranges.json", base + ".events.json"
+
+    @staticmethod
+    def _read_json(path: str) -> list:
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json(path: str, data: list):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def get_covered_ranges(self, symbol: str, interval: str) -> list:
+        """Get the [start, end] epoch ranges already held for a symbol"""
+        return self._read_json(self._paths(symbol, interval)[1])
+
+    def get_known_events(self, symbol: str, interval: str) -> set:
+        """Get the split/dividend event times the stored bars already reflect"""
+        return set(self._read_json(self._paths(symbol, interval)[2]))
+
+    def clear(self, symbol: str, interval: str):
+        """Drop a symbol's stored bars and covered ranges (the known events are kept)"""
+        bars_path, ranges_path, _ = self._paths(symbol, interval)
+        for path in (bars_path, ranges_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def read(self, symbol: str, interval: str, start: int, end: int) -> np.ndarray:
+        """
+        Read stored bars in [start, end) without fetching
+
+        Returns:
+            np.ndarray: Memory-mapped BAR_DTYPE slice (empty if nothing is stored)
+        """
+        bars_path = self._paths(symbol, interval)[0]
+        if not os.path.exists(bars_path):
+            return np.zeros(0, dtype=BAR_DTYPE)
+        bars = np.load(bars_path, mmap_mode="r")
+        timestamps = bars["timestamp"]
+        lo = np.searchsorted(timestamps, start, side="left")
+        hi = np.searchsorted(timestamps, end, side="left")
+        return bars[lo:hi]
+
+    def write(self, symbol: str, interval: str, new_bars: np.ndarray, fetched_ranges: list, covered_ranges: list,
+              event_times: set = None):
+        """
+        Merge fetched bars into the stored array
+
+        Args:
+            symbol: Ticker symbol
+            interval: Bar interval
+            new_bars: Fetched BAR_DTYPE bars
+            fetched_ranges: Ranges that were downloaded - stored bars inside them are replaced
+            covered_ranges: Ranges to mark as held (the fetched ranges without the unsettled tail)
+            event_times: Split/dividend event times seen in the downloads
+        """
+        bars_path, ranges_path, events_path = self._paths(symbol, interval)
+        if os.path.exists(bars_path):
+            stored = np.load(bars_path)
+            # Drop stored bars inside the refetched ranges, the new data replaces them
+            keep = np.ones(len(stored), dtype=bool)
+            for range_start, range_end in fetched_ranges:
+                keep &= (stored["timestamp"] < range_start) | (stored["timestamp"] >= range_end)
+            combined = np.concatenate([stored[keep], new_bars])
+        else:
+            combined = new_bars
+        combined = np.sort(combined, order="timestamp", kind="stable")
+        # Keep the last bar per timestamp (the newly fetched one)
+        if len(combined):
+            last = np.append(combined["timestamp"][1:] != combined["timestamp"][:-1], True)
+            combined = combined[last]
+
+        tmp_path = bars_path + ".tmp.npy"
+        np.save(tmp_path, combined)
+        os.replace(tmp_path, bars_path)
+
+        self._write_json(ranges_path, merge_ranges(self.get_covered_ranges(symbol, interval) + covered_ranges))
+        if event_times:
+            self._write_json(events_path, sorted(self.get_known_events(symbol, interval) | set(event_times)))
+
+    async def get_bars(self, symbol: str, interval: str, start: int, end: int, fetch_chart) -> np.ndarray:
+        """
+        Get bars in [start, end), downloading only the ranges that are not stored yet
+
+        Args:
+            symbol: Ticker symbol
+            interval: Bar interval (see INTERVAL_SECONDS)
+            start: Start epoch seconds
+            end: End epoch seconds (capped to now)
+            fetch_chart: async callable(symbol, period1, period2, interval) -> Yahoo chart response
+
+        Returns:
+            np.ndarray: Memory-mapped BAR_DTYPE slice
+        """
+        if interval not in INTERVAL_SECONDS:
+            raise ValueError(f"Unknown interval: {interval}")
+        end = min(end, int(time.time()))
+        # The latest bar is still forming, so the recent tail is never marked as covered
+        settled_until = int(time.time()) - INTERVAL_SECONDS[interval]
+
+        lock = self.locks.setdefault((symbol.upper(), interval), asyncio.Lock())
+        async with lock:
+            covered = self.get_covered_ranges(symbol, interval)
+            gaps = missing_ranges(covered, start, end)
+            if gaps:
+                responses = await asyncio.gather(*(fetch_chart(symbol, gap_start, gap_end, interval) for gap_start, gap_end in gaps))
+                event_times = set().union(*(chart_response_event_times(response) for response in responses))
+                new_events = event_times - self.get_known_events(symbol, interval)
+                if covered and any(event_time > covered[0][0] for event_time in new_events):
+                    # Stored bars before the event were adjusted without it - refetch the whole range
+                    logger.info(f"📈 Split/dividend for {symbol}, dropping stored {interval} bars")
+                    self.clear(symbol, interval)
+                    gaps = [[start, end]]
+                    responses = [await fetch_chart(symbol, start, end, interval)]
+                    event_times |= chart_response_event_times(responses[0])
+                fetched_bars = []
+                fetched_ranges = []
+                covered_ranges = []
+                for (gap_start, gap_end), response in zip(gaps, responses):
+                    bars = chart_response_to_bars(response)
+                    if bars is None:
+                        logger.warning(f"⚠️ No chart data for {symbol} {interval} [{gap_start}, {gap_end})")
+                        continue
+                    fetched_bars.append(bars[(bars["timestamp"] >= gap_start) & (bars["timestamp"] < gap_end)])
+                    fetched_ranges.append([gap_start, gap_end])
+                    if min(gap_end, settled_until) > gap_start:
+                        covered_ranges.append([gap_start, min(gap_end, settled_until)])
+                if fetched_bars:
+                    self.write(symbol, interval, np.concatenate(fetched_bars), fetched_ranges, covered_ranges, event_times)
+                    logger.debug(f"📈 Stored {sum(len(b) for b in fetched_bars)} {interval} bars of {symbol} from {len(gaps)} gap(s)")
+        return self.read(symbol, interval, start, end)
+
+
+# Global chart store instance
+_chart_store = None
+
+
+def get_chart_store() -> ChartStore:
+    """
+    Get or create the global chart store instance
+
+    Returns:
+        ChartStore: Global chart store instance
+    """
+    global _chart_store
+    if _chart_store is None:
+        _chart_store = ChartStore()
+    return _chart_store
@@ -0,0 +1,242 @@
+"""
+Quote Cache - TTL cache in front of the Yahoo quote endpoints
+
+Quotes are cached per symbol and quoteSummary data per (symbol, module), each with
+its own TTL. Concurrent get_quote calls are merged into one request per batch window,
+and identical in-flight quoteSummary requests are shared (single-flight).
+"""
+
+import asyncio
+import time
+from utils.logger import logger
+from utils.single_flight import SingleFlight
+from config import Config
+
+QUOTE = "quote"
+QUOTE_SUMMARY = "quote_summary"
+_FAILED = object()  # Future result of a symbol whose batch request failed
+
+
+class TtlCache:
+    """Dict cache whose entries expire after their own TTL"""
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = {}  # key -> (expires_at, value)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self.entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key, value, ttl: float):
+        if len(self.entries) >= self.max_entries:
+            self._evict()
+        self.entries[key] = (time.monotonic() + ttl, value)
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self.entries.items() if expires_at <= now]
+        for key in expired:
+            del self.entries[key]
+        # Still full - drop the oldest inserted entries
+        while len(self.entries) >= self.max_entries:
+            del self.entries[next(iter(self.entries))]
+
+
+class QuoteCache:
+    def __init__(self, config=None):
+        """
+        Initialize QuoteCache
+
+        Args:
+            config: Cache settings (default: Config.QUOTE_CACHE)
+        """
+        self.config = config or Config.QUOTE_CACHE
+        self.cache = TtlCache(self.config.MAX_ENTRIES)
+        self.summary_flights = SingleFlight()
+        self.pending = {}  # symbol -> future, waiting for the next batch
+        self.inflight = {}  # symbol -> future, in a batch request
+        self.flush_task = None  # Task of the batch whose window is still open
+        self.batch_tasks = set()  # Running batch tasks (windows closed, requests in flight)
+        self.fetch_quote = None  # fetcher of the first caller in the batch window
+        self.stats = {QUOTE: {"hits": 0, "misses": 0, "coalesced": 0, "requests": 0},
+                      QUOTE_SUMMARY: {"hits": 0, "misses": 0, "coalesced": 0, "requests": 0}}
+
+    async def get_quote(self, symbols: list, fetch_quote) -> dict:
+        """
+        Get quotes, fetching only symbols that are not cached
+
+        Args:
+            symbols: Ticker symbols
+            fetch_quote: async callable(symbols) -> Yahoo quote response, used on a cache miss
+
+        Returns:
+            dict: Quote response in Yahoo's format, or None if fetching failed
+        """
+        stats = self.stats[QUOTE]
+        keys = [symbol.upper() for symbol in symbols]
+        results = {}
+        waiting = {}
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get((QUOTE, key))
+            if cached is not None:
+                stats["hits"] += 1
+                results[key] = cached
+            elif key in self.pending or key in self.inflight:
+                stats["coalesced"] += 1
+                waiting[key] = self.pending.get(key) or self.inflight[key]
+            else:
+                stats["misses"] += 1
+                waiting[key] = self.pending[key] = asyncio.get_running_loop().create_future()
+
+        if self.pending and (self.flush_task is None or self.flush_task.done()):
+            self.fetch_quote = fetch_quote
+            self.flush_task = asyncio.create_task(self._flush_after_window())
+            self.batch_tasks.add(self.flush_task)
+            self.flush_task.add_done_callback(self.batch_tasks.discard)
+
+        for key, future in waiting.items():
+            result = await asyncio.shield(future)
+            if result is _FAILED:
+                return None
+            if result is not None:
+                results[key] = result
+
+        # Keep the caller's order, symbols Yahoo doesn't know are left out like in the raw response
+        return {"quoteResponse": {"result": [results[key] for key in dict.fromkeys(keys) if key in results], "error": None}}
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.config.BATCH_WINDOW_MS / 1000)
+        fetch_quote = self.fetch_quote
+        batch, self.pending = self.pending, {}
+        # Window closed - symbols requested while this batch is in flight start the next batch
+        self.flush_task = None
+        self.inflight.update(batch)
+        symbols = list(batch)
+        try:
+            await asyncio.gather(*(
+                self._fetch_batch(fetch_quote, {key: batch[key] for key in symbols[i:i + self.config.MAX_BATCH_SYMBOLS]})
+                for i in range(0, len(symbols), self.config.MAX_BATCH_SYMBOLS)
+            ))
+        finally:
+            for key in symbols:
+                self.inflight.pop(key, None)
+
+    async def _fetch_batch(self, fetch_quote, batch: dict):
+        self.stats[QUOTE]["requests"] += 1
+        try:
+            response = await fetch_quote(list(batch))
+        except Exception as e:
+            logger.error(f"❌ Error fetching quote batch {list(batch)}: {e}")
+            response = None
+
+        items = (response or {}).get("quoteResponse", {}).get("result")
+        if items is None:
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(_FAILED)
+            return
+
+        by_symbol = {str(item.get("symbol", "")).upper(): item for item in items}
+        for key, future in batch.items():
+            item = by_symbol.get(key)
+            if item is not None:
+                self.cache.set((QUOTE, key), item, self.config.QUOTE_TTL)
+            if not future.done():
+                future.set_result(item)
+
+    async def get_quote_summary(self, symbol: str, modules: list, fetch_quote_summary) -> dict:
+        """
+        Get quoteSummary modules, fetching only the modules that are not cached
+
+        Args:
+            symbol: Ticker symbol
+            modules: quoteSummary module names
+            fetch_quote_summary: async callable(symbol, modules) -> Yahoo quoteSummary response
+
+        Returns:
+            dict: quoteSummary response in Yahoo's format, or None if fetching failed
+        """
+        stats = self.stats[QUOTE_SUMMARY]
+        key = symbol.upper()
+        result = {}
+        missing = []
+        for module in modules:
+            cached = self.cache.get((QUOTE_SUMMARY, key, module))
+            if cached is not None:
+                result[module] = cached
+            else:
+                missing.append(module)
+
+        if not missing:
+            stats["hits"] += 1
+        else:
+            flight_key = (key, tuple(sorted(missing)))
+            if self.summary_flights.is_inflight(flight_key):
+                stats["coalesced"] += 1
+            else:
+                stats["misses"] += 1
+            fetched = await self.summary_flights.do(flight_key, self._fetch_summary, fetch_quote_summary, symbol, missing)
+            if fetched is None:
+                return None
+            result.update(fetched)
+
+        return {"quoteSummary": {"result": [{module: result[module] for module in modules if module in result}], "error": None}}
+
+    async def _fetch_summary(self, fetch_quote_summary, symbol: str, modules: list):
+        self.stats[QUOTE_SUMMARY]["requests"] += 1
+        response = await fetch_quote_summary(symbol, modules)
+        results = (response or {}).get("quoteSummary", {}).get("result")
+        if not results:
+            return None
+
+        fetched = results[0]
+        for module in modules:
+            if module in fetched:
+                ttl = self.config.SUMMARY_MODULE_TTLS.get(module, self.config.SUMMARY_DEFAULT_TTL)
+                self.cache.set((QUOTE_SUMMARY, symbol.upper(), module), fetched[module], ttl)
+        return fetched
+
+    def get_stats(self) -> dict:
+        """
+        Get cache metrics per endpoint
+
+        Returns:
+            dict: endpoint -> hits, misses, coalesced, requests and hit_ratio
+                  (hits and coalesced calls both avoided a request)
+        """
+        stats = {}
+        for endpoint, counters in self.stats.items():
+            lookups = counters["hits"] + counters["misses"] + counters["coalesced"]
+            stats[endpoint] = dict(counters, hit_ratio=(counters["hits"] + counters["coalesced"]) / lookups if lookups else None)
+        return stats
+
+    def format_stats(self) -> str:
+        """Format the cache metrics for the dev digest"""
+        lines = []
+        for endpoint, stats in self.get_stats().items():
+            ratio = f"{stats['hit_ratio']:.0%}" if stats["hit_ratio"] is not None else "-"
+            lines.append(f"• `{endpoint}` hit ratio {ratio} ({stats['hits']} hits, {stats['coalesced']} coalesced, "
+                         f"{stats['misses']} misses, {stats['requests']} requests)")
+        return "\n".join(lines)
+
+
+# Global quote cache instance
+_quote_cache = None
+
+
+def get_quote_cache() -> QuoteCache:
+    """
+    Get or create the global quote cache instance
+
+    Returns:
+        QuoteCache: Global quote cache instance
+    """
+    global _quote_cache
+    if _quote_cache is None:
+        _quote_cache = QuoteCache()
+    return _quote_cache
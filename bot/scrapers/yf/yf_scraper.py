@@ -1,9 +1,31 @@
-import aiohttp
 import asyncio
 from scrapers.yf.yf_headers import headers
 from scrapers.yf.yf_params import QouteFields as qf, QuoteSummaryModules as qsm
+from scrapers.http_client import get_http_client
+from scrapers.yf.quote_cache import get_quote_cache
+from scrapers.yf.chart_store import get_chart_store
 from config import Config
-from utils import logger, safe_get
+from utils import logger, JsonSpec
+
+
+def _performance_overview_fmt(overview: dict) -> dict:
+    return {key: value.get("fmt") for key, value in overview.items()}
+
+
+QUOTE_SUMMARY_SPEC = JsonSpec({
+    "symbol": '["price"]["symbol"]',
+    "type": '["price"]["quoteType"]',
+    "company_name": '["price"]["longName"]',
+    "website": '["assetProfile"]["website"]',
+    "ir_website": '["assetProfile"]["irWebsite"]',
+    "industry": '["assetProfile"]["industry"]',
+    "sector": '["assetProfile"]["sector"]',
+    "business_summary": '["assetProfile"]["longBusinessSummary"]',
+    "earnings_date": '["calendarEvents"]["earnings"]["earningsDate"][0]["fmt"]',
+    "is_earning_estimated": '["calendarEvents"]["earnings"]["isEarningsDateEstimate"]',
+    "last_price": '["price"]["regularMarketPrice"]["fmt"]',
+    "pref_overview": ('["quoteUnadjustedPerformanceOverview"]["performanceOverview"]', _performance_overview_fmt),
+}, root='["quoteSummary"]["result"][0]')
 
 
 class YfScraper:
@@ -13,13 +35,12 @@ class YfScraper:
 
     async def make_request(self, url: str, params: dict = None):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, params=params, proxy=self.proxy) as response:
-                    if not response.ok:
-                        logger.error(f"Error: {response.status} {await response.text()}")
-                        return None
-                    else:
-                        return await response.json()
+            async with get_http_client().get(url, headers=self.headers, params=params, proxy=self.proxy) as response:
+                if not response.ok:
+                    logger.error(f"Error: {response.status} {await response.text()}")
+                    return None
+                else:
+                    return await response.json()
         except Exception as e:
             logger.error(f"Error making request to {url}: {e}")
             return None
@@ -89,7 +110,40 @@ class YfScraper:
         
         return await self.make_request(url, params)
 
+    async def _fetch_chart_bars(self, symbol: str, period1: int, period2: int, interval: str):
+        # Split and dividend events tell the chart store when stored bars were restated
+        return await self.get_chart_data(symbol, period1, period2, interval, include_pre_post=False, events="div|split")
+
+    async def get_history(self, symbol: str, start: int, end: int, interval: str = "1d"):
+        """
+        Get historical bars from the local chart store, downloading only missing ranges
+        
+        Args:
+            symbol: Stock symbol (e.g., 'GOOGL')
+            start: Start timestamp (epoch seconds)
+            end: End timestamp (epoch seconds)
+            interval: Time interval ('1d', '1wk', '1h', etc.)
+        
+        Returns:
+            np.ndarray: Memory-mapped bars with timestamp, open, high, low, close, adjclose and volume fields
+        """
+        return await get_chart_store().get_bars(symbol, interval, start, end, self._fetch_chart_bars)
+
+    async def get_closes(self, symbols: list[str], start: int, end: int, interval: str = "1d"):
+        """
+        Get close prices of several symbols from the local chart store (a stored alternative to get_spark)
+        
+        Returns:
+            dict: symbol -> (timestamps, closes) numpy arrays
+        """
+        histories = await asyncio.gather(*(self.get_history(symbol, start, end, interval) for symbol in symbols))
+        return {symbol: (bars["timestamp"], bars["close"]) for symbol, bars in zip(symbols, histories)}
+
     async def get_quote(self, symbols: list[str]):
+        """Get quotes for symbols (cached per symbol, concurrent calls are merged into one request)"""
+        return await get_quote_cache().get_quote(symbols, self._fetch_quote)
+
+    async def _fetch_quote(self, symbols: list[str]):
         url = "https://query1.finance.yahoo.com/v7/finance/quote"
 
         wanted_fields = [value for value in vars(qf).values() 
@@ -143,11 +197,15 @@ class YfScraper:
                 - pageViews: Page view metrics
                 - financialsTemplate: Financial data template
                 - quoteUnadjustedPerformanceOverview: Performance data
-        """
-        url = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
         
+        Modules are cached per symbol (see Config.QUOTE_CACHE.SUMMARY_MODULE_TTLS)
+        """
         if modules is None:
             modules = qsm.DEFAULT_MODULES
+        return await get_quote_cache().get_quote_summary(symbol, modules, self._fetch_quote_summary)
+
+    async def _fetch_quote_summary(self, symbol: str, modules: list[str]):
+        url = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
         
         params = {
             "formatted": "true",
@@ -164,30 +222,21 @@ class YfScraper:
   
     
     def parse_quote_summary(self, result):
-        data = {}
-        data["symbol"] = safe_get(result, '["quoteSummary"]["result"][0]["price"]["symbol"]')
-        data["type"] = safe_get(result, '["quoteSummary"]["result"][0]["price"]["quoteType"]')
-        data["company_name"] = safe_get(result, '["quoteSummary"]["result"][0]["price"]["longName"]')
-        data["website"] = safe_get(result, '["quoteSummary"]["result"][0]["assetProfile"]["website"]')
-        data["ir_website"] = safe_get(result, '["quoteSummary"]["result"][0]["assetProfile"]["irWebsite"]')
-        data["industry"] = safe_get(result, '["quoteSummary"]["result"][0]["assetProfile"]["industry"]')
-        data["sector"] = safe_get(result, '["quoteSummary"]["result"][0]["assetProfile"]["sector"]')
-        data["business_summary"] = safe_get(result, '["quoteSummary"]["result"][0]["assetProfile"]["longBusinessSummary"]')
-        data["earnings_date"] = safe_get(result, '["quoteSummary"]["result"][0]["calendarEvents"]["earnings"]["earningsDate"][0]["fmt"]')
-        data["is_earning_estimated"] = safe_get(result, '["quoteSummary"]["result"][0]["calendarEvents"]["earnings"]["isEarningsDateEstimate"]')
-        data["last_price"] = safe_get(result, '["quoteSummary"]["result"][0]["price"]["regularMarketPrice"]["fmt"]')
-        pref_overview = safe_get(result, '["quoteSummary"]["result"][0]["quoteUnadjustedPerformanceOverview"]["performanceOverview"]')
-        data["pref_overview"] = {}
-        for key, value in pref_overview.items():
-            data["pref_overview"][key] = value.get("fmt")
-        return data
+        return self.parse_quote_summaries([result])[0]
+
+    def parse_quote_summaries(self, results: list) -> list:
+        """Parse a batch of quote summary responses"""
+        parsed = QUOTE_SUMMARY_SPEC.extract_many(results)
+        for data in parsed:
+            data["pref_overview"] = data["pref_overview"] or {}
+        return parsed
 
 if __name__ == "__main__":
     import json
     from config import Config
     import os
     import pandas as pd
-    from utils import write_json_file, convert_iso_time_to_datetime, get_json_tree, safe_get, logger, write_text_file
+    from utils import write_json_file, convert_iso_time_to_datetime, get_json_tree, logger, write_text_file
     from report_generator.news_report import NewsReport
 
     yfr = YfScraper()
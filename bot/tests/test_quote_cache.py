@@ -0,0 +1,40 @@
+import asyncio
+from scrapers.yf.quote_cache import QuoteCache
+
+
+def test_symbol_requested_during_inflight_batch_is_fetched():
+    """A symbol requested while a batch request is in flight gets its own batch instead of waiting forever"""
+    requested = []
+
+    async def fetch_quote(symbols):
+        requested.append(list(symbols))
+        await asyncio.sleep(0.2)
+        return {"quoteResponse": {"result": [{"symbol": symbol} for symbol in symbols]}}
+
+    async def scenario():
+        cache = QuoteCache()
+        first = asyncio.create_task(cache.get_quote(["AAA"], fetch_quote))
+        await asyncio.sleep(0.1)  # AAA's window closed, its request is in flight
+        second = await asyncio.wait_for(cache.get_quote(["BBB"], fetch_quote), timeout=2)
+        return await first, second
+
+    first, second = asyncio.run(scenario())
+    assert requested == [["AAA"], ["BBB"]]
+    assert first["quoteResponse"]["result"] == [{"symbol": "AAA"}]
+    assert second["quoteResponse"]["result"] == [{"symbol": "BBB"}]
+
+
+def test_concurrent_calls_share_one_batch():
+    requested = []
+
+    async def fetch_quote(symbols):
+        requested.append(sorted(symbols))
+        return {"quoteResponse": {"result": [{"symbol": symbol} for symbol in symbols]}}
+
+    async def scenario():
+        cache = QuoteCache()
+        return await asyncio.gather(cache.get_quote(["AAA", "BBB"], fetch_quote), cache.get_quote(["BBB", "CCC"], fetch_quote))
+
+    first, second = asyncio.run(scenario())
+    assert requested == [["AAA", "BBB", "CCC"]]
+    assert [item["symbol"] for item in second["quoteResponse"]["result"]] == ["BBB", "CCC"]
@@ -28,6 +28,13 @@ from .html_convertor import html_to_pdf, convert_html_to_image
 
 from .get_json_tree import get_json_tree
 from .safe_get import safe_get
+from .json_spec import JsonSpec
+
+# Metrics and Rate Limiting
+from .stats import percentile
+from .rate_limiter import TokenBucket
+from .single_flight import SingleFlight
+from .concurrency_groups import ConcurrencyGroup, get_concurrency_group, format_concurrency_stats
 
 # Main functions and classes to expose
 __all__ = [
@@ -60,6 +67,15 @@ __all__ = [
     # JSON Tree
     'get_json_tree',
     'safe_get',
+    'JsonSpec',
+    
+    # Metrics and Rate Limiting
+    'percentile',
+    'TokenBucket',
+    'SingleFlight',
+    'ConcurrencyGroup',
+    'get_concurrency_group',
+    'format_concurrency_stats',
 ]
 
 
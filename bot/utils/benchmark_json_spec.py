@@ -0,0 +1,97 @@
+"""
+Benchmark - safe_get path strings vs compiled JsonSpec extraction
+
+Extracts the same fields from quote summaries, quote lists and CNBC asset maps with
+per-field safe_get calls and with a JsonSpec, checks that both give the same result and
+prints timings.
+
+Run from the bot directory:
+    python -m utils.benchmark_json_spec
+"""
+
+import time
+from utils import safe_get
+from utils.json_spec import JsonSpec
+from scrapers.cnbc.cnbc_scraper import extract_s_data_dict_from_html, get_all_modules
+
+ROUNDS = 200
+QUOTE_SUMMARY_ROOT = '["quoteSummary"]["result"][0]'
+QUOTE_SUMMARY_FIELDS = {
+    "symbol": '["price"]["symbol"]',
+    "type": '["price"]["quoteType"]',
+    "company_name": '["price"]["longName"]',
+    "website": '["assetProfile"]["website"]',
+    "ir_website": '["assetProfile"]["irWebsite"]',
+    "industry": '["assetProfile"]["industry"]',
+    "sector": '["assetProfile"]["sector"]',
+    "business_summary": '["assetProfile"]["longBusinessSummary"]',
+    "earnings_date": '["calendarEvents"]["earnings"]["earningsDate"][0]["fmt"]',
+    "is_earning_estimated": '["calendarEvents"]["earnings"]["isEarningsDateEstimate"]',
+    "last_price": '["price"]["regularMarketPrice"]["fmt"]',
+    "pref_overview": '["quoteUnadjustedPerformanceOverview"]["performanceOverview"]',
+}
+QUOTE_FIELDS = {
+    "ticker": '["symbol"]',
+    "price": '["regularMarketPrice"]["fmt"]',
+    "abs_change": '["regularMarketChange"]["fmt"]',
+    "percent_change": '["regularMarketChangePercent"]["fmt"]',
+    "change": '["regularMarketChange"]["raw"]',
+}
+ASSET_FIELDS = {name: f'["{name}"]' for name in ("id", "title", "url", "datePublished", "description")}
+
+
+def make_quote_summaries(count: int) -> list:
+    summaries = []
+    for i in range(count):
+        result = {
+            "price": {"symbol": f"SYM{i}", "quoteType": "EQUITY", "longName": f"Company {i}", "regularMarketPrice": {"raw": 10.0 + i, "fmt": f"{10.0 + i:.2f}"}},
+            "calendarEvents": {"earnings": {"earningsDate": [{"raw": 1760000000, "fmt": "2026-10-28"}], "isEarningsDateEstimate": i % 2 == 0}},
+            "quoteUnadjustedPerformanceOverview": {"performanceOverview": {"ytdReturnPct": {"raw": 0.1, "fmt": "10.00%"}}},
+        }
+        if i % 3:  # Funds and indexes have no asset profile
+            result["assetProfile"] = {"website": f"https://c{i}.com", "industry": "Software", "sector": "Technology", "longBusinessSummary": "x" * 500}
+        summaries.append({"quoteSummary": {"result": [result], "error": None}})
+    return summaries
+
+
+def make_quotes(count: int) -> list:
+    return [{
+        "symbol": f"SYM{i}",
+        "regularMarketPrice": {"raw": 10.0 + i, "fmt": f"{10.0 + i:.2f}"},
+        "regularMarketChange": {"raw": 0.5 - i % 2, "fmt": f"{0.5 - i % 2:.2f}"},
+        "regularMarketChangePercent": {"raw": 1.2, "fmt": "1.20%"},
+    } for i in range(count)]
+
+
+def with_safe_get(documents: list, fields: dict, root: str = "") -> list:
+    return [{name: safe_get(document, root + path) for name, path in fields.items()} for document in documents]
+
+
+def time_rounds(func, rounds: int = ROUNDS) -> float:
+    """Average milliseconds per call"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+if __name__ == "__main__":
+    with open("scrapers/cnbc/fixtures/world_page.html", encoding="utf-8") as f:
+        modules = get_all_modules(extract_s_data_dict_from_html(f.read()))
+    assets = [asset for module in modules for asset in module["data"]["assets"]]
+
+    cases = [
+        ("quote summaries", make_quote_summaries(50), QUOTE_SUMMARY_FIELDS, QUOTE_SUMMARY_ROOT),
+        ("quote list", make_quotes(200), QUOTE_FIELDS, ""),
+        ("cnbc assets", assets, ASSET_FIELDS, ""),
+    ]
+    for case_name, documents, fields, root in cases:
+        spec = JsonSpec(fields, root=root)
+        expected = with_safe_get(documents, fields, root)
+        assert spec.extract_many(documents) == expected, f"JsonSpec output differs from safe_get for {case_name}"
+
+        safe_get_ms = time_rounds(lambda: with_safe_get(documents, fields, root))
+        spec_ms = time_rounds(lambda: spec.extract_many(documents))
+        print(f"{case_name}: {len(documents)} documents x {len(fields)} fields ({spec})")
+        print(f"  safe_get      {safe_get_ms:8.2f} ms")
+        print(f"  json spec     {spec_ms:8.2f} ms  ({safe_get_ms / spec_ms:.1f}x)")
@@ -0,0 +1,126 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from config import Config
+from .single_flight import SingleFlight
+from .stats import percentile
+
+
+class ConcurrencyGroup:
+    """
+    Named limit on concurrent calls to one shared resource (e.g. Investing, OpenAI).
+
+    Callers wait in FIFO order for a slot. Calls made with a key share the in-flight
+    result of an identical call instead of taking a slot of their own.
+    """
+
+    def __init__(self, name: str, limit: int, max_samples: int = 500):
+        """
+        Args:
+            name: Group name
+            limit: Calls allowed at the same time
+            max_samples: Recent wait times kept for the p95
+        """
+        self.name = name
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.flights = SingleFlight()
+        self.active = 0
+        self.waiting = 0  # Queue depth
+        self.max_waiting = 0
+        self.calls = 0
+        self.shared = 0  # Calls served by an identical in-flight call
+        self.wait_ms = deque(maxlen=max_samples)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the group's slots"""
+        started = time.perf_counter()
+        if self.semaphore.locked():
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+            try:
+                await self.semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        else:
+            await self.semaphore.acquire()
+        self.wait_ms.append((time.perf_counter() - started) * 1000)
+        self.active += 1
+        self.calls += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.semaphore.release()
+
+    async def _run_in_slot(self, func, *args, **kwargs):
+        async with self.slot():
+            return await func(*args, **kwargs)
+
+    async def run(self, func, *args, key=None, **kwargs):
+        """
+        Run `await func(*args, **kwargs)` in a slot
+
+        Args:
+            func: Async callable
+            key: Hashable key of identical calls - while one runs, the others await its result
+
+        Returns:
+            The result of the call (or of the identical in-flight call)
+        """
+        if key is None:
+            return await self._run_in_slot(func, *args, **kwargs)
+        if self.flights.is_inflight(key):
+            self.shared += 1
+        return await self.flights.do(key, self._run_in_slot, func, *args, **kwargs)
+
+    def to_dict(self) -> dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "calls": self.calls,
+            "shared": self.shared,
+            "wait_p95_ms": percentile(self.wait_ms, 95),
+        }
+
+
+# Global concurrency groups
+_groups = {}
+
+
+def get_concurrency_group(name: str) -> ConcurrencyGroup:
+    """
+    Get or create a named concurrency group
+
+    Args:
+        name: Group name, its limit comes from Config.CONCURRENCY_GROUPS.LIMITS (or DEFAULT_LIMIT)
+
+    Returns:
+        ConcurrencyGroup: The shared group instance
+    """
+    group = _groups.get(name)
+    if group is None:
+        limit = Config.CONCURRENCY_GROUPS.LIMITS.get(name, Config.CONCURRENCY_GROUPS.DEFAULT_LIMIT)
+        group = _groups[name] = ConcurrencyGroup(name, limit)
+    return group
+
+
+def get_concurrency_stats() -> dict:
+    """Get the metrics of every group (name -> limit, active, waiting, max_waiting, calls, shared, wait_p95_ms)"""
+    return {name: group.to_dict() for name, group in _groups.items()}
+
+
+def format_concurrency_stats() -> str:
+    """Format the group metrics for the dev digest and /scheduler stats"""
+    if not _groups:
+        return "No grouped calls yet"
+    lines = []
+    for name, stats in sorted(get_concurrency_stats().items()):
+        wait = f"{stats['wait_p95_ms']:.0f}ms" if stats["wait_p95_ms"] is not None else "-"
+        lines.append(f"• `{name}` {stats['active']}/{stats['limit']} active, {stats['waiting']} queued "
+                     f"(max {stats['max_waiting']}), {stats['calls']} calls, {stats['shared']} shared, wait p95 {wait}")
+    return "\n".join(lines)
@@ -0,0 +1,81 @@
+"""
+JSON Spec - Compiled field extraction from nested JSON documents
+
+A spec maps output names to safe_get-style paths ('["price"]["symbol"]'). The paths are
+parsed once and merged into a prefix tree, then flattened into a list of steps, so a
+prefix shared by several fields (e.g. '["quoteSummary"]["result"][0]') is resolved once
+per document. Missing keys, wrong types and out of range indexes give None, like safe_get.
+"""
+
+import re
+
+_PATH_TOKEN_PATTERN = re.compile(r'\["([^"]+)"\]|\[(-?\d+)\]')
+
+
+def parse_path(path: str) -> tuple:
+    """Parse a safe_get path into its keys (str) and list indexes (int)"""
+    return tuple(key if key else int(index) for key, index in _PATH_TOKEN_PATTERN.findall(path.strip()))
+
+
+class JsonSpec:
+    def __init__(self, fields: dict, root: str = ""):
+        """
+        Compile a field spec
+
+        Args:
+            fields: output name -> path, or (path, transform) where transform is applied to found (non-None) values
+            root: Path prepended to every field path
+        """
+        root_tokens = parse_path(root)
+        self.fields = list(fields)
+        self.transforms = []  # (name, transform)
+        trie = {}  # token -> [slot, children]
+        self.steps = []  # (parent slot, token, slot) in tree order, slot 0 is the document
+        outputs = []  # (name, slot)
+
+        for name, field in fields.items():
+            path, transform = field if isinstance(field, tuple) else (field, None)
+            if transform is not None:
+                self.transforms.append((name, transform))
+            node_children, parent_slot = trie, 0
+            for token in root_tokens + parse_path(path):
+                if token not in node_children:
+                    node_children[token] = [len(self.steps) + 1, {}]
+                    self.steps.append((parent_slot, token, len(self.steps) + 1))
+                parent_slot, node_children = node_children[token]
+            outputs.append((name, parent_slot))
+        self.outputs = outputs
+        self.slot_count = len(self.steps) + 1
+
+    def extract(self, document) -> dict:
+        """
+        Extract all fields of one document
+
+        Returns:
+            dict: output name -> value (None when the path is missing)
+        """
+        values = [None] * self.slot_count
+        values[0] = document
+        for parent, token, slot in self.steps:
+            current = values[parent]
+            if current is None:
+                continue
+            if type(token) is int:
+                if isinstance(current, list) and -len(current) <= token < len(current):
+                    values[slot] = current[token]
+            elif isinstance(current, dict):
+                values[slot] = current.get(token)
+
+        result = {name: values[slot] for name, slot in self.outputs}
+        for name, transform in self.transforms:
+            if result[name] is not None:
+                result[name] = transform(result[name])
+        return result
+
+    def extract_many(self, documents) -> list:
+        """Extract the fields of every document in a batch"""
+        extract = self.extract
+        return [extract(document) for document in documents or []]
+
+    def __repr__(self):
+        return f"JsonSpec({len(self.fields)} fields, {len(self.steps)} steps)"
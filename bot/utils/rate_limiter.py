@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket - allows `capacity` acquisitions per `period` seconds.
+
+    Tokens refill continuously. `pause()` blocks all acquisitions for a while,
+    e.g. after a 429 response with a retry-after value.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        """
+        Args:
+            capacity: Maximum burst size (tokens)
+            period: Seconds to refill a full bucket
+        """
+        self.capacity = capacity
+        self.rate = capacity / period  # Tokens per second
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = max(now, self.updated_at)
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Block acquisitions for the given number of seconds (one request is allowed right after)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        # The window resets when the pause ends, so refilling starts from there
+        self.tokens = 1
+        self.updated_at = self.paused_until
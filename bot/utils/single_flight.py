@@ -0,0 +1,37 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical async calls.
+
+    While a call for a key is in flight, later callers with the same key wait for
+    its result instead of starting their own call.
+    """
+
+    def __init__(self):
+        self.inflight = {}  # key -> asyncio.Future
+
+    def is_inflight(self, key) -> bool:
+        return key in self.inflight
+
+    async def do(self, key, func, *args, **kwargs):
+        """
+        Run `await func(*args, **kwargs)` once per key at a time
+
+        Args:
+            key: Hashable key identifying identical calls
+            func: Async callable
+
+        Returns:
+            The result of the (shared) call - exceptions are raised to every waiter
+        """
+        future = self.inflight.get(key)
+        if future is not None:
+            # shield: a cancelled waiter must not cancel the call for everyone else
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(func(*args, **kwargs))
+        self.inflight[key] = future
+        future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        return await asyncio.shield(future)
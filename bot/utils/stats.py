@@ -0,0 +1,24 @@
+import math
+
+
+def percentile(values, pct: float):
+    """
+    Get a percentile of a list of numbers using linear interpolation.
+
+    Args:
+        values: Iterable of numbers (does not need to be sorted)
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or None if values is empty
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return None
+
+    rank = (len(ordered) - 1) * (pct / 100)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[int(rank)]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
@@ -1,7 +1,7 @@
 from dateutil import parser
 import pytz
 from config import Config
-from datetime import datetime, timedelta
+from datetime import datetime
 import pandas as pd
 
 
@@ -28,12 +28,16 @@ def get_time_delta_for_date(date: str, target_tz: str, source_tz: str):
     }
 
 def get_time_deltas_for_date_range(start_date: str, end_date: str, target_tz: str, source_tz: str):
-    """returns dataframe with date and delta_hours"""
-    results = []
-    while start_date < end_date:
-        results.append(get_time_delta_for_date(start_date, target_tz, source_tz))
-        start_date = (datetime.strptime(start_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
-    return pd.DataFrame(results, columns=['date', 'delta_hours']).sort_values(by='date')
+    """returns dataframe with date and delta_hours (end_date excluded), computed for all days at once"""
+    noons = pd.date_range(start_date, end_date, freq="D", inclusive="left") + pd.Timedelta(hours=12)
+
+    def utc_offset_hours(tz: str):
+        # Noon is never inside a DST transition, so localizing is unambiguous
+        utc_noons = noons.tz_localize(tz).tz_convert("UTC").tz_localize(None)
+        return ((noons - utc_noons) / pd.Timedelta(hours=1)).to_numpy()
+
+    delta_hours = utc_offset_hours(target_tz) - utc_offset_hours(source_tz)
+    return pd.DataFrame({'date': noons.strftime('%Y-%m-%d'), 'delta_hours': delta_hours})
 
 
 def convert_iso_time_to_datetime(timestamp_str, timezone: str) -> datetime: